@@ -0,0 +1,42 @@
+"""Add jobs.search_vector full-text index
+
+Revision ID: 3f1c9a7e2b04
+Revises: 87c34fc946a3
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7e2b04'
+down_revision: Union[str, Sequence[str], None] = '87c34fc946a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(JOB_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_jobs_search_vector', 'jobs', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_search_vector', table_name='jobs', postgresql_using='gin')
+    op.drop_column('jobs', 'search_vector')
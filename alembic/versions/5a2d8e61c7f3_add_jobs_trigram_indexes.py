@@ -0,0 +1,33 @@
+"""Add trigram indexes on jobs.company and jobs.location
+
+Revision ID: 5a2d8e61c7f3
+Revises: 3f1c9a7e2b04
+Create Date: 2026-10-16 10:03:17.524816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a2d8e61c7f3'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7e2b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_jobs_company_trgm', 'jobs', ['company'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'company': 'gin_trgm_ops'})
+    op.create_index('ix_jobs_location_trgm', 'jobs', ['location'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'location': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_location_trgm', table_name='jobs', postgresql_using='gin')
+    op.drop_index('ix_jobs_company_trgm', table_name='jobs', postgresql_using='gin')
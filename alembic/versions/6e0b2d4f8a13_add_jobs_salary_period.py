@@ -0,0 +1,32 @@
+"""Add salary_period to jobs and jobs_archive
+
+Revision ID: 6e0b2d4f8a13
+Revises: a1c6e3f8d927
+Create Date: 2026-10-17 14:26:03.518240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e0b2d4f8a13'
+down_revision: Union[str, Sequence[str], None] = 'a1c6e3f8d927'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The period of existing rows wasn't kept, they stay NULL (inferred from the amounts)
+    # and get it back when the listing is imported again
+    op.add_column('jobs', sa.Column('salary_period', sa.String(), nullable=True))
+    op.add_column('jobs_archive', sa.Column('salary_period', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('jobs_archive', 'salary_period')
+    op.drop_column('jobs', 'salary_period')
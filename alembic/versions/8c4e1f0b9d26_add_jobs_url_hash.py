@@ -0,0 +1,165 @@
+"""Add jobs.url_hash for canonical URL duplicate detection
+
+Revision ID: 8c4e1f0b9d26
+Revises: 5a2d8e61c7f3
+Create Date: 2026-10-16 11:20:05.907413
+
+"""
+from typing import Callable, Dict, Optional, Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import hashlib
+import logging
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e1f0b9d26'
+down_revision: Union[str, Sequence[str], None] = '5a2d8e61c7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Jobs read and updated per statement during the backfill
+BACKFILL_BATCH_SIZE = 5000
+
+# Snapshot of app.core.utils.canonicalize_url as of this revision. The backfill
+# must keep computing the same hashes if the app's rules change later.
+TRACKING_PARAMS = {
+    "ref", "refid", "referrer", "trk", "trackingid",
+    "fbclid", "gclid", "msclkid", "mc_cid", "mc_eid",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+_LINKEDIN_JOB_ID = re.compile(r"(\d+)/?$")
+_SEEK_JOB_PATH = re.compile(r"^/job/(\d+)")
+
+
+def _canonical_seek(host: str, path: str, query: Dict[str, str]) -> Optional[str]:
+    match = _SEEK_JOB_PATH.match(path)
+    job_id = match.group(1) if match else query.get("jobid")
+    if job_id:
+        return f"https://{host}/job/{job_id}"
+    return None
+
+
+def _canonical_jora(host: str, path: str, query: Dict[str, str]) -> Optional[str]:
+    if path.startswith("/job/"):
+        return f"https://{host}{path.rstrip('/')}"
+    return None
+
+
+def _canonical_linkedin(host: str, path: str, query: Dict[str, str]) -> Optional[str]:
+    job_id = query.get("currentjobid")
+    if not job_id and path.startswith("/jobs/view/"):
+        match = _LINKEDIN_JOB_ID.search(path)
+        job_id = match.group(1) if match else None
+    if job_id:
+        return f"https://linkedin.com/jobs/view/{job_id}"
+    return None
+
+
+SOURCE_URL_RULES: Dict[str, Callable[[str, str, Dict[str, str]], Optional[str]]] = {
+    "seek.com.au": _canonical_seek,
+    "seek.co.nz": _canonical_seek,
+    "jora.com": _canonical_jora,
+    "linkedin.com": _canonical_linkedin,
+}
+
+
+def canonicalize_url(url: str) -> str:
+    url = url.strip()
+    if "://" not in url:
+        url = f"https://{url}"
+
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        # Out of range or non-numeric ports ("host:99999") are dropped instead of failing
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    path = parts.path or "/"
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    lowered = {key.lower(): value for key, value in params}
+
+    for suffix, rule in SOURCE_URL_RULES.items():
+        if host == suffix or host.endswith(f".{suffix}"):
+            canonical = rule(host, path, lowered)
+            if canonical:
+                return canonical
+            break
+
+    kept = sorted(
+        (key, value) for key, value in params
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return urlunsplit(("https", host, path, urlencode(kept), ""))
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+
+
+def backfill() -> None:
+    """
+    Hash the existing urls in id-ordered batches, one UPDATE ... FROM (VALUES ...) per batch.
+    Only the oldest job per canonical url keeps the hash, later duplicates stay
+    NULL so the unique index can be built.
+    """
+    if op.get_context().as_sql:
+        return  # Offline SQL generation can't read rows, run the upgrade online to backfill
+    conn = op.get_bind()
+    jobs = sa.table('jobs', sa.column('id', sa.Integer), sa.column('url', sa.String), sa.column('url_hash', sa.String))
+    seen = set()
+    duplicates = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(jobs.c.id, jobs.c.url)
+            .where(jobs.c.id > last_id, jobs.c.url.isnot(None))
+            .order_by(jobs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        hashes = []
+        for job_id, url in rows:
+            digest = url_hash(url)
+            if digest in seen:
+                duplicates += 1
+                logger.info(f"Job {job_id} duplicates an earlier job url, leaving url_hash empty")
+                continue
+            seen.add(digest)
+            hashes.append((job_id, digest))
+        if hashes:
+            batch = sa.values(sa.column('id', sa.Integer), sa.column('url_hash', sa.String), name='batch').data(hashes)
+            conn.execute(jobs.update().where(jobs.c.id == batch.c.id).values(url_hash=batch.c.url_hash))
+
+    logger.info(f"Backfilled url_hash for {len(seen)} jobs, {duplicates} duplicates left empty")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('url_hash', sa.String(length=64), nullable=True))
+    backfill()
+
+    op.create_index(op.f('ix_jobs_url_hash'), 'jobs', ['url_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_url_hash'), table_name='jobs')
+    op.drop_column('jobs', 'url_hash')
@@ -0,0 +1,46 @@
+"""Add description_hash to jobs and the processed_descriptions cache
+
+Revision ID: a1c6e3f8d927
+Revises: f3a8d5c17b42
+Create Date: 2026-10-17 09:12:37.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c6e3f8d927'
+down_revision: Union[str, Sequence[str], None] = 'f3a8d5c17b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('processed_descriptions',
+    sa.Column('description_hash', sa.String(length=64), nullable=False),
+    sa.Column('processor_version', sa.Integer(), nullable=False),
+    sa.Column('description_structured', sa.JSON(), nullable=True),
+    sa.Column('keywords', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('tech_stack', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('word_count', sa.Integer(), nullable=True),
+    sa.Column('line_count', sa.Integer(), nullable=True),
+    sa.Column('enriched_data', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('description_hash')
+    )
+    # Stored jobs only have the cleaned description, the raw text it was hashed from is gone,
+    # so existing rows stay NULL and are filled in when the listing is imported again
+    op.add_column('jobs', sa.Column('description_hash', sa.String(length=64), nullable=True))
+    op.add_column('jobs_archive', sa.Column('description_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('jobs_archive', 'description_hash')
+    op.drop_column('jobs', 'description_hash')
+    op.drop_table('processed_descriptions')
@@ -0,0 +1,37 @@
+"""Backfill created_at on jobs and jobs_archive and make it NOT NULL
+
+Revision ID: b7e4c9a2d5f0
+Revises: 6e0b2d4f8a13
+Create Date: 2026-10-17 16:02:44.871359
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c9a2d5f0'
+down_revision: Union[str, Sequence[str], None] = '6e0b2d4f8a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The job list pages on (created_at, id), a NULL created_at can't be put in a cursor.
+    # Rows without one count as created when they were last modified, at the latest now.
+    # The archive is filled too, restored jobs are inserted back into jobs.
+    for table in ('jobs', 'jobs_archive'):
+        op.execute(
+            f"UPDATE {table} SET created_at = coalesce(updated_at, posted_date, now() at time zone 'utc') "
+            "WHERE created_at IS NULL"
+        )
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('jobs_archive', 'jobs'):
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), nullable=True)
@@ -0,0 +1,41 @@
+"""Add composite indexes for hot application, fit score and job list paths
+
+Revision ID: c2d7a4f91e53
+Revises: 8c4e1f0b9d26
+Create Date: 2026-10-16 14:02:37.518226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d7a4f91e53'
+down_revision: Union[str, Sequence[str], None] = '8c4e1f0b9d26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_applications_job_id_applied_at', 'applications', ['job_id', sa.text('applied_at DESC')]),
+    ('ix_applications_status', 'applications', ['status']),
+    ('ix_fit_scores_job_id_resume_id', 'fit_scores', ['job_id', 'resume_id']),
+    ('ix_jobs_created_at_id', 'jobs', ['created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY avoids locking writes on live tables but can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
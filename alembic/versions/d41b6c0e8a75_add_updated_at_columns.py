@@ -0,0 +1,40 @@
+"""Add updated_at to jobs, applications and resumes for conditional GETs
+
+Revision ID: d41b6c0e8a75
+Revises: c2d7a4f91e53
+Create Date: 2026-10-16 15:48:12.204391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41b6c0e8a75'
+down_revision: Union[str, Sequence[str], None] = 'c2d7a4f91e53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('jobs', 'applications', 'resumes'):
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    # Existing rows count as last modified when they were created (or applied for)
+    op.execute("UPDATE jobs SET updated_at = coalesce(created_at, now() at time zone 'utc')")
+    op.execute("UPDATE resumes SET updated_at = coalesce(created_at, now() at time zone 'utc')")
+    op.execute("UPDATE applications SET updated_at = coalesce(applied_at, now() at time zone 'utc')")
+
+    op.create_index(op.f('ix_jobs_updated_at'), 'jobs', ['updated_at'], unique=False)
+    op.create_index(op.f('ix_applications_updated_at'), 'applications', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_applications_updated_at'), table_name='applications')
+    op.drop_index(op.f('ix_jobs_updated_at'), table_name='jobs')
+    for table in ('resumes', 'applications', 'jobs'):
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,56 @@
+"""Add jobs_archive cold tier for expired jobs
+
+Revision ID: e7f2a9c4b318
+Revises: d41b6c0e8a75
+Create Date: 2026-10-16 17:25:41.630915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f2a9c4b318'
+down_revision: Union[str, Sequence[str], None] = 'd41b6c0e8a75'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jobs_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('company', sa.String(), nullable=True),
+    sa.Column('location', sa.String(), nullable=True),
+    sa.Column('work_mode', sa.String(), nullable=True),
+    sa.Column('work_type', sa.String(), nullable=True),
+    sa.Column('experience_level', sa.String(), nullable=True),
+    sa.Column('category', sa.String(), nullable=True),
+    sa.Column('salary_min', sa.Integer(), nullable=True),
+    sa.Column('salary_max', sa.Integer(), nullable=True),
+    sa.Column('currency', sa.String(), nullable=True),
+    sa.Column('visa_sponsorship', sa.Boolean(), nullable=True),
+    sa.Column('url', sa.String(), nullable=True),
+    sa.Column('url_hash', sa.String(length=64), nullable=True),
+    sa.Column('source', sa.String(), nullable=True),
+    sa.Column('tech_stack', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('posted_date', sa.DateTime(), nullable=True),
+    sa.Column('method', sa.String(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_jobs_archive_url_hash'), 'jobs_archive', ['url_hash'], unique=True)
+    # Compress archived rows aggressively: TOAST kicks in above 256 bytes instead of ~2kB
+    op.execute("ALTER TABLE jobs_archive SET (toast_tuple_target = 256)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_archive_url_hash'), table_name='jobs_archive')
+    op.drop_table('jobs_archive')
@@ -0,0 +1,140 @@
+"""Add annualized AUD salary columns and a GiST-indexed salary range to jobs
+
+Revision ID: f3a8d5c17b42
+Revises: e7f2a9c4b318
+Create Date: 2026-10-16 23:04:51.638107
+
+"""
+from typing import Dict, Optional, Sequence, Union
+import logging
+import os
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d5c17b42'
+down_revision: Union[str, Sequence[str], None] = 'e7f2a9c4b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SALARY_RANGE_SQL = (
+    "CASE WHEN salary_min_aud IS NULL AND salary_max_aud IS NULL THEN NULL "
+    "ELSE int4range(least(salary_min_aud, salary_max_aud), greatest(salary_min_aud, salary_max_aud), '[]') END"
+)
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Jobs read and updated per statement during the backfill
+BACKFILL_BATCH_SIZE = 5000
+
+# Snapshot of app.core.salary.normalize_salary as of this revision, so the
+# backfill keeps computing the same bands if the app's rules change later.
+# Rates read the same environment overrides as app.core.config.
+SALARY_AUD_RATES = {
+    "AUD": 1.0,
+    "USD": float(os.getenv("SALARY_RATE_USD", 1.52)),
+    "EUR": float(os.getenv("SALARY_RATE_EUR", 1.65)),
+    "GBP": float(os.getenv("SALARY_RATE_GBP", 1.95)),
+    "NZD": float(os.getenv("SALARY_RATE_NZD", 0.91)),
+    "SGD": float(os.getenv("SALARY_RATE_SGD", 1.15)),
+    "CAD": float(os.getenv("SALARY_RATE_CAD", 1.1)),
+}
+PERIOD_MULTIPLIERS = {"hour": 38 * 52, "day": 230, "week": 52, "month": 12, "year": 1}
+
+
+def infer_salary_period(amount: int) -> str:
+    if amount <= 300:
+        return "hour"
+    if amount <= 3000:
+        return "day"
+    return "year"
+
+
+def annualize(amount: Optional[int], period: Optional[str] = None) -> Optional[int]:
+    if amount is None or amount <= 0:
+        return None
+    period = period if period in PERIOD_MULTIPLIERS else infer_salary_period(amount)
+    return amount * PERIOD_MULTIPLIERS[period]
+
+
+def normalize_salary(salary_min: Optional[int], salary_max: Optional[int], currency: Optional[str]) -> Dict[str, Optional[int]]:
+    rate = SALARY_AUD_RATES.get((currency or "AUD").upper())
+    if rate is None:
+        return {"salary_min_aud": None, "salary_max_aud": None}
+    reference = salary_max or salary_min
+    period = infer_salary_period(reference) if reference and reference > 0 else None
+    low, high = annualize(salary_min, period), annualize(salary_max, period)
+    if low is not None and high is not None and low > high:
+        low, high = high, low
+    return {
+        "salary_min_aud": round(low * rate) if low is not None else None,
+        "salary_max_aud": round(high * rate) if high is not None else None,
+    }
+
+
+def backfill(table: str) -> None:
+    """Normalize the salaries already stored in id-ordered batches, one UPDATE ... FROM (VALUES ...) per batch."""
+    if op.get_context().as_sql:
+        return  # Offline SQL generation can't read rows, run the upgrade online to backfill
+    bind = op.get_bind()
+    rows_table = sa.table(table, sa.column('id', sa.Integer), sa.column('salary_min', sa.Integer),
+                          sa.column('salary_max', sa.Integer), sa.column('currency', sa.String),
+                          sa.column('salary_min_aud', sa.Integer), sa.column('salary_max_aud', sa.Integer))
+    updated = 0
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(rows_table.c.id, rows_table.c.salary_min, rows_table.c.salary_max, rows_table.c.currency)
+            .where(rows_table.c.id > last_id,
+                   sa.or_(rows_table.c.salary_min.isnot(None), rows_table.c.salary_max.isnot(None)))
+            .order_by(rows_table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        bands = []
+        for row in rows:
+            band = normalize_salary(row.salary_min, row.salary_max, row.currency)
+            bands.append((row.id, band["salary_min_aud"], band["salary_max_aud"]))
+        batch = sa.values(sa.column('id', sa.Integer), sa.column('salary_min_aud', sa.Integer),
+                          sa.column('salary_max_aud', sa.Integer), name='batch').data(bands)
+        bind.execute(
+            rows_table.update().where(rows_table.c.id == batch.c.id)
+            # A VALUES column holding only NULLs is typed text, cast it back
+            .values(salary_min_aud=sa.cast(batch.c.salary_min_aud, sa.Integer),
+                    salary_max_aud=sa.cast(batch.c.salary_max_aud, sa.Integer))
+        )
+        updated += len(bands)
+
+    logger.info(f"Backfilled annual AUD salaries for {updated} rows in {table}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('jobs', 'jobs_archive'):
+        op.add_column(table, sa.Column('salary_min_aud', sa.Integer(), nullable=True))
+        op.add_column(table, sa.Column('salary_max_aud', sa.Integer(), nullable=True))
+        backfill(table)
+
+    # Added after the backfill so the table is rewritten once
+    op.add_column('jobs', sa.Column('salary_range_aud', postgresql.INT4RANGE(),
+                                    sa.Computed(SALARY_RANGE_SQL, persisted=True), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index('ix_jobs_salary_range_aud', 'jobs', ['salary_range_aud'], unique=False,
+                        postgresql_using='gist', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_jobs_salary_range_aud', table_name='jobs', postgresql_concurrently=True)
+    op.drop_column('jobs', 'salary_range_aud')
+    for table in ('jobs_archive', 'jobs'):
+        op.drop_column(table, 'salary_max_aud')
+        op.drop_column(table, 'salary_min_aud')
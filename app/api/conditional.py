@@ -0,0 +1,76 @@
+"""
+Conditional GET support (ETag / Last-Modified).
+
+Read endpoints compute validators from updated_at columns, usually with a
+cheap probe query, and answer If-None-Match / If-Modified-Since with a 304
+before loading or serializing the body.
+
+ETags are weak: the compression middleware serves the same representation as
+identity, gzip or brotli bytes under one tag, which a strong ETag must not do.
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+import hashlib
+
+from fastapi import Request, Response
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag from the values that identify a representation (kind, id, versions, query)."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+def latest(*timestamps: Optional[datetime]) -> Optional[datetime]:
+    """Most recent of the given timestamps, ignoring missing ones."""
+    present = [ts for ts in timestamps if ts is not None]
+    return max(present) if present else None
+
+def _http_date(value: datetime) -> str:
+    # Stored timestamps are naive UTC, see app.db.models.utcnow
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+def _validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag}
+    if last_modified:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+def not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> Optional[Response]:
+    """
+    Check the request's conditional headers against the current validators.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the representation
+        last_modified: Current modification time (naive UTC), if known
+
+    Returns:
+        A 304 response if the client's copy is current, otherwise None
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2),
+        # and uses the weak comparison: W/"x" and "x" match
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        fresh = "*" in tags or etag.removeprefix("W/") in tags
+    elif last_modified and request.headers.get("if-modified-since"):
+        try:
+            since = parsedate_to_datetime(request.headers["if-modified-since"])
+        except (TypeError, ValueError):
+            return None
+        fresh = last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    else:
+        return None
+
+    return Response(status_code=304, headers=_validator_headers(etag, last_modified)) if fresh else None
+
+def with_validators(result: Any, response: Response, etag: str, last_modified: Optional[datetime] = None) -> Any:
+    """
+    Attach ETag / Last-Modified to an endpoint result.
+    Works both for plain results (headers go on the injected response) and
+    for Response objects returned directly.
+    """
+    target = result if isinstance(result, Response) else response
+    target.headers.update(_validator_headers(etag, last_modified))
+    return result
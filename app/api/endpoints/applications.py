@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import delete, func, select
 from app.db.schemas import ApplicationBase, ApplicationCreate, ApplicationUpdate, ApplicationRead
-from app.db.models import Application, FitScore
+from app.db.models import Application, FitScore, Job, Resume
 from app.db.session import get_db
+from app.db.loading import loading_profile
+from app.db.projection import parse_fields, rows_to_dicts
+from app.core.cache import invalidate_applications
+from app.core.config import FAST_JSON_RESPONSES
+from app.api.responses import FastJSONResponse, dump_orm_list
+from app.api.conditional import latest, make_etag, not_modified, with_validators
 from datetime import datetime, timezone
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
@@ -25,19 +32,77 @@ class ApplicationUpdateResponse(BaseModel):
 
 router = APIRouter()
 
+def _with_job_and_resume(stmt):
+    """Join the job and resume an application read nests, for validator probes."""
+    return (
+        stmt.select_from(Application)
+        .outerjoin(Job, Application.job_id == Job.id)
+        .outerjoin(Resume, Application.resume_id == Resume.id)
+    )
+
 @router.get("/", response_model=list[ApplicationRead])
-def list_applications(db=Depends(get_db)):
-    """List all applications with job and resume details."""
-    applications = db.query(Application).all()
-    return applications
+def list_applications(request: Request, response: Response, fields: Optional[str] = None, db=Depends(get_db)):
+    """
+    List all applications with job and resume details.
+    With fields=id,status,job.title,... only those columns are selected;
+    job.* fields are read through a join and nested under "job".
+    Responds 304 to If-None-Match / If-Modified-Since when nothing listed has changed.
+    """
+    projection = None
+    if fields:
+        try:
+            projection = parse_fields(fields, Application, relations={"job": Job})
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    # Nested jobs and resumes are part of the list, so their versions feed the ETag too.
+    # Deleting a resume clears resume_id (ON DELETE SET NULL) without touching updated_at,
+    # only the number of linked resumes shows it.
+    probe = db.execute(_with_job_and_resume(select(
+        func.max(Application.updated_at), func.count(Application.id), func.max(Job.updated_at), func.max(Resume.updated_at),
+        func.count(Resume.id),
+    ))).one()
+    last_modified = latest(probe[0], probe[2], probe[3])
+    etag = make_etag("applications", *probe, request.query_params)
+    cached = not_modified(request, etag, last_modified)
+    if cached:
+        return cached
+
+    if not projection:
+        applications = db.query(Application).options(*loading_profile("application_read")).all()
+        result = FastJSONResponse(dump_orm_list(applications, ApplicationRead)) if FAST_JSON_RESPONSES else applications
+        return with_validators(result, response, etag, last_modified)
+
+    stmt = select(*[column for _, column in projection]).select_from(Application)
+    if any(key.startswith("job.") for key, _ in projection):
+        stmt = stmt.outerjoin(Job, Application.job_id == Job.id)
+    rows = db.execute(stmt.order_by(Application.id)).all()
+    result = FastJSONResponse(rows_to_dicts(rows, [key for key, _ in projection]))
+    return with_validators(result, response, etag, last_modified)
 
 @router.get("/{application_id}", response_model=ApplicationRead)
-def get_application(application_id: int, db=Depends(get_db)):
-    """Get a specific application by ID."""
-    application = db.query(Application).get(application_id)
+def get_application(application_id: int, request: Request, response: Response, db=Depends(get_db)):
+    """
+    Get a specific application by ID.
+    Responds 304 to If-None-Match / If-Modified-Since when the application,
+    its job and its resume are unchanged.
+    """
+    versions = db.execute(_with_job_and_resume(
+        select(Application.updated_at, Job.updated_at, Resume.updated_at)
+    ).where(Application.id == application_id)).first()
+    if not versions:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    last_modified = latest(*versions)
+    etag = make_etag("application", application_id, *versions)
+    cached = not_modified(request, etag, last_modified)
+    if cached:
+        return cached
+
+    application = db.get(Application, application_id, options=loading_profile("application_read"))
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
-    return application
+    return with_validators(application, response, etag, last_modified)
 
 @router.post("/", response_model=ApplicationRead, status_code=201)
 def create_application(application: ApplicationCreate, db=Depends(get_db)):
@@ -45,8 +110,8 @@ def create_application(application: ApplicationCreate, db=Depends(get_db)):
     db_application = Application(**application.model_dump())
     db.add(db_application)
     db.commit()
-    db.refresh(db_application)
-    return db_application
+    invalidate_applications([db_application.job_id])
+    return db.get(Application, db_application.id, options=loading_profile("application_read"), populate_existing=True)
 
 @router.put("/{application_id}", response_model=ApplicationUpdateResponse)
 def update_application(application_id: int, application: ApplicationUpdate, db=Depends(get_db)):
@@ -64,6 +129,7 @@ def update_application(application_id: int, application: ApplicationUpdate, db=D
     
     # Get the update data
     update_data = application.model_dump(exclude_unset=True)
+    old_job_id = db_application.job_id
     
     # Smart applied_at handling
     if "status" in update_data:
@@ -88,6 +154,7 @@ def update_application(application_id: int, application: ApplicationUpdate, db=D
         setattr(db_application, field, value)
     
     db.commit()
+    invalidate_applications([old_job_id, db_application.job_id])
     db.refresh(db_application)
     return db_application
 
@@ -96,22 +163,26 @@ def delete_application(application_id: int, db=Depends(get_db)):
     """
     Delete an application.
     This will also delete any associated fit scores.
+    Runs as one DELETE ... RETURNING that also counts the matching fit scores.
     """
-    db_application = db.query(Application).get(application_id)
-    if not db_application:
+    deleted = (
+        delete(Application).where(Application.id == application_id)
+        .returning(Application.job_id, Application.resume_id)
+        .cte("deleted")
+    )
+    fit_score_count = (
+        select(func.count()).select_from(FitScore)
+        .where(FitScore.job_id == deleted.c.job_id, FitScore.resume_id == deleted.c.resume_id)
+        .scalar_subquery()
+    )
+    row = db.execute(select(deleted.c.job_id, fit_score_count)).first()
+    db.commit()
+    if not row:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    # Log what will be deleted for debugging
-    fit_score_count = db.query(FitScore).filter(
-        FitScore.job_id == db_application.job_id,
-        FitScore.resume_id == db_application.resume_id
-    ).count()
-    
-    logger.info(f"Deleting application {application_id} with {fit_score_count} fit scores")
-    
-    # Delete the application (cascade will handle fit scores)
-    db.delete(db_application)
-    db.commit()
+    job_id, fit_score_count = row
+    invalidate_applications([job_id])
+    logger.info(f"Deleted application {application_id} with {fit_score_count} fit scores")
     
     return {"message": f"Application and {fit_score_count} fit scores deleted successfully"}
 
@@ -148,6 +219,7 @@ def update_application_status(application_id: int, status_update: ApplicationSta
         db_application.notes = status_update.notes
     
     db.commit()
+    invalidate_applications([db_application.job_id])
     db.refresh(db_application)
     return db_application
     
@@ -1,18 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.schemas import JobBase, JobCreate, JobUpdate, JobRead, ApplicationRead
-from app.db.models import Job, Application, FitScore
-from app.db.session import get_db
-from app.core.text_processor import process_job_description, parse_salary, parse_posted_date
+from app.db.models import Job, JobArchive, Application, ProcessedDescription
+from app.db.session import get_db, get_async_db, SessionLocal, AsyncSessionLocal
+from app.db.loading import loading_profile
+from app.db.projection import parse_fields, rows_to_dicts, selectable_columns
+from app.core.cache import (
+    cache, MISSING, job_key, job_url_key, latest_application_key, invalidate_jobs, invalidate_applications,
+    ainvalidate_jobs, ainvalidate_applications,
+)
+from app.core.config import cache_config, FAST_JSON_RESPONSES
+from app.api.responses import FastJSONResponse, dumps, dump_orm, dump_orm_list
+from app.api.conditional import make_etag, not_modified, with_validators
+from app.db.query_metrics import track_queries
+from app.core.utils import description_hash, url_hash
+from app.core.tech_taxonomy import normalize_tech_stack
+from app.services.job_search import build_facet_statement, build_search_statement, facet_counts
+from app.services.job_service import build_job_record, bulk_upsert_jobs, bulk_delete_jobs, delete_job_cascade
+from app.services.archival import restore_jobs_statement
+from app.services.description_cache import cached_processing, store_enrichment_statement, store_processing_statement
 from app.mcp.tools.enrich_job import EnrichJobInput
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime
 import asyncio
+import base64
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Maximum jobs accepted by one bulk import request
+JOB_BULK_IMPORT_MAX = 10000
+
+# Largest value a PostgreSQL integer (and int4range bound) can hold
+INT4_MAX = 2_147_483_647
+
+# Pagination settings for the job list endpoint
+JOB_PAGE_SIZE = 50
+JOB_PAGE_SIZE_MAX = 200
+JOB_STREAM_BATCH_SIZE = 500
+
 # New schema for Chrome extension integration
 class JobDataFromExtension(BaseModel):
     title: Optional[str] = None
@@ -44,14 +77,77 @@ class JobImportResponse(BaseModel):
     message: str
     processed_data: Dict[str, Any]
 
+class JobBulkImportRequest(BaseModel):
+    """Request model for importing many jobs at once (ETL backfills, scrapers)."""
+    jobs: List[JobDataFromExtension] = Field(..., max_length=JOB_BULK_IMPORT_MAX)
+
+class JobBulkImportResult(BaseModel):
+    """Outcome of a single row in a bulk import."""
+    index: int
+    status: str  # 'inserted', 'updated', 'skipped'
+    job_id: Optional[int] = None
+    error: Optional[str] = None
+
+class JobBulkImportResponse(BaseModel):
+    """Response model for bulk job import."""
+    inserted: int
+    updated: int
+    skipped: int
+    results: List[JobBulkImportResult]
+
+class JobBulkDeleteRequest(BaseModel):
+    """
+    Request model for deleting many jobs, e.g. pruning stale scraped listings.
+    Jobs must match every criterion given, at least one is required.
+    """
+    ids: Optional[List[int]] = Field(None, max_length=JOB_BULK_IMPORT_MAX)
+    source: Optional[str] = None
+    older_than: Optional[datetime] = None  # Jobs created before this time
+    batch_size: int = Field(500, ge=1, le=5000)
+
+class JobBulkDeleteResponse(BaseModel):
+    """Response model for bulk job delete."""
+    deleted: int
+    archived_deleted: int  # Of deleted, how many were archived jobs
+    applications_deleted: int
+    fit_scores_deleted: int
+    batches: int
+
 class JobSearchParams(BaseModel):
     keywords: Optional[str] = None
-    location: Optional[str] = None
+    company: Optional[str] = None  # Fuzzy matched, e.g. "Atlasian" finds "Atlassian"
+    location: Optional[str] = None  # Fuzzy matched, e.g. "Melb" finds "Melbourne VIC 3000"
     visa_sponsorship: Optional[bool] = None
     work_mode: Optional[str] = None
     work_type: Optional[str] = None  # Changed from job_type to work_type
     experience_level: Optional[str] = None
+    # Annual AUD band, matches jobs whose band overlaps it. Bounded to int4range values.
+    salary_min_aud: Optional[int] = Field(None, ge=0, le=INT4_MAX)
+    salary_max_aud: Optional[int] = Field(None, ge=0, le=INT4_MAX)
     limit: int = 50
+    fields: Optional[str] = None  # Sparse fieldset, e.g. "id,title,company"
+    facets: bool = False  # Also return per-value counts for the matching jobs
+
+    @model_validator(mode="after")
+    def _check_salary_band(self):
+        if self.salary_min_aud is not None and self.salary_max_aud is not None and self.salary_min_aud > self.salary_max_aud:
+            raise ValueError("salary_min_aud must not be greater than salary_max_aud")
+        return self
+
+class FacetCount(BaseModel):
+    value: Any = None
+    count: int
+
+class JobSearchResponse(BaseModel):
+    """Response model for a search with facets: results plus counts over all matching jobs."""
+    items: List[JobBase]
+    total: int
+    facets: Dict[str, List[FacetCount]]
+
+class JobListResponse(BaseModel):
+    """Response model for a page of jobs with a cursor to the next page."""
+    items: List[JobBase]
+    next_cursor: Optional[str] = None
 
 class JobUrlCheckResponse(BaseModel):
     """Response model for job URL check endpoint."""
@@ -59,12 +155,172 @@ class JobUrlCheckResponse(BaseModel):
     job: Optional[Dict[str, Any]] = None
     application: Optional[Dict[str, Any]] = None
 
-@router.get("/", response_model=list[JobBase])
-def list_jobs(db=Depends(get_db)):
-    return db.query(Job).all()
+def _encode_cursor(created_at: datetime, job_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque token."""
+    raw = f"{created_at.isoformat()}|{job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor token back into its (created_at, id) keyset position."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, job_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _keyset_query(db, position: Optional[tuple[datetime, int]] = None):
+    """Jobs ordered newest first, starting strictly after the given keyset position."""
+    query = db.query(Job).options(*loading_profile("job_summary")).order_by(Job.created_at.desc(), Job.id.desc())
+    if position:
+        query = query.filter(tuple_(Job.created_at, Job.id) < position)
+    return query
+
+def _job_cache_entry(job) -> Dict[str, Any]:
+    """JSON-safe snapshot of a job's columns for the lookup cache, hot or archived."""
+    entry = jsonable_encoder({key: getattr(job, key) for key in selectable_columns(type(job))})
+    entry["archived"] = isinstance(job, JobArchive)
+    return entry
+
+def _application_cache_entry(application: Optional[Application]) -> Optional[Dict[str, Any]]:
+    """JSON-safe summary of an application for the lookup cache, None if there is none."""
+    if not application:
+        return None
+    return {
+        "id": application.id,
+        "status": application.status,
+        "notes": application.notes,
+        "applied_at": application.applied_at.isoformat() if application.applied_at else None
+    }
+
+async def _cached_job_id_for_url(db: AsyncSession, job_url_hash: str) -> Optional[int]:
+    """
+    Job id for a canonical URL hash, read through the cache and falling through to the archive.
+    Unknown URLs are cached too.
+    """
+    job_id = await cache.aget(job_url_key(job_url_hash))
+    if job_id is MISSING:
+        job = await db.scalar(select(Job).where(Job.url_hash == job_url_hash))
+        if not job:
+            job = await db.scalar(select(JobArchive).where(JobArchive.url_hash == job_url_hash))
+        job_id = job.id if job else None
+        await cache.aset(job_url_key(job_url_hash), job_id, ttl=None if job else cache_config["negative_ttl"])
+        if job:
+            await cache.aset(job_key(job.id), _job_cache_entry(job))
+    return job_id
+
+async def _cached_job(db: AsyncSession, job_id: int) -> Optional[Dict[str, Any]]:
+    """Cached job entry by id, loaded from the database (hot, then archived) on a miss."""
+    entry = await cache.aget(job_key(job_id))
+    if entry is MISSING:
+        job = await db.get(Job, job_id) or await db.get(JobArchive, job_id)
+        if not job:
+            return None
+        entry = _job_cache_entry(job)
+        await cache.aset(job_key(job_id), entry)
+    return entry
+
+async def _cached_latest_application(db: AsyncSession, job_id: int) -> Optional[Dict[str, Any]]:
+    """Most recent application for a job, read through the cache."""
+    entry = await cache.aget(latest_application_key(job_id))
+    if entry is MISSING:
+        application = await db.scalar(
+            select(Application)
+            .where(Application.job_id == job_id)
+            .order_by(Application.applied_at.desc())
+            .limit(1)
+        )
+        entry = _application_cache_entry(application)
+        await cache.aset(latest_application_key(job_id), entry)
+    return entry
+
+def _job_list_validators(db, request: Request) -> tuple[str, Optional[datetime]]:
+    """ETag and Last-Modified for the job list from a max(updated_at)/count probe."""
+    last_modified, total = db.execute(select(func.max(Job.updated_at), func.count(Job.id))).one()
+    return make_etag("jobs", last_modified, total, request.query_params), last_modified
+
+def _job_projection(fields: str) -> List[tuple]:
+    """Resolve a fields= value against Job columns, 400 on unknown fields."""
+    try:
+        return parse_fields(fields, Job)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _stream_jobs(position: Optional[tuple[datetime, int]], projection: Optional[List[tuple]] = None):
+    """
+    Yield jobs as NDJSON lines from a server-side cursor.
+    Uses its own session so the stream outlives the request dependency.
+    With a projection only those columns are selected and emitted.
+    """
+    db = SessionLocal()
+    try:
+        query = _keyset_query(db, position)
+        if projection:
+            keys = [key for key, _ in projection]
+            rows = query.with_entities(*[column for _, column in projection]).yield_per(JOB_STREAM_BATCH_SIZE)
+            for item in rows_to_dicts(rows, keys):
+                yield dumps(item) + b"\n"
+            return
+        for job in query.yield_per(JOB_STREAM_BATCH_SIZE):
+            if FAST_JSON_RESPONSES:
+                yield dumps(dump_orm(job, JobBase)) + b"\n"
+            else:
+                yield JobBase.model_validate(job, from_attributes=True).model_dump_json() + "\n"
+    finally:
+        db.close()
+
+@router.get("/", response_model=JobListResponse)
+def list_jobs(
+    request: Request,
+    response: Response,
+    limit: int = Query(JOB_PAGE_SIZE, ge=1, le=JOB_PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    fields: Optional[str] = None,
+    db=Depends(get_db),
+):
+    """
+    List jobs newest first using keyset pagination on (created_at, id).
+    Pass the returned next_cursor to fetch the following page.
+    With stream=true, every job after the cursor is streamed as NDJSON instead.
+    With fields=id,title,... only those columns are selected and returned.
+    Responds 304 to If-None-Match / If-Modified-Since when no job has changed.
+    """
+    position = _decode_cursor(cursor) if cursor else None
+    projection = _job_projection(fields) if fields else None
+
+    etag, last_modified = _job_list_validators(db, request)
+    cached = not_modified(request, etag, last_modified)
+    if cached:
+        return cached
+
+    if stream:
+        stream_response = StreamingResponse(_stream_jobs(position, projection), media_type="application/x-ndjson")
+        return with_validators(stream_response, response, etag, last_modified)
+
+    query = _keyset_query(db, position)
+    if projection:
+        # Keyset columns ride along at the end of each row to build the cursor
+        query = query.with_entities(*[column for _, column in projection], Job.created_at, Job.id)
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = _encode_cursor(last[-2], last[-1]) if projection else _encode_cursor(last.created_at, last.id)
+
+    if projection:
+        items = rows_to_dicts(rows[:limit], [key for key, _ in projection])
+        result = FastJSONResponse({"items": items, "next_cursor": next_cursor})
+    elif FAST_JSON_RESPONSES:
+        result = FastJSONResponse({"items": dump_orm_list(rows[:limit], JobBase), "next_cursor": next_cursor})
+    else:
+        result = {"items": rows[:limit], "next_cursor": next_cursor}
+    return with_validators(result, response, etag, last_modified)
 
 @router.get("/check-url", response_model=JobUrlCheckResponse)
-async def check_job_url(url: str, db=Depends(get_db)):
+async def check_job_url(url: str, db: AsyncSession = Depends(get_async_db)):
     """
     Check if a job URL already exists in the database.
     Returns job and application info if found, or null if not found.
@@ -75,37 +331,23 @@ async def check_job_url(url: str, db=Depends(get_db)):
         import urllib.parse
         decoded_url = urllib.parse.unquote(url)
         
-        # Check if job exists
-        job = db.query(Job).filter(Job.url == decoded_url).first()
+        # Check if job exists, matching on the canonical URL hash
+        job_id = await _cached_job_id_for_url(db, url_hash(decoded_url))
+        job = await _cached_job(db, job_id) if job_id else None
         
         if job:
             # Get the most recent application for this job
-            application = db.query(Application).filter(
-                Application.job_id == job.id
-            ).order_by(Application.applied_at.desc()).first()
+            application = await _cached_latest_application(db, job_id)
             
             return {
                 "exists": True,
                 "job": {
-                    "id": job.id,
-                    "title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "category": job.category,
-                    "work_mode": job.work_mode,
-                    "work_type": job.work_type,
-                    "experience_level": job.experience_level,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "url": job.url,
-                    "created_at": job.created_at.isoformat() if job.created_at else None
+                    key: job[key] for key in (
+                        "id", "title", "company", "location", "category", "work_mode", "work_type",
+                        "experience_level", "salary_min", "salary_max", "url", "created_at", "archived",
+                    )
                 },
-                "application": {
-                    "id": application.id if application else None,
-                    "status": application.status if application else None,
-                    "notes": application.notes if application else None,
-                    "applied_at": application.applied_at.isoformat() if application and application.applied_at else None
-                } if application else None
+                "application": application
             }
         else:
             return {
@@ -119,11 +361,22 @@ async def check_job_url(url: str, db=Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error checking job URL: {str(e)}")
 
 @router.get("/{job_id}", response_model=JobBase)
-def get_job(job_id: int, db=Depends(get_db)):
-    job =  db.query(Job).get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return job
+def get_job(job_id: int, request: Request, response: Response, db=Depends(get_db)):
+    """
+    Get a job by id, falling through to the archive for expired jobs.
+    Responds 304 to If-None-Match / If-Modified-Since when the job is unchanged.
+    """
+    job = cache.get(job_key(job_id))
+    if job is MISSING:
+        db_job = db.get(Job, job_id) or db.get(JobArchive, job_id)
+        if not db_job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        job = _job_cache_entry(db_job)
+        cache.set(job_key(job_id), job)
+
+    updated_at = datetime.fromisoformat(job["updated_at"]) if job.get("updated_at") else None
+    etag = make_etag("job", job_id, job.get("updated_at"))
+    return not_modified(request, etag, updated_at) or with_validators(job, response, etag, updated_at)
 
 @router.post("/", response_model=JobBase, status_code=201)
 def create_job(job: JobCreate, db=Depends(get_db)):
@@ -131,7 +384,13 @@ def create_job(job: JobCreate, db=Depends(get_db)):
     job_data['url'] = str(job_data['url'])  # Convert HttpUrl to string
     db_job = Job(**job_data)
     db.add(db_job)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A job with this URL already exists")
+    # Clears a cached "not found" for this URL
+    invalidate_jobs(url_hashes=[db_job.url_hash])
     db.refresh(db_job)
     return db_job
 
@@ -140,9 +399,15 @@ def update_job(job_id: int, job: JobUpdate, db=Depends(get_db)):
     db_job = db.query(Job).get(job_id)
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
+    old_url_hash = db_job.url_hash
     for field, value in job.model_dump(exclude_unset=True).items():
         setattr(db_job, field, value)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A job with this URL already exists")
+    invalidate_jobs([job_id], [old_url_hash, db_job.url_hash])
     db.refresh(db_job)
     return db_job
 
@@ -150,27 +415,51 @@ def update_job(job_id: int, job: JobUpdate, db=Depends(get_db)):
 def delete_job(job_id: int, db=Depends(get_db)):
     """
     Delete a job and all associated applications and fit scores.
-    This will cascade delete all related data.
+    Runs as one DELETE ... RETURNING, the database cascades to related rows.
     """
-    db_job = db.query(Job).get(job_id)
-    if not db_job:
+    counts = delete_job_cascade(db, job_id)
+    if counts is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Log what will be deleted for debugging
-    application_count = db.query(Application).filter(Application.job_id == job_id).count()
-    fit_score_count = db.query(FitScore).filter(FitScore.job_id == job_id).count()
-    
-    logger.info(f"Deleting job {job_id} with {application_count} applications and {fit_score_count} fit scores")
+    logger.info(f"Deleted job {job_id} with {counts['application_count']} applications and {counts['fit_score_count']} fit scores")
     
-    # Delete the job (cascade will handle the rest)
-    db.delete(db_job)
-    db.commit()
+    return {"message": f"Job and {counts['application_count']} applications deleted successfully"}
+
+@router.post("/bulk-delete", response_model=JobBulkDeleteResponse)
+def bulk_delete(payload: JobBulkDeleteRequest, db=Depends(get_db)):
+    """
+    Delete jobs by ids and/or by source and age, with their applications and fit scores.
+    Works in short batches that skip locked rows, so pruning doesn't block other writers.
+    """
+    try:
+        return bulk_delete_jobs(db, payload.ids, payload.source, payload.older_than, payload.batch_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def _add_application_to_existing_job(db: AsyncSession, job: Job, data: JobApplicationImport) -> JobImportResponse:
+    """Create the imported application against a job that is already stored."""
+    application = Application(
+        job_id=job.id,
+        status=data.application.status,
+        notes=data.application.notes
+    )
+    db.add(application)
+    await db.commit()
+    await ainvalidate_applications([job.id])
+    await db.refresh(application)
     
-    return {"message": f"Job and {application_count} applications deleted successfully"}
+    return JobImportResponse(
+        job_id=job.id,
+        application_id=application.id,
+        job_title=job.title,
+        company=job.company,
+        message="Job already existed, application created",
+        processed_data={}
+    )
 
 # New endpoints for Chrome extension integration
 @router.post("/import-from-extension", response_model=JobImportResponse, status_code=201)
-async def import_job_from_extension(data: JobApplicationImport, db=Depends(get_db)):
+async def import_job_from_extension(data: JobApplicationImport, db: AsyncSession = Depends(get_async_db)):
     """
     Import job and application data from Chrome extension.
     This endpoint receives job data scraped by the extension and application details,
@@ -179,71 +468,48 @@ async def import_job_from_extension(data: JobApplicationImport, db=Depends(get_d
     try:
         logger.info(f"Processing job import: {data.job.title} from {data.job.company}")
         
-        # Check if job already exists (by URL)
-        existing_job = db.query(Job).filter(Job.url == data.job.url).first()
+        # Check if job already exists (by canonical URL)
+        job_url_hash = url_hash(data.job.url)
+        existing_job = await db.scalar(select(Job).where(Job.url_hash == job_url_hash))
+        
+        if not existing_job:
+            # Applying to an archived job brings it back to the hot table
+            restored = (await db.execute(restore_jobs_statement([job_url_hash]))).first()
+            if restored:
+                await db.commit()
+                await ainvalidate_jobs([restored.id], [job_url_hash])
+                existing_job = await db.get(Job, restored.id)
         
         if existing_job:
             # Job exists, just create application
-            application = Application(
-                job_id=existing_job.id,
-                status=data.application.status,
-                notes=data.application.notes
-            )
-            db.add(application)
-            db.commit()
-            db.refresh(application)
-            
-            return JobImportResponse(
-                job_id=existing_job.id,
-                application_id=application.id,
-                job_title=existing_job.title,
-                company=existing_job.company,
-                message="Job already existed, application created",
-                processed_data={}
-            )
-        
-        # Step 1: Self-process description immediately (fast, reliable)
-        processed_description = process_job_description(data.job.description) if data.job.description else {}
-        
-        # Parse salary and date using text processor
-        salary_data = parse_salary(data.job.salary) if data.job.salary else {"salary_min": None, "salary_max": None}
-        posted_date = parse_posted_date(data.job.posted_date) if data.job.posted_date else None
+            return await _add_application_to_existing_job(db, existing_job, data)
         
-        # Create new job with basic processed data
-        job_create = JobCreate(
-            title=data.job.title or data.job.role,
-            description=processed_description.get("description_clean", data.job.description),
-            company=data.job.company,
-            location=data.job.location,
-            url=data.job.url,
-            source=data.job.source or "extension",
-            method=data.job.method or "manual",
-            category=data.job.category or "other", 
-            salary_min=salary_data["salary_min"],
-            salary_max=salary_data["salary_max"],
-            posted_date=posted_date
-        )
-    
-        # Convert Pydantic model to dict and handle HttpUrl conversion
-        job_data = job_create.model_dump()
-        job_data['url'] = str(job_data['url'])  # Convert HttpUrl to string
-        
-        # Convert enum values to strings for database storage
-        if 'work_mode' in job_data and job_data['work_mode']:
-            job_data['work_mode'] = job_data['work_mode'].value
-        if 'work_type' in job_data and job_data['work_type']:
-            job_data['work_type'] = job_data['work_type'].value
-        if 'experience_level' in job_data and job_data['experience_level']:
-            job_data['experience_level'] = job_data['experience_level'].value
-        if 'source' in job_data and job_data['source']:
-            job_data['source'] = job_data['source'].value
+        # Step 1: Self-process description immediately (fast, reliable),
+        # or reuse the results stored for the same description text
+        job_description_hash = description_hash(data.job.description) if data.job.description else None
+        cached = await db.get(ProcessedDescription, job_description_hash) if job_description_hash else None
+        processed_description = cached_processing(cached, data.job.description)
+        fresh = job_description_hash is not None and processed_description is None
+        job_data, processed_description = build_job_record(data.job.model_dump(), processed_description)
         
         logger.info(f"Creating job with data: {job_data}")
         
         db_job = Job(**job_data)
+        enriched = bool(cached and cached.enriched_data)
+        if enriched:
+            _apply_enrichment(db_job, cached.enriched_data)
         db.add(db_job)
-        db.commit()
-        db.refresh(db_job)
+        if fresh:
+            await db.execute(store_processing_statement({job_description_hash: processed_description}))
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A concurrent import inserted the same job first, attach to that one instead
+            await db.rollback()
+            existing_job = await db.scalar(select(Job).where(Job.url_hash == job_url_hash))
+            return await _add_application_to_existing_job(db, existing_job, data)
+        await ainvalidate_jobs(url_hashes=[job_url_hash])
+        await db.refresh(db_job)
         
         # Create application
         application = Application(
@@ -252,13 +518,16 @@ async def import_job_from_extension(data: JobApplicationImport, db=Depends(get_d
             notes=data.application.notes
         )
         db.add(application)
-        db.commit()
-        db.refresh(application)
+        await db.commit()
+        await ainvalidate_applications([db_job.id])
+        await db.refresh(application)
         
-        # Step 2: Trigger AI enrichment in background (non-blocking, enhanced)
+        # Step 2: Trigger AI enrichment in background (non-blocking, enhanced),
+        # unless this description was enriched before and that result was applied above
         # Use asyncio.create_task to run enrichment in background without affecting the response
         try:
-            asyncio.create_task(ai_enrich_job_background(db_job.id, processed_description))
+            if not enriched:
+                asyncio.create_task(ai_enrich_job_background(db_job.id, processed_description))
         except Exception as enrichment_error:
             # Log enrichment error but don't fail the main request
             logger.warning(f"Background enrichment failed for job {db_job.id}: {enrichment_error}")
@@ -278,189 +547,213 @@ async def import_job_from_extension(data: JobApplicationImport, db=Depends(get_d
         )
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error in import_job_from_extension: {str(e)}")
         logger.error(f"Error type: {type(e)}")
         import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Error creating job/application: {str(e)}")
 
-@router.post("/search", response_model=List[JobBase])
-async def search_jobs(params: JobSearchParams, db=Depends(get_db)):
+@router.post("/bulk", response_model=JobBulkImportResponse)
+def bulk_import_jobs(payload: JobBulkImportRequest, db=Depends(get_db)):
+    """
+    Import many jobs in one transaction.
+    Jobs are matched by canonical URL: new ones are inserted, existing ones are
+    refreshed, and invalid or repeated rows are skipped with a reason.
+    """
+    return bulk_upsert_jobs(db, [job.model_dump() for job in payload.jobs])
+
+@router.post("/search", response_model=Union[List[JobBase], JobSearchResponse])
+async def search_jobs(params: JobSearchParams, db: AsyncSession = Depends(get_async_db)):
     """
     Search jobs with filters.
-    This endpoint allows searching jobs by various criteria.
+    Keywords are matched with PostgreSQL full-text search over title, company
+    and description, and results are ranked by relevance.
+    With fields set, only those columns are selected and returned.
+    With facets set, the response is {items, total, facets} where facets holds
+    per-value counts over all matching jobs (not just this page), computed in
+    a single GROUPING SETS query.
     """
-    query = db.query(Job)
-    
-    if params.keywords:
-        # Simple keyword search in title and description
-        query = query.filter(
-            (Job.title.contains(params.keywords)) |
-            (Job.description.contains(params.keywords))
-        )
-    
-    if params.location:
-        query = query.filter(Job.location.contains(params.location))
-    
-    if params.visa_sponsorship is not None:
-        query = query.filter(Job.visa_sponsorship == params.visa_sponsorship)
-    
-    if params.work_mode:
-        query = query.filter(Job.work_mode == params.work_mode)
-    
-    if params.work_type:  # Changed from job_type to work_type
-        query = query.filter(Job.work_type == params.work_type)
-    
-    if params.experience_level:
-        query = query.filter(Job.experience_level == params.experience_level)
-    
-    return query.limit(params.limit).all()
+    stmt = build_search_statement(params)
+    if params.fields:
+        projection = _job_projection(params.fields)
+        rows = (await db.execute(stmt.with_only_columns(*[column for _, column in projection]))).all()
+        items = rows_to_dicts(rows, [key for key, _ in projection])
+    else:
+        jobs = (await db.scalars(stmt)).all()
+        items = dump_orm_list(jobs, JobBase) if FAST_JSON_RESPONSES else jobs
+    raw = bool(params.fields) or FAST_JSON_RESPONSES
+
+    if not params.facets:
+        return FastJSONResponse(items) if raw else items
+
+    total, facets = facet_counts((await db.execute(build_facet_statement(params))).all())
+    result = {"items": items, "total": total, "facets": facets}
+    return FastJSONResponse(result) if raw else result
+
+def _apply_enrichment(job: Job, enriched_data: dict) -> List[str]:
+    """
+    Copy AI enrichment results onto a job.
+
+    Returns:
+        Names of the fields that were updated, for logging
+    """
+    # Always update with AI-provided data (it's more accurate)
+    # Handle field name mappings from AI response
+    if enriched_data.get("job_category"):
+        job.category = enriched_data["job_category"]
+    elif enriched_data.get("category"):
+        job.category = enriched_data["category"]
+
+    if enriched_data.get("job_type"):
+        job.work_type = enriched_data["job_type"]
+    elif enriched_data.get("work_type"):
+        job.work_type = enriched_data["work_type"]
+
+    # Handle work_mode (AI might return different formats)
+    if enriched_data.get("work_mode"):
+        work_mode = enriched_data["work_mode"]
+        # Normalize work_mode values
+        if work_mode.lower() in ["full-time", "full time", "fulltime"]:
+            job.work_mode = "onsite"  # Default for full-time
+        elif work_mode.lower() in ["remote", "work from home", "wfh"]:
+            job.work_mode = "remote"
+        elif work_mode.lower() in ["hybrid", "partially remote"]:
+            job.work_mode = "hybrid"
+        else:
+            job.work_mode = work_mode.lower()
+
+    # Handle experience_level (AI might return different formats)
+    if enriched_data.get("experience_level"):
+        exp_level = enriched_data["experience_level"]
+        # Normalize experience level values
+        if "entry" in exp_level.lower() or "graduate" in exp_level.lower():
+            job.experience_level = "entry"
+        elif "junior" in exp_level.lower():
+            job.experience_level = "junior"
+        elif "mid" in exp_level.lower() or "intermediate" in exp_level.lower():
+            job.experience_level = "mid"
+        elif "senior" in exp_level.lower():
+            job.experience_level = "senior"
+        elif "lead" in exp_level.lower():
+            job.experience_level = "lead"
+        else:
+            job.experience_level = exp_level.lower()
+
+    # Update salary information if AI provides it, its amounts carry no period so it is inferred again
+    if (enriched_data.get("salary_min") or 0) > 0 or (enriched_data.get("salary_max") or 0) > 0:
+        job.salary_period = None
+
+    if enriched_data.get("salary_min") and enriched_data["salary_min"] > 0:
+        job.salary_min = enriched_data["salary_min"]
+
+    if enriched_data.get("salary_max") and enriched_data["salary_max"] > 0:
+        job.salary_max = enriched_data["salary_max"]
+
+    # Update currency if provided
+    if enriched_data.get("currency"):
+        job.currency = enriched_data["currency"]
+
+    # Update visa sponsorship information
+    if enriched_data.get("visa_sponsorship") is not None:
+        job.visa_sponsorship = enriched_data["visa_sponsorship"]
+
+    # Merge the AI tech stack into the one matched at import, under canonical names
+    if enriched_data.get("tech_stack"):
+        job.tech_stack = normalize_tech_stack([*(job.tech_stack or []), *enriched_data["tech_stack"]])
+
+    # Update description with AI-enhanced version if available
+    if enriched_data.get("summary"):
+        summary = enriched_data["summary"]
+        enhanced_description = job.description
+
+        # Add AI summary to the description if it's not already there
+        if summary.get("about"):
+            enhanced_description += f"\n\nSummary:\n{summary['about']}"
+
+        if summary.get("responsibilities"):
+            enhanced_description += f"\n\nKey Responsibilities:\n{summary['responsibilities']}"
+
+        if summary.get("requirements"):
+            enhanced_description += f"\n\nRequirements:\n{summary['requirements']}"
+
+        if summary.get("preferred_qualifications"):
+            enhanced_description += f"\n\nPreferred Qualifications:\n{summary['preferred_qualifications']}"
+
+        job.description = enhanced_description
+
+    # Log what was updated for debugging
+    updated_fields = []
+    if enriched_data.get("job_category") or enriched_data.get("category"):
+        updated_fields.append("category")
+    if enriched_data.get("job_type") or enriched_data.get("work_type"):
+        updated_fields.append("work_type")
+    if enriched_data.get("work_mode"):
+        updated_fields.append("work_mode")
+    if enriched_data.get("experience_level"):
+        updated_fields.append("experience_level")
+    if enriched_data.get("salary_min") or enriched_data.get("salary_max"):
+        updated_fields.append("salary")
+    if enriched_data.get("tech_stack"):
+        updated_fields.append("tech_stack")
+    if enriched_data.get("summary"):
+        updated_fields.append("description")
+    return updated_fields
 
 async def ai_enrich_job_background(job_id: int, processed_description: dict):
     """
     Background task to enrich job with AI processing.
     This function runs asynchronously and should not affect the main request.
     """
-    try:
-        # Get a fresh database session for this background task
-        db = next(get_db())
-        
+    # Queries here run outside any request, so they get their own stats and log line
+    with track_queries(f"ai_enrich_job_background:{job_id}"):
         try:
-            job = db.query(Job).filter(Job.id == job_id).first()
+            # Get a fresh database session for this background task
+            db = AsyncSessionLocal()
+        
+            try:
+                job = await db.get(Job, job_id)
             
-            if not job:
-                logger.error(f"Job {job_id} not found for AI enrichment")
-                return
+                if not job:
+                    logger.error(f"Job {job_id} not found for AI enrichment")
+                    return
             
-            # Use existing enrich_job MCP tool
-            from app.mcp.tools.enrich_job import EnrichJobTool
+                # Use existing enrich_job MCP tool
+                from app.mcp.tools.enrich_job import EnrichJobTool
             
-            enrich_input = EnrichJobInput(
-                title=job.title,
-                description=job.description,
-                company=job.company,
-                location=job.location,
-                url=job.url,
-                source=job.source,
-                context={"mode": "backend"}
-            )
+                enrich_input = EnrichJobInput(
+                    title=job.title,
+                    description=job.description,
+                    company=job.company,
+                    location=job.location,
+                    url=job.url,
+                    source=job.source,
+                    context={"mode": "backend"}
+                )
             
-            enrichment_result = await EnrichJobTool.execute(enrich_input)
+                enrichment_result = await EnrichJobTool.execute(enrich_input)
             
-            # Update job with AI insights if available
-            if enrichment_result.enriched_data:
-                enriched_data = enrichment_result.enriched_data
-                
-                # Always update with AI-provided data (it's more accurate)
-                # Handle field name mappings from AI response
-                if enriched_data.get("job_category"):
-                    job.category = enriched_data["job_category"]
-                elif enriched_data.get("category"):
-                    job.category = enriched_data["category"]
-                
-                if enriched_data.get("job_type"):
-                    job.work_type = enriched_data["job_type"]
-                elif enriched_data.get("work_type"):
-                    job.work_type = enriched_data["work_type"]
-                
-                # Handle work_mode (AI might return different formats)
-                if enriched_data.get("work_mode"):
-                    work_mode = enriched_data["work_mode"]
-                    # Normalize work_mode values
-                    if work_mode.lower() in ["full-time", "full time", "fulltime"]:
-                        job.work_mode = "onsite"  # Default for full-time
-                    elif work_mode.lower() in ["remote", "work from home", "wfh"]:
-                        job.work_mode = "remote"
-                    elif work_mode.lower() in ["hybrid", "partially remote"]:
-                        job.work_mode = "hybrid"
-                    else:
-                        job.work_mode = work_mode.lower()
-                
-                # Handle experience_level (AI might return different formats)
-                if enriched_data.get("experience_level"):
-                    exp_level = enriched_data["experience_level"]
-                    # Normalize experience level values
-                    if "entry" in exp_level.lower() or "graduate" in exp_level.lower():
-                        job.experience_level = "entry"
-                    elif "junior" in exp_level.lower():
-                        job.experience_level = "junior"
-                    elif "mid" in exp_level.lower() or "intermediate" in exp_level.lower():
-                        job.experience_level = "mid"
-                    elif "senior" in exp_level.lower():
-                        job.experience_level = "senior"
-                    elif "lead" in exp_level.lower():
-                        job.experience_level = "lead"
-                    else:
-                        job.experience_level = exp_level.lower()
-                
-                # Update salary information if AI provides it
-                if enriched_data.get("salary_min") and enriched_data["salary_min"] > 0:
-                    job.salary_min = enriched_data["salary_min"]
+                # Update job with AI insights if available
+                if enrichment_result.enriched_data:
+                    enriched_data = enrichment_result.enriched_data
                 
-                if enriched_data.get("salary_max") and enriched_data["salary_max"] > 0:
-                    job.salary_max = enriched_data["salary_max"]
+                    updated_fields = _apply_enrichment(job, enriched_data)
+                    # Stored by content, so reposts of this description reuse it instead of calling the LLM
+                    if job.description_hash:
+                        await db.execute(store_enrichment_statement(job.description_hash, enriched_data))
                 
-                # Update currency if provided
-                if enriched_data.get("currency"):
-                    job.currency = enriched_data["currency"]
+                    await db.commit()
+                    await ainvalidate_jobs([job_id])
+                    logger.info(f"Job {job_id} enriched with AI insights. Updated fields: {', '.join(updated_fields)}")
+                else:
+                    logger.warning(f"No enrichment data returned for job {job_id}")
                 
-                # Update visa sponsorship information
-                if enriched_data.get("visa_sponsorship") is not None:
-                    job.visa_sponsorship = enriched_data["visa_sponsorship"]
-                
-                # Update tech stack if available
-                if enriched_data.get("tech_stack"):
-                    job.tech_stack = enriched_data["tech_stack"]
-                
-                # Update description with AI-enhanced version if available
-                if enriched_data.get("summary"):
-                    summary = enriched_data["summary"]
-                    enhanced_description = job.description
-                    
-                    # Add AI summary to the description if it's not already there
-                    if summary.get("about"):
-                        enhanced_description += f"\n\nSummary:\n{summary['about']}"
-                    
-                    if summary.get("responsibilities"):
-                        enhanced_description += f"\n\nKey Responsibilities:\n{summary['responsibilities']}"
-                    
-                    if summary.get("requirements"):
-                        enhanced_description += f"\n\nRequirements:\n{summary['requirements']}"
-                    
-                    if summary.get("preferred_qualifications"):
-                        enhanced_description += f"\n\nPreferred Qualifications:\n{summary['preferred_qualifications']}"
-                    
-                    job.description = enhanced_description
-                
-                # Log what was updated for debugging
-                updated_fields = []
-                if enriched_data.get("job_category") or enriched_data.get("category"):
-                    updated_fields.append("category")
-                if enriched_data.get("job_type") or enriched_data.get("work_type"):
-                    updated_fields.append("work_type")
-                if enriched_data.get("work_mode"):
-                    updated_fields.append("work_mode")
-                if enriched_data.get("experience_level"):
-                    updated_fields.append("experience_level")
-                if enriched_data.get("salary_min") or enriched_data.get("salary_max"):
-                    updated_fields.append("salary")
-                if enriched_data.get("tech_stack"):
-                    updated_fields.append("tech_stack")
-                if enriched_data.get("summary"):
-                    updated_fields.append("description")
-                
-                db.commit()
-                logger.info(f"Job {job_id} enriched with AI insights. Updated fields: {', '.join(updated_fields)}")
-            else:
-                logger.warning(f"No enrichment data returned for job {job_id}")
-                
-        except Exception as db_error:
-            logger.error(f"Database error during enrichment for job {job_id}: {db_error}")
-            db.rollback()
-        finally:
-            db.close()
+            except Exception as db_error:
+                logger.error(f"Database error during enrichment for job {job_id}: {db_error}")
+                await db.rollback()
+            finally:
+                await db.close()
             
-    except Exception as e:
-        logger.error(f"Error enriching job {job_id} with AI: {e}")
+        except Exception as e:
+            logger.error(f"Error enriching job {job_id} with AI: {e}")
         
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from app.db.models import Resume
 from app.db.schemas import ResumeBase, ResumeCreate, ResumeRead
 from app.db.session import get_db
+from app.db.loading import loading_profile
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -9,12 +10,12 @@ router = APIRouter()
 
 @router.get("/", response_model=List[ResumeRead])
 def list_resumes(db: Session = Depends(get_db)):
-    resumes = db.query(Resume).all()
+    resumes = db.query(Resume).options(*loading_profile("resume_read")).all()
     return resumes
 
 @router.get("/{resume_id}", response_model=ResumeRead)
 def get_resume(resume_id: int, db: Session = Depends(get_db)):
-    resume = db.query(Resume).get(resume_id)
+    resume = db.get(Resume, resume_id, options=loading_profile("resume_read"))
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     return resume
@@ -24,8 +25,7 @@ def create_resume(resume: ResumeCreate, db: Session = Depends(get_db)):
     db_resume = Resume(**resume.model_dump())
     db.add(db_resume)
     db.commit()
-    db.refresh(db_resume)
-    return db_resume
+    return db.get(Resume, db_resume.id, options=loading_profile("resume_read"), populate_existing=True)
 
 @router.put("/{resume_id}", response_model=ResumeRead)
 def update_resume(resume_id: int, resume: ResumeBase, db: Session = Depends(get_db)):
@@ -35,8 +35,7 @@ def update_resume(resume_id: int, resume: ResumeBase, db: Session = Depends(get_
     for field, value in resume.model_dump(exclude_unset=True).items():
         setattr(db_resume, field, value)
     db.commit()
-    db.refresh(db_resume)
-    return db_resume
+    return db.get(Resume, resume_id, options=loading_profile("resume_read"), populate_existing=True)
 
 @router.delete("/{resume_id}", status_code=204)
 def delete_resume(resume_id: int, db: Session = Depends(get_db)):
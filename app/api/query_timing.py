@@ -0,0 +1,42 @@
+"""
+Per-request database timing.
+
+Runs every HTTP request inside app.db.query_metrics.track_queries, adds the
+query count and database time as a Server-Timing header and logs one
+summary line per request.
+"""
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_metrics import track_queries
+
+logger = logging.getLogger(__name__)
+
+class QueryTimingMiddleware:
+    """Server-Timing header and a log line with the SQL stats of each request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = None
+        with track_queries(f"{scope['method']} {scope['path']}", log=False) as stats:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    # Streamed bodies may still run queries, the header covers those before the first byte
+                    status = message["status"]
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                logger.info(stats.log_line(status=status))
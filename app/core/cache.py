@@ -0,0 +1,218 @@
+"""
+Read-through cache for hot job lookups.
+
+The extension calls /jobs/check-url on every page view and polls /jobs/{id},
+so those reads go through a small cache keyed by job id and canonical URL hash.
+Endpoints populate it on a miss and every write path invalidates the affected
+keys after commit. Values must be JSON-serialisable so any backend can hold them.
+Async endpoints use the aget/aset/adelete methods, which don't block the event loop.
+
+Backends (CACHE_BACKEND):
+    memory  in-process TTL + LRU cache (default)
+    redis   shared Redis-compatible server, needs the optional `redis` package
+    none    caching disabled
+
+The memory backend only sees invalidations made in its own process. Writes from
+other API workers or from the ETL (app.etl, scripts) leave its entries stale
+until CACHE_TTL_SECONDS runs out. Use redis whenever more than one process
+writes jobs or applications.
+"""
+
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+import json
+import logging
+import threading
+import time
+
+from app.core.config import cache_config
+
+logger = logging.getLogger(__name__)
+
+# Returned by get() on a miss, so a cached None can mean "known not to exist"
+MISSING = object()
+
+class MemoryCache:
+    """Thread-safe in-process cache with per-entry TTL and LRU eviction."""
+
+    def __init__(self, max_entries: int = 10000, ttl: int = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # The lock is only held for dict operations, so async callers use it directly without a thread hop
+    async def aget(self, key: str) -> Any:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.set(key, value, ttl)
+
+    async def adelete(self, *keys: str) -> None:
+        self.delete(*keys)
+
+class RedisCache:
+    """
+    Cache stored in a Redis-compatible server, shared by every API worker and the ETL.
+    Errors are logged and treated as misses so a cache outage never fails a request.
+    """
+
+    def __init__(self, url: str, ttl: int = 300):
+        import redis  # Optional dependency, only needed for this backend
+        import redis.asyncio
+
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url)
+        # Separate asyncio client for async endpoints, connects lazily on the running loop
+        self._async_client = redis.asyncio.Redis.from_url(url)
+
+    def get(self, key: str) -> Any:
+        try:
+            raw = self._client.get(key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return MISSING
+        return MISSING if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            self._client.set(key, json.dumps(value), ex=ttl or self.ttl)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self._client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {keys}: {e}")
+
+    def clear(self) -> None:
+        try:
+            self._client.flushdb()
+        except Exception as e:
+            logger.warning(f"Cache clear failed: {e}")
+
+    async def aget(self, key: str) -> Any:
+        try:
+            raw = await self._async_client.get(key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return MISSING
+        return MISSING if raw is None else json.loads(raw)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            await self._async_client.set(key, json.dumps(value), ex=ttl or self.ttl)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    async def adelete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self._async_client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {keys}: {e}")
+
+class NullCache:
+    """Cache that stores nothing, used when caching is disabled."""
+
+    def get(self, key: str) -> Any:
+        return MISSING
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    async def aget(self, key: str) -> Any:
+        return MISSING
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        pass
+
+    async def adelete(self, *keys: str) -> None:
+        pass
+
+def _build_cache():
+    """Create the configured backend, falling back to memory if Redis is unavailable."""
+    backend = cache_config["backend"]
+    if backend == "none":
+        return NullCache()
+    if backend == "redis":
+        try:
+            return RedisCache(cache_config["redis_url"], ttl=cache_config["ttl"])
+        except ImportError:
+            logger.warning("CACHE_BACKEND=redis but the redis package is not installed, using the memory cache")
+    return MemoryCache(max_entries=cache_config["max_entries"], ttl=cache_config["ttl"])
+
+cache = _build_cache()
+
+# --- Keys --- #
+
+def job_key(job_id: int) -> str:
+    return f"job:{job_id}"
+
+def job_url_key(job_url_hash: str) -> str:
+    return f"job:url:{job_url_hash}"
+
+def latest_application_key(job_id: int) -> str:
+    return f"job:latest_application:{job_id}"
+
+# --- Invalidation --- #
+
+def _job_keys(job_ids: Iterable[int], url_hashes: Iterable[Optional[str]]) -> list:
+    return [job_key(job_id) for job_id in job_ids] + [job_url_key(h) for h in url_hashes if h]
+
+def _application_keys(job_ids: Iterable[Optional[int]]) -> list:
+    return [latest_application_key(job_id) for job_id in job_ids if job_id is not None]
+
+def invalidate_jobs(job_ids: Iterable[int] = (), url_hashes: Iterable[Optional[str]] = ()) -> None:
+    """Drop cached job entries and URL lookups (including negative ones) after a job write."""
+    cache.delete(*_job_keys(job_ids, url_hashes))
+
+def invalidate_applications(job_ids: Iterable[Optional[int]]) -> None:
+    """Drop cached latest-application lookups after an application write."""
+    cache.delete(*_application_keys(job_ids))
+
+async def ainvalidate_jobs(job_ids: Iterable[int] = (), url_hashes: Iterable[Optional[str]] = ()) -> None:
+    """invalidate_jobs for async code."""
+    await cache.adelete(*_job_keys(job_ids, url_hashes))
+
+async def ainvalidate_applications(job_ids: Iterable[Optional[int]]) -> None:
+    """invalidate_applications for async code."""
+    await cache.adelete(*_application_keys(job_ids))
@@ -16,6 +16,63 @@ if not all(db_config.values()):
 
 SQLALCHEMY_DATABASE_URL = f"postgresql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}" 
 
+# Same database through asyncpg, used by async endpoints
+ASYNC_SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}"
+
+#  Connection pool configuration, shared by the sync and async engines
+pool_config = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),  # seconds to wait for a free connection
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),  # seconds before a connection is replaced
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+}
+
+# Per-statement timeout in milliseconds, 0 disables it
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))
+
+#  Lookup cache configuration
+cache_config = {
+    # 'memory', 'redis' or 'none'. memory is per process: use redis with several workers or the ETL writing
+    "backend": os.getenv("CACHE_BACKEND", "memory"),
+    "redis_url": os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+    "ttl": int(os.getenv("CACHE_TTL_SECONDS", 300)),
+    "negative_ttl": int(os.getenv("CACHE_NEGATIVE_TTL_SECONDS", 30)),  # for URLs with no job
+    "max_entries": int(os.getenv("CACHE_MAX_ENTRIES", 10000)),
+}
+
+#  Archival: jobs older than this (posted, else created) with no applications move to jobs_archive
+JOB_ARCHIVE_AFTER_DAYS = int(os.getenv("JOB_ARCHIVE_AFTER_DAYS", 60))
+
+#  Response serialization and compression
+# orjson serialization without response-model validation for trusted ORM rows on
+# the large list endpoints (install the 'fast' extra for orjson and brotli)
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+RESPONSE_COMPRESSION = os.getenv("RESPONSE_COMPRESSION", "true").lower() == "true"
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", 1024))
+
+#  SQL instrumentation: per-request query stats and a rotating slow-query log with EXPLAIN plans
+query_metrics_config = {
+    "enabled": os.getenv("QUERY_METRICS", "true").lower() == "true",
+    "slow_query_ms": int(os.getenv("SLOW_QUERY_MS", 200)),  # 0 disables the slow-query log
+    "explain_slow_queries": os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true",
+    "slow_query_log_path": os.getenv("SLOW_QUERY_LOG_PATH", "logs/slow_queries.log"),
+    "slow_query_log_max_bytes": int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", 5 * 1024 * 1024)),
+    "slow_query_log_backups": int(os.getenv("SLOW_QUERY_LOG_BACKUPS", 3)),
+}
+
+#  Salary normalization: AUD per unit of each currency, used to precompute annual AUD salaries.
+# Approximate rates, a listing's band only needs to land in the right ballpark for filtering.
+SALARY_AUD_RATES = {
+    "AUD": 1.0,
+    "USD": float(os.getenv("SALARY_RATE_USD", 1.52)),
+    "EUR": float(os.getenv("SALARY_RATE_EUR", 1.65)),
+    "GBP": float(os.getenv("SALARY_RATE_GBP", 1.95)),
+    "NZD": float(os.getenv("SALARY_RATE_NZD", 0.91)),
+    "SGD": float(os.getenv("SALARY_RATE_SGD", 1.15)),
+    "CAD": float(os.getenv("SALARY_RATE_CAD", 1.1)),
+}
+
 #  Logging configuration
 
 # LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -0,0 +1,106 @@
+"""
+Multi-keyword matching for job descriptions.
+
+An Aho-Corasick automaton over word tokens: keywords are split into tokens
+once, compiled into a trie with failure links, and a description is matched
+in a single pass over its tokens. Matching whole tokens gives word boundaries
+for free ('ai' doesn't match "maintain", 'java' doesn't match "javascript")
+and the cost per description doesn't grow with the number of keywords.
+
+Tokens are runs of letters/digits, plus trailing '+'/'#' (c++, c#) and a
+leading '.' (.net, so it doesn't match the word "net").
+Multi-word keywords match across spaces, hyphens, dots and slashes
+("full-time" matches "full time"), but not across punctuation that ends a
+phrase such as commas or line breaks.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Tuple, Union
+import re
+
+# Group 1: a token. Group 2: punctuation that breaks a multi-word match.
+_TOKEN = re.compile(r"(\.?\w[\w+#]*)|([,;:!?()\[\]{}|•\n])")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a keyword or text, as the matcher sees them."""
+    return [match.group(1) for match in _TOKEN.finditer(text.lower()) if match.group(1)]
+
+class KeywordMatch(NamedTuple):
+    keyword: str  # Label of the matched keyword
+    start: int  # Character offsets of the match in the text
+    end: int
+
+class _Node:
+    __slots__ = ("children", "fail", "outputs")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.fail: "_Node" = None
+        self.outputs: List[Tuple[str, int]] = []  # (label, length in tokens)
+
+class KeywordMatcher:
+    """
+    Compiled matcher for a fixed set of keywords.
+
+    Args:
+        keywords: Keywords to find, or a mapping of keyword -> label to report
+                  several spellings under one name (e.g. {"k8s": "kubernetes"})
+    """
+
+    def __init__(self, keywords: Union[Iterable[str], Mapping[str, str]]):
+        labels = keywords if isinstance(keywords, Mapping) else {keyword: keyword for keyword in keywords}
+        self._root = _Node()
+        self.size = 0
+        for keyword, label in labels.items():
+            tokens = tokenize(keyword)
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.children.setdefault(token, _Node())
+            if (label, len(tokens)) not in node.outputs:
+                node.outputs.append((label, len(tokens)))
+                self.size += 1
+        self._link()
+
+    def _link(self):
+        """Breadth-first pass setting failure links and inheriting outputs along them."""
+        root = self._root
+        root.fail = root
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for token, child in node.children.items():
+                fail = node.fail
+                while token not in fail.children and fail is not root:
+                    fail = fail.fail
+                child.fail = fail.children[token] if token in fail.children and fail.children[token] is not child else root
+                child.outputs = child.outputs + [output for output in child.fail.outputs if output not in child.outputs]
+                queue.append(child)
+
+    def finditer(self, text: str) -> Iterator[KeywordMatch]:
+        """Yield every keyword occurrence in text, overlapping ones included, in order of their end."""
+        root = self._root
+        node = root
+        starts: List[int] = []  # start offset of every token seen so far in the current phrase
+        for match in _TOKEN.finditer(text.lower()):
+            token = match.group(1)
+            if token is None:
+                node, starts = root, []
+                continue
+            starts.append(match.start())
+            while token not in node.children and node is not root:
+                node = node.fail
+            node = node.children.get(token, root)
+            for label, length in node.outputs:
+                yield KeywordMatch(label, starts[-length], match.end())
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Occurrences per keyword label, in order of first appearance."""
+        found: Dict[str, int] = {}
+        for match in self.finditer(text):
+            found[match.keyword] = found.get(match.keyword, 0) + 1
+        return found
@@ -0,0 +1,76 @@
+"""
+Salary normalization.
+
+Listings quote salaries in different currencies and periods ("$45/hr",
+"$800 per day", "USD 150k"). To filter on salary bands, every job also stores
+its band as annual AUD, computed at write time from the parsed min/max.
+"""
+
+from typing import Dict, Optional
+
+from app.core.config import SALARY_AUD_RATES
+
+# Full-time hours and working days in a year
+HOURS_PER_YEAR = 38 * 52
+DAYS_PER_YEAR = 230
+
+PERIOD_MULTIPLIERS = {
+    "hour": HOURS_PER_YEAR,
+    "day": DAYS_PER_YEAR,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+
+def infer_salary_period(amount: int) -> str:
+    """
+    Guess the period of an amount with no explicit period.
+    Nobody is paid $300 a day or $3000 a year, so small amounts are rates.
+    """
+    if amount <= 300:
+        return "hour"
+    if amount <= 3000:
+        return "day"
+    return "year"
+
+def annualize(amount: Optional[int], period: Optional[str] = None) -> Optional[int]:
+    """Annual equivalent of an amount paid per period (inferred when not given)."""
+    if amount is None or amount <= 0:
+        return None
+    period = period if period in PERIOD_MULTIPLIERS else infer_salary_period(amount)
+    return amount * PERIOD_MULTIPLIERS[period]
+
+def normalize_salary(
+    salary_min: Optional[int],
+    salary_max: Optional[int],
+    currency: Optional[str] = "AUD",
+    period: Optional[str] = None,
+) -> Dict[str, Optional[int]]:
+    """
+    Convert a salary band to annual AUD.
+
+    Args:
+        salary_min: Lower bound as listed
+        salary_max: Upper bound as listed
+        currency: ISO currency code, AUD when missing
+        period: 'hour', 'day', 'week', 'month' or 'year', inferred from the amounts when missing
+
+    Returns:
+        Dictionary with salary_min_aud and salary_max_aud, both None for unknown currencies
+    """
+    rate = SALARY_AUD_RATES.get((currency or "AUD").upper())
+    if rate is None:
+        return {"salary_min_aud": None, "salary_max_aud": None}
+
+    # Infer the period once for the band, so "80-95" isn't read as an hourly min and a daily max
+    if period not in PERIOD_MULTIPLIERS:
+        reference = salary_max or salary_min
+        period = infer_salary_period(reference) if reference and reference > 0 else None
+
+    low, high = annualize(salary_min, period), annualize(salary_max, period)
+    if low is not None and high is not None and low > high:
+        low, high = high, low
+    return {
+        "salary_min_aud": round(low * rate) if low is not None else None,
+        "salary_max_aud": round(high * rate) if high is not None else None,
+    }
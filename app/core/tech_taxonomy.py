@@ -0,0 +1,89 @@
+"""
+Tech skills taxonomy.
+
+tech_taxonomy.json lists the skills we track with their aliases ("k8s" ->
+kubernetes, "Postgres" -> postgresql). It is loaded once into a synonym index
+and a KeywordMatcher, so Job.tech_stack can be filled from the description at
+import time without waiting for AI enrichment.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import json
+
+from app.core.keyword_matcher import KeywordMatcher, tokenize
+
+TAXONOMY_PATH = Path(__file__).with_name("tech_taxonomy.json")
+
+def _index_key(name: str) -> str:
+    """Spelling-insensitive key: "Node.js", "node .js" and "NODE.JS" share one."""
+    return " ".join(tokenize(name))
+
+@lru_cache(maxsize=None)
+def load_taxonomy(path: Path = TAXONOMY_PATH) -> Dict[str, Dict]:
+    """
+    Skills by canonical name, as listed in the taxonomy file.
+
+    Raises:
+        ValueError: If a name or alias is listed for two different skills
+    """
+    with open(path) as f:
+        skills = json.load(f)["skills"]
+
+    owners: Dict[str, str] = {}
+    for skill in skills:
+        for name in [skill["name"], *skill.get("aliases", [])]:
+            owner = owners.setdefault(_index_key(name), skill["name"])
+            if owner != skill["name"]:
+                raise ValueError(f"'{name}' is listed for both {owner} and {skill['name']} in {path}")
+    return {skill["name"]: skill for skill in skills}
+
+@lru_cache(maxsize=None)
+def synonym_index(path: Path = TAXONOMY_PATH) -> Dict[str, str]:
+    """Every spelling that names a skill (index key) -> canonical name."""
+    index = {}
+    for name, skill in load_taxonomy(path).items():
+        index[_index_key(name)] = name
+        for alias in skill.get("aliases", []):
+            index[_index_key(alias)] = name
+    return index
+
+@lru_cache(maxsize=None)
+def tech_matcher(path: Path = TAXONOMY_PATH) -> KeywordMatcher:
+    """Matcher reporting canonical skill names, built on first use."""
+    spellings = {}
+    for name, skill in load_taxonomy(path).items():
+        if skill.get("match_name", True):
+            spellings[name] = name
+        for alias in skill.get("aliases", []):
+            spellings[alias] = name
+    return KeywordMatcher(spellings)
+
+def canonical_tech(name: str) -> Optional[str]:
+    """Canonical name of a skill from any of its spellings, None if it isn't in the taxonomy."""
+    return synonym_index().get(_index_key(name))
+
+def extract_tech_stack(text: str) -> List[str]:
+    """
+    Canonical names of the skills mentioned in a text.
+
+    Returns:
+        Skill names, most mentioned first (ties in order of first mention)
+    """
+    counts = tech_matcher().counts(text)
+    return sorted(counts, key=lambda name: -counts[name])
+
+def normalize_tech_stack(names: Iterable[str]) -> List[str]:
+    """
+    Map free-form skill names (e.g. from AI enrichment) to canonical names.
+    Unknown skills are kept as given, lowercased, and duplicates are dropped.
+    """
+    stack: List[str] = []
+    for name in names:
+        if not name or not name.strip():
+            continue
+        canonical = canonical_tech(name) or name.strip().lower()
+        if canonical not in stack:
+            stack.append(canonical)
+    return stack
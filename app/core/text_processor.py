@@ -3,11 +3,23 @@ Text processing utilities for job descriptions
 """
 
 import re
-from typing import Dict, List, Optional
+from concurrent.futures import Executor
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from app.core.keyword_matcher import KeywordMatcher
+from app.core.tech_taxonomy import extract_tech_stack
+
+# Bump whenever process_job_description output changes (cleaning, sections, keywords,
+# tech taxonomy), so results cached in processed_descriptions are computed again
+PROCESSOR_VERSION = 1
 
 def clean_job_description(description: str) -> str:
     """
     Clean and normalize job description text.
+    Line breaks are normalized to \\n, blank lines dropped and whitespace
+    inside lines collapsed to single spaces.
     
     Args:
         description: Raw job description text
@@ -18,33 +30,96 @@ def clean_job_description(description: str) -> str:
     if not description:
         return ""
     
-    # Normalize line breaks
-    text = description.replace('\r\n', '\n').replace('\r', '\n')
-    
-    # Remove excessive whitespace while preserving structure
-    lines = text.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        # Clean each line
-        line = line.strip()
-        if line:  # Keep non-empty lines
-            # Normalize internal whitespace
-            line = re.sub(r'\s+', ' ', line)
-            cleaned_lines.append(line)
-    
-    # Join lines with proper spacing
-    cleaned_text = '\n'.join(cleaned_lines)
+    # Normalize Windows and old Mac line breaks, skipped for the usual Unix-only text
+    if "\r" in description:
+        description = description.replace("\r\n", "\n").replace("\r", "\n")
     
-    # Final cleanup
-    cleaned_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_text)  # Max 2 consecutive line breaks
-    cleaned_text = cleaned_text.strip()
-    
-    return cleaned_text
+    # str.split() collapses and strips whitespace runs in C, empty (blank) lines are filtered out
+    return "\n".join(filter(None, map(" ".join, map(str.split, description.split("\n")))))
+
+# Header phrases per section. Where two match at the same spot the earlier section wins,
+# so "about you" is requirements and "about the role" responsibilities, not about.
+SECTION_HEADERS = {
+    "requirements": [
+        r"requirements?", r"qualifications?", r"skills?(?: (?:and|&) experience)?", r"experience",
+        r"about you", r"who you are", r"what you(?:'ll| will)? (?:bring|need|have)", r"to be successful",
+        r"you(?:'ll| will) (?:have|need|bring)", r"selection criteria", r"must haves?", r"nice to haves?",
+    ],
+    "responsibilities": [
+        r"responsibilit(?:y|ies)", r"duties", r"(?:about )?(?:the|your|this) (?:new )?(?:role|position|opportunity)",
+        r"what you(?:'ll| will) (?:do|be doing)", r"day[- ]to[- ]day", r"purpose", r"key accountabilities",
+        r"(?:job|role|position) description",
+    ],
+    "benefits": [
+        r"benefits?", r"perks?", r"what we offer", r"what(?:'s| is) in it for you", r"why (?:join|work (?:with|for)) us",
+        r"(?:we|you'll|you will) (?:offer|receive|get)", r"remuneration",
+    ],
+    "about": [
+        r"about(?: us| the (?:company|team|business|organi[sz]ation))?", r"who we are", r"(?:company )?overview",
+        r"the company", r"our (?:company|team|client|story)", r"description",
+    ],
+    "other": [r"next steps?", r"how to apply", r"(?:to )?apply(?: now| today)?", r"contact"],
+}
+
+# One alternation for all headers, the named group that matched tells the section
+_SECTION_HEADER = re.compile(
+    r"\b(?:" + "|".join(f"(?P<{name}>{'|'.join(phrases)})" for name, phrases in SECTION_HEADERS.items()) + r")\b",
+    re.IGNORECASE,
+)
+
+# Longest line considered as a header, longer lines are always content
+MAX_HEADER_LENGTH = 60
+MAX_HEADER_WORDS = 8
+# Most words before the colon of an inline header ("Key skills: ...")
+MAX_INLINE_HEADER_WORDS = 4
+
+_BULLET = re.compile(r"^[-•*·]\s")
+_HEADER_DECORATION = re.compile(r"^[#*_\s]+|[#*_:\s]+$")
+# Markup that says a line is a heading: a trailing colon, a markdown '#' or bold
+_HEADING_CUE = re.compile(r"^(?:#+\s|\*\*|__)|(?:\*\*|__|:)$")
+# Words that can precede a header phrase ("Key responsibilities", "Our benefits")
+_HEADING_QUALIFIERS = re.compile(
+    r"^(?:(?:key|main|core|essential|desired|desirable|required|preferred|additional|general|our|your|the|job|role)\s+)+",
+    re.IGNORECASE,
+)
+# Separators of compound headings ("Skills & Experience", "Benefits and perks")
+_HEADING_JOINER = re.compile(r"\s*(?:&|/|,|\band\b)\s*", re.IGNORECASE)
+
+def _phrase_section(heading: str) -> Optional[str]:
+    """Section of a heading made up only of header phrases, else None."""
+    sections = []
+    for part in _HEADING_JOINER.split(heading):
+        match = _SECTION_HEADER.fullmatch(part) or _SECTION_HEADER.fullmatch(_HEADING_QUALIFIERS.sub("", part))
+        if not match:
+            return None
+        sections.append(match.lastgroup)
+    return sections[0]
+
+def _header_section(line: str, max_words: int = MAX_HEADER_WORDS, inline: bool = False) -> Optional[str]:
+    """
+    Section a line introduces if it is a heading, else None.
+    The whole heading has to be header phrases, so "Strong SQL skills" stays content.
+    Whole lines marked up as headings ("What you'll bring to the team:", "## ABOUT US")
+    only have to contain one.
+    """
+    if len(line) > MAX_HEADER_LENGTH or _BULLET.match(line):
+        return None
+    heading = _HEADER_DECORATION.sub("", line)
+    # Headings are short and aren't sentences
+    if not heading or "." in heading or heading.endswith("!") or len(heading.split()) > max_words:
+        return None
+    section = _phrase_section(heading)
+    if section is None and not inline and (_HEADING_CUE.search(line) or heading.isupper()):
+        match = _SECTION_HEADER.search(heading)
+        section = match.lastgroup if match else None
+    return section
 
 def extract_job_sections(description: str) -> Dict[str, str]:
     """
     Extract common job posting sections from description.
+    Heading lines that name a section ("About you", "Key benefits", "**Perks**")
+    switch sections and are dropped; every other line is kept as content.
+    "Requirements: 5+ years of Python" switches and keeps the text after the colon.
     
     Args:
         description: Cleaned job description
@@ -52,125 +127,151 @@ def extract_job_sections(description: str) -> Dict[str, str]:
     Returns:
         Dictionary with section names and content
     """
-    sections = {
-        "about": "",
-        "requirements": "",
-        "responsibilities": "",
-        "benefits": "",
-        "other": ""
+    sections: Dict[str, List[str]] = {
+        "about": [],
+        "requirements": [],
+        "responsibilities": [],
+        "benefits": [],
+        "other": []
     }
-    
-    lines = description.split('\n')
     current_section = "other"
     
-    for line in lines:
-        line_lower = line.lower().strip()
-        
-        # Detect section headers
-        if any(keyword in line_lower for keyword in ['about', 'overview', 'company', 'description']):
-            current_section = "about"
-        elif any(keyword in line_lower for keyword in ['requirement', 'qualification', 'experience', 'to be successful', 'about you']):
-            current_section = "requirements"
-        elif any(keyword in line_lower for keyword in ['responsibility', 'duty', 'role', 'purpose', 'working']):
-            current_section = "responsibilities"
-        elif any(keyword in line_lower for keyword in ['benefit', 'perk', 'offer', 'what we offer']):
-            current_section = "benefits"
-        elif any(keyword in line_lower for keyword in ['next step', 'apply', 'contact']):
-            current_section = "other"
+    for line in description.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        head, colon, rest = line.partition(":")
+        if colon and rest.strip():
+            section = _header_section(head, MAX_INLINE_HEADER_WORDS, inline=True)
+            if section:
+                current_section = section
+                line = rest.strip()
         else:
-            # Add content to current section
-            if line.strip():
-                sections[current_section] += line + "\n"
-    
-    # Clean up sections
-    for key in sections:
-        sections[key] = sections[key].strip()
+            section = _header_section(line)
+            if section:
+                current_section = section
+                continue
+
+        sections[current_section].append(line)
     
-    return sections
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+# Common tech keywords
+TECH_KEYWORDS = [
+    'sql', 'database', 'azure', 'cloud', 'python', 'javascript', 'java',
+    'aws', 'docker', 'kubernetes', 'git', 'agile', 'scrum', 'devops',
+    'api', 'rest', 'microservices', 'machine learning', 'ai', 'data',
+    'analytics', 'etl', 'data warehouse', 'bi', 'power bi', 'ssis',
+    'ssas', 'ssrs', 'aoag', 'replication'
+]
+
+# Common job keywords
+JOB_KEYWORDS = [
+    'engineer', 'developer', 'analyst', 'manager', 'architect',
+    'administrator', 'specialist', 'consultant', 'lead', 'senior',
+    'junior', 'entry', 'full-time', 'part-time', 'contract',
+    'remote', 'hybrid', 'onsite'
+]
+
+# Compiled once at import, matching cost doesn't grow with the keyword lists
+KEYWORD_MATCHER = KeywordMatcher(TECH_KEYWORDS + JOB_KEYWORDS)
 
 def extract_keywords(description: str) -> List[str]:
     """
     Extract potential keywords from job description.
+    Keywords match whole words only, so 'ai' doesn't match "maintain".
     
     Args:
         description: Cleaned job description
         
     Returns:
-        List of potential keywords
-    """
-    # Common tech keywords
-    tech_keywords = [
-        'sql', 'database', 'azure', 'cloud', 'python', 'javascript', 'java',
-        'aws', 'docker', 'kubernetes', 'git', 'agile', 'scrum', 'devops',
-        'api', 'rest', 'microservices', 'machine learning', 'ai', 'data',
-        'analytics', 'etl', 'data warehouse', 'bi', 'power bi', 'ssis',
-        'ssas', 'ssrs', 'aoag', 'replication'
-    ]
-    
-    # Common job keywords
-    job_keywords = [
-        'engineer', 'developer', 'analyst', 'manager', 'architect',
-        'administrator', 'specialist', 'consultant', 'lead', 'senior',
-        'junior', 'entry', 'full-time', 'part-time', 'contract',
-        'remote', 'hybrid', 'onsite'
-    ]
-    
-    text_lower = description.lower()
-    found_keywords = []
-    
-    # Check for tech keywords
-    for keyword in tech_keywords:
-        if keyword in text_lower:
-            found_keywords.append(keyword)
-    
-    # Check for job keywords
-    for keyword in job_keywords:
-        if keyword in text_lower:
-            found_keywords.append(keyword)
-    
-    return list(set(found_keywords))  # Remove duplicates
+        List of potential keywords, in order of first appearance
+    """
+    return list(KEYWORD_MATCHER.counts(description))
+
+# Distinct raw strings remembered by parse_salary and parse_posted_date.
+# ETL batches repeat the same few hundred salary labels and date strings.
+PARSER_CACHE_SIZE = 4096
+
+# An amount ("120", "120,000", "45.50") with an optional k suffix, but not a percentage ("11% super")
+_SALARY_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(k\b)?(?!\.?\d|\s*%)", re.IGNORECASE)
+
+# Pay period named anywhere in the label, e.g. "per hour", "p.h.", "/hr", "daily", "p.a."
+_SALARY_PERIOD = re.compile(
+    r"(?P<hour>\b(?:hours?|hourly|hr|p\.?h)\b|/\s*hr?\b)"
+    r"|(?P<day>\b(?:day|daily|p\.?d)\b|/\s*d(?:ay)?\b)"
+    r"|(?P<week>\b(?:week|weekly|p\.?w)\b|/\s*w(?:ee)?k\b)"
+    r"|(?P<month>\b(?:month|monthly|p\.?m)\b|/\s*m(?:on)?th\b)"
+    r"|(?P<year>\b(?:year|yearly|annum|annual|annually|p\.?a)\b|/\s*y(?:ea)?r\b)",
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_salary(salary_str: str) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    amounts = []
+    for number, thousands in _SALARY_AMOUNT.findall(salary_str):
+        value = float(number.replace(",", ""))
+        amounts.append((value * 1000 if thousands else value, bool(thousands)))
+        if len(amounts) == 2:
+            break
+    if len(amounts) == 2 and amounts[1][1] and not amounts[0][1] and amounts[0][0] < 1000:
+        # "120-140k": the suffix applies to both ends
+        amounts[0] = (amounts[0][0] * 1000, True)
+
+    values = [round(value) for value, _ in amounts]
+    period = _SALARY_PERIOD.search(salary_str)
+    return (
+        values[0] if values else None,
+        values[1] if len(values) > 1 else None,
+        period.lastgroup if period else None,
+    )
 
 def parse_salary(salary_str: str) -> Dict[str, Optional[int]]:
     """
     Parse salary string into min/max values.
+    Results are memoized per string (PARSER_CACHE_SIZE most recent).
     
     Args:
-        salary_str: Salary string (e.g., "$80,000 - $120,000", "$100k", "80k-120k")
+        salary_str: Salary string (e.g., "$80,000 - $120,000", "$120k–$140k + super", "$45 - $55 per hour")
         
     Returns:
-        Dictionary with salary_min and salary_max
+        Dictionary with salary_min, salary_max and salary_period
+        ('hour', 'day', 'week', 'month', 'year', or None when the label doesn't say)
     """
     if not salary_str:
-        return {"salary_min": None, "salary_max": None}
-    
-    # Remove common currency symbols and text
-    cleaned = re.sub(r'[$,€£¥]', '', salary_str.lower())
-    cleaned = re.sub(r'\s+', '', cleaned)
-    
-    # Handle "k" suffix (thousands)
-    cleaned = re.sub(r'k', '000', cleaned)
+        return {"salary_min": None, "salary_max": None, "salary_period": None}
     
-    # Extract numbers
-    numbers = re.findall(r'\d+', cleaned)
-    
-    if len(numbers) >= 2:
-        # Multiple numbers found, assume min-max range
-        return {
-            "salary_min": int(numbers[0]),
-            "salary_max": int(numbers[1])
-        }
-    elif len(numbers) == 1:
-        # Single number found, use as min
-        return {
-            "salary_min": int(numbers[0]),
-            "salary_max": None
-        }
-    else:
-        return {"salary_min": None, "salary_max": None}
+    salary_min, salary_max, salary_period = _parse_salary(salary_str)
+    return {"salary_min": salary_min, "salary_max": salary_max, "salary_period": salary_period}
+
+# Common date formats, in the order they are tried
+DATE_FORMATS = (
+    '%Y-%m-%d',           # 2024-01-15
+    '%d/%m/%Y',           # 15/01/2024
+    '%m/%d/%Y',           # 01/15/2024
+    '%Y-%m-%d %H:%M:%S',  # 2024-01-15 10:30:00
+    '%d-%m-%Y',           # 15-01-2024
+    '%m-%d-%Y',           # 01-15-2024
+    '%B %d, %Y',          # January 15, 2024
+    '%b %d, %Y',          # Jan 15, 2024
+)
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_posted_date(date_str: str) -> Optional[str]:
+    date_str = date_str.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).isoformat()
+        except ValueError:
+            continue
+    return None
 
 def parse_posted_date(date_str: str) -> Optional[str]:
     """
     Parse posted date string into ISO format.
+    Formats are tried in DATE_FORMATS order, so ambiguous dates such as 03/04/2024
+    always read day first. Results are memoized per string (PARSER_CACHE_SIZE most recent).
     
     Args:
         date_str: Date string from job posting
@@ -180,29 +281,7 @@ def parse_posted_date(date_str: str) -> Optional[str]:
     """
     if not date_str:
         return None
-    
-    from datetime import datetime
-    
-    # Common date formats to try
-    date_formats = [
-        '%Y-%m-%d',           # 2024-01-15
-        '%d/%m/%Y',           # 15/01/2024
-        '%m/%d/%Y',           # 01/15/2024
-        '%Y-%m-%d %H:%M:%S',  # 2024-01-15 10:30:00
-        '%d-%m-%Y',           # 15-01-2024
-        '%m-%d-%Y',           # 01-15-2024
-        '%B %d, %Y',          # January 15, 2024
-        '%b %d, %Y',          # Jan 15, 2024
-    ]
-    
-    for fmt in date_formats:
-        try:
-            parsed_date = datetime.strptime(date_str.strip(), fmt)
-            return parsed_date.isoformat()
-        except ValueError:
-            continue
-    
-    return None
+    return _parse_posted_date(date_str)
 
 def process_job_description(description: str) -> Dict[str, any]:
     """
@@ -227,6 +306,30 @@ def process_job_description(description: str) -> Dict[str, any]:
         "description_clean": cleaned_description,
         "description_structured": sections,
         "keywords": keywords,
+        "tech_stack": extract_tech_stack(cleaned_description),
         "word_count": len(cleaned_description.split()),
         "line_count": len(cleaned_description.split('\n'))
-    } 
\ No newline at end of file
+    } 
+
+# Descriptions sent to a worker per task in a parallel batch, amortizes pickling
+BATCH_CHUNK_SIZE = 16
+
+def process_job_descriptions_batch(
+    descriptions: List[str],
+    executor: Optional[Executor] = None,
+    chunksize: int = BATCH_CHUNK_SIZE,
+) -> List[Dict[str, any]]:
+    """
+    Run process_job_description over many descriptions.
+    
+    Args:
+        descriptions: Raw job descriptions
+        executor: Executor to fan out on, e.g. a ProcessPoolExecutor; None processes serially
+        chunksize: Descriptions per worker task
+        
+    Returns:
+        Processed description data, in the same order as the input
+    """
+    if executor is None:
+        return [process_job_description(description) for description in descriptions]
+    return list(executor.map(process_job_description, descriptions, chunksize=chunksize))
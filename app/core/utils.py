@@ -0,0 +1,104 @@
+"""
+General utilities shared across the API, services and ETL
+"""
+
+import hashlib
+import re
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from and never identify a job
+TRACKING_PARAMS = {
+    "ref", "refid", "referrer", "trk", "trackingid",
+    "fbclid", "gclid", "msclkid", "mc_cid", "mc_eid",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+_LINKEDIN_JOB_ID = re.compile(r"(\d+)/?$")
+_SEEK_JOB_PATH = re.compile(r"^/job/(\d+)")
+
+def _canonical_seek(host: str, path: str, query: Dict[str, str]) -> Optional[str]:
+    """Seek job links: /job/<id>, or a search page with the job selected via ?jobId=<id>."""
+    match = _SEEK_JOB_PATH.match(path)
+    job_id = match.group(1) if match else query.get("jobid")
+    if job_id:
+        return f"https://{host}/job/{job_id}"
+    return None
+
+def _canonical_jora(host: str, path: str, query: Dict[str, str]) -> Optional[str]:
+    """Jora job links: /job/<slug>-<hash>, everything in the query string is tracking."""
+    if path.startswith("/job/"):
+        return f"https://{host}{path.rstrip('/')}"
+    return None
+
+def _canonical_linkedin(host: str, path: str, query: Dict[str, str]) -> Optional[str]:
+    """LinkedIn job links: /jobs/view/[<slug>-]<id>, or ?currentJobId=<id> on search pages."""
+    job_id = query.get("currentjobid")
+    if not job_id and path.startswith("/jobs/view/"):
+        match = _LINKEDIN_JOB_ID.search(path)
+        job_id = match.group(1) if match else None
+    if job_id:
+        return f"https://linkedin.com/jobs/view/{job_id}"
+    return None
+
+# Per-source rules keyed by host suffix, each returns None to fall back to the generic rules
+SOURCE_URL_RULES: Dict[str, Callable[[str, str, Dict[str, str]], Optional[str]]] = {
+    "seek.com.au": _canonical_seek,
+    "seek.co.nz": _canonical_seek,
+    "jora.com": _canonical_jora,
+    "linkedin.com": _canonical_linkedin,
+}
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a job URL so the same posting always maps to the same string.
+
+    Args:
+        url: Job URL as scraped or sent by the extension
+
+    Returns:
+        Canonical URL: lowercase https host without www, no fragment,
+        no tracking parameters, and source-specific job paths
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = f"https://{url}"
+
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        # Out of range or non-numeric ports ("host:99999") are dropped instead of failing
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    path = parts.path or "/"
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    lowered = {key.lower(): value for key, value in params}
+
+    for suffix, rule in SOURCE_URL_RULES.items():
+        if host == suffix or host.endswith(f".{suffix}"):
+            canonical = rule(host, path, lowered)
+            if canonical:
+                return canonical
+            break
+
+    kept = sorted(
+        (key, value) for key, value in params
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return urlunsplit(("https", host, path, urlencode(kept), ""))
+
+def url_hash(url: str) -> str:
+    """SHA-256 hex digest of the canonical form of a URL, used for duplicate detection."""
+    return hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+
+def description_hash(description: str) -> str:
+    """SHA-256 hex digest of a raw job description, keys its cached processing output."""
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
@@ -0,0 +1,38 @@
+"""
+Named relationship loading profiles.
+
+Each profile eager-loads exactly the relationships a response schema reads and
+raises on any other lazy load, so list endpoints run a fixed number of queries
+whatever the row count. Back-references that would make the nested read
+schemas recurse (application -> job -> applications -> ...) are not loaded.
+"""
+
+from typing import Tuple
+from sqlalchemy.orm import noload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from app.db.models import Application, Job, Resume
+
+LOADING_PROFILES = {
+    # JobBase: columns only
+    "job_summary": (
+        raiseload("*"),
+    ),
+    # ApplicationRead: the application's job and resume
+    "application_read": (
+        selectinload(Application.job).noload(Job.applications),
+        selectinload(Application.resume).noload(Resume.applications),
+        raiseload("*"),
+    ),
+    # ResumeRead: the resume's applications and each application's job
+    "resume_read": (
+        selectinload(Resume.applications).options(
+            selectinload(Application.job).noload(Job.applications),
+            noload(Application.resume),
+        ),
+        raiseload("*"),
+    ),
+}
+
+def loading_profile(name: str) -> Tuple[LoaderOption, ...]:
+    """Loader options for a named profile, pass them to .options() or Session.get()."""
+    return LOADING_PROFILES[name]
@@ -1,10 +1,31 @@
-from sqlalchemy import ARRAY, JSON, Column, Integer, String, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import ARRAY, DDL, JSON, Column, Computed, Index, Integer, String, DateTime, ForeignKey, Boolean, event, inspect
+from sqlalchemy.dialects.postgresql import INT4RANGE, TSVECTOR
+from sqlalchemy.orm import deferred, relationship, validates
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime, timezone
+from app.core.salary import normalize_salary
+from app.core.utils import url_hash
 
 Base = declarative_base()
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the TIMESTAMP WITHOUT TIME ZONE columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+# Weighted full-text document for job search: title > company > description
+JOB_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+# Annual AUD salary band as an inclusive range, NULL when the job has no salary.
+# least/greatest skip NULLs, so a single bound becomes a one-value range.
+JOB_SALARY_RANGE_SQL = (
+    "CASE WHEN salary_min_aud IS NULL AND salary_max_aud IS NULL THEN NULL "
+    "ELSE int4range(least(salary_min_aud, salary_max_aud), greatest(salary_min_aud, salary_max_aud), '[]') END"
+)
+
 class Job(Base):
     __tablename__ = "jobs"
     id = Column(Integer, primary_key=True, index=True)
@@ -19,14 +40,107 @@ class Job(Base):
     salary_min = Column(Integer, nullable=True)
     salary_max = Column(Integer, nullable=True)
     currency = Column(String, nullable=True, default="AUD")
+    salary_period = Column(String, nullable=True) # 'hour', 'day', 'week', 'month', 'year' as listed, NULL to infer from the amounts
+    salary_min_aud = Column(Integer, nullable=True) # annualized AUD, kept in sync from salary_min/max, currency and salary_period
+    salary_max_aud = Column(Integer, nullable=True)
     visa_sponsorship = Column(Boolean, default=False)
     url = Column(String)
+    url_hash = Column(String(64), unique=True, index=True) # sha256 of the canonical url, see app.core.utils
     source = Column(String) # 'seek', 'linkedin', 'jora', 'remotely', 'other'
+    description_hash = Column(String(64), nullable=True) # sha256 of the description as imported, see ProcessedDescription
     tech_stack = Column(ARRAY(String), nullable=True) # 'python', 'javascript', 'java', 'aws', 'sql'
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utcnow, nullable=False) # keyset pagination needs it on every row
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, index=True) # drives ETags, see app.api.conditional
     posted_date = Column(DateTime, nullable=True)
     method = Column(String, default="manual") # 'automation', 'manual'
-    applications = relationship("Application", back_populates="job")
+    search_vector = deferred(Column(TSVECTOR, Computed(JOB_SEARCH_VECTOR_SQL, persisted=True)))
+    salary_range_aud = deferred(Column(INT4RANGE, Computed(JOB_SALARY_RANGE_SQL, persisted=True)))
+    # The database cascades deletes to applications (ON DELETE CASCADE), so the ORM doesn't load them first
+    applications = relationship("Application", back_populates="job", passive_deletes=True)
+
+    @validates("url")
+    def _set_url_hash(self, key, url):
+        # Keep the dedupe hash in sync with every url write
+        url = str(url) if url is not None else None
+        self.url_hash = url_hash(url) if url else None
+        return url
+
+    __table_args__ = (
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_jobs_company_trgm", "company", postgresql_using="gin", postgresql_ops={"company": "gin_trgm_ops"}),
+        Index("ix_jobs_location_trgm", "location", postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"}),
+        Index("ix_jobs_created_at_id", "created_at", "id"), # keyset pagination on the job list
+        Index("ix_jobs_salary_range_aud", "salary_range_aud", postgresql_using="gist"), # salary band overlap
+    )
+
+# Columns the annual AUD band is derived from
+SALARY_SOURCE_COLUMNS = ("salary_min", "salary_max", "currency", "salary_period")
+
+@event.listens_for(Job, "before_insert")
+@event.listens_for(Job, "before_update")
+def _normalize_job_salary(mapper, connection, job):
+    # Core inserts (bulk imports) go through app.services.job_service.build_job_record instead.
+    # Flushes that don't touch the salary (enrichment, other edits) keep the stored band.
+    state = inspect(job)
+    if state.has_identity and not any(state.attrs[name].history.has_changes() for name in SALARY_SOURCE_COLUMNS):
+        return
+    normalized = normalize_salary(job.salary_min, job.salary_max, job.currency, job.salary_period)
+    job.salary_min_aud = normalized["salary_min_aud"]
+    job.salary_max_aud = normalized["salary_max_aud"]
+
+class JobArchive(Base):
+    """
+    Cold tier for expired jobs, see app.services.archival.
+    Same columns as Job minus the search vector, rows keep their original job id.
+    """
+    __tablename__ = "jobs_archive"
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String)
+    description = Column(String)
+    company = Column(String)
+    location = Column(String)
+    work_mode = Column(String)
+    work_type = Column(String)
+    experience_level = Column(String)
+    category = Column(String)
+    salary_min = Column(Integer, nullable=True)
+    salary_max = Column(Integer, nullable=True)
+    currency = Column(String, nullable=True)
+    salary_period = Column(String, nullable=True)
+    salary_min_aud = Column(Integer, nullable=True)
+    salary_max_aud = Column(Integer, nullable=True)
+    visa_sponsorship = Column(Boolean)
+    url = Column(String)
+    url_hash = Column(String(64), unique=True, index=True)
+    source = Column(String)
+    description_hash = Column(String(64), nullable=True)
+    tech_stack = Column(ARRAY(String), nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+    posted_date = Column(DateTime, nullable=True)
+    method = Column(String)
+    archived_at = Column(DateTime, default=utcnow)
+
+# Compress archived rows aggressively: TOAST kicks in above 256 bytes instead of ~2kB
+event.listen(JobArchive.__table__, "after_create", DDL("ALTER TABLE jobs_archive SET (toast_tuple_target = 256)"))
+
+class ProcessedDescription(Base):
+    """
+    Processing output per distinct job description, see app.services.description_cache.
+    Keyed by the SHA-256 of the raw description, so reposts and re-imports of the
+    same text reuse it instead of running the text processor and AI enrichment again.
+    """
+    __tablename__ = "processed_descriptions"
+    description_hash = Column(String(64), primary_key=True)
+    processor_version = Column(Integer, nullable=False) # PROCESSOR_VERSION that produced the row
+    description_structured = Column(JSON)
+    keywords = Column(ARRAY(String))
+    tech_stack = Column(ARRAY(String))
+    word_count = Column(Integer)
+    line_count = Column(Integer)
+    enriched_data = Column(JSON, nullable=True) # AI enrichment result, once it has run
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
 
 class Resume(Base):
     __tablename__ = "resumes"
@@ -36,7 +150,8 @@ class Resume(Base):
     file_url = Column(String, nullable=False)
     file_type = Column(String, nullable=False)
     parsed_data = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
     applications = relationship("Application", back_populates="resume")
 
 class Application(Base):
@@ -47,11 +162,17 @@ class Application(Base):
     status = Column(String, default="pending") # 'pending', 'applied', 'interview', 'offer', 'rejected', 'withdrawn', 'archived'
     applied_at = Column(DateTime, nullable=True)
     notes = Column(String, nullable=True)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, index=True)
     # Note: category is now in Job model, not Application
 
     job = relationship("Job", back_populates="applications")
     resume = relationship("Resume", back_populates="applications")
 
+    __table_args__ = (
+        Index("ix_applications_job_id_applied_at", job_id, applied_at.desc()), # latest application per job
+        Index("ix_applications_status", "status"),
+    )
+
 class FitScore(Base):
     __tablename__ = "fit_scores"
     id = Column(Integer, primary_key=True, index=True)
@@ -59,7 +180,10 @@ class FitScore(Base):
     resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"))
     score = Column(Integer) # 0-100
     explanation = Column(String)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utcnow)
+
+    __table_args__ = (
+        Index("ix_fit_scores_job_id_resume_id", "job_id", "resume_id"),
+    )
 
-    
 
@@ -0,0 +1,114 @@
+"""
+Connection pool instrumentation.
+
+Tracks how long requests wait for a pooled connection (not counting the time
+to open a new one) plus checkout, checkin, connect and invalidation events, so pool exhaustion shows up in /health/db
+before it shows up as timeouts.
+"""
+
+from contextvars import ContextVar
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import Pool
+
+# Upper bounds (ms) of the checkout latency histogram buckets, plus an overflow bucket
+CHECKOUT_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class PoolMetrics:
+    """Thread-safe counters and checkout latency histogram for one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.latency_buckets = [0] * (len(CHECKOUT_LATENCY_BUCKETS_MS) + 1)
+
+    def observe_wait(self, wait_ms: float):
+        """Record the time spent waiting for a connection from the pool."""
+        index = len(CHECKOUT_LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(CHECKOUT_LATENCY_BUCKETS_MS):
+            if wait_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.latency_buckets[index] += 1
+
+    def increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def attach(self, pool_events_target):
+        """Listen to pool events on an engine (or pool) and count them."""
+        event.listen(pool_events_target, "checkout", lambda *args: self.increment("checkouts"))
+        event.listen(pool_events_target, "checkin", lambda *args: self.increment("checkins"))
+        event.listen(pool_events_target, "connect", lambda *args: self.increment("connects"))
+        event.listen(pool_events_target, "invalidate", lambda *args: self.increment("invalidations"))
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Current pool state merged with the counters collected so far."""
+        with self._lock:
+            acquired = sum(self.latency_buckets)
+            histogram = [
+                {"le_ms": bound, "count": count}
+                for bound, count in zip(CHECKOUT_LATENCY_BUCKETS_MS, self.latency_buckets)
+            ]
+            histogram.append({"le_ms": "+Inf", "count": self.latency_buckets[-1]})
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total_ms / acquired, 3) if acquired else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "checkout_latency_histogram": histogram,
+            }
+
+# Time spent opening connections during the current acquisition. A context
+# variable is per thread and per greenlet, so async checkouts don't mix.
+_connect_ms: ContextVar[float] = ContextVar("pool_connect_ms", default=0.0)
+
+def instrumented_pool(pool_class: type, metrics: PoolMetrics) -> type:
+    """
+    Subclass a pool class so every connection acquisition is timed.
+    Pool events fire only after a connection is handed out, so the wait itself
+    is measured around the pool's internal get. Opening a new connection (an
+    empty pool or overflow) is subtracted, so the histogram shows checkout wait
+    only. The subclass keeps the metrics across pool recreation (e.g. engine.dispose()).
+    """
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return pool_class._create_connection(self)
+        finally:
+            _connect_ms.set(_connect_ms.get() + (time.perf_counter() - start) * 1000)
+
+    def _do_get(self):
+        token = _connect_ms.set(0.0)
+        start = time.perf_counter()
+        try:
+            return pool_class._do_get(self)
+        except exc.TimeoutError:
+            metrics.increment("timeouts")
+            raise
+        finally:
+            metrics.observe_wait(max(0.0, (time.perf_counter() - start) * 1000 - _connect_ms.get()))
+            _connect_ms.reset(token)
+
+    return type(f"Instrumented{pool_class.__name__}", (pool_class,),
+                {"_do_get": _do_get, "_create_connection": _create_connection})
@@ -0,0 +1,65 @@
+"""
+Sparse fieldsets for list and search endpoints.
+
+Resolves a `fields=` value such as "id,title,company" into plain columns so
+endpoints can SELECT only those columns and return lightweight row tuples
+instead of hydrating full ORM entities.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import inspect
+
+def selectable_columns(model) -> Dict[str, Any]:
+    """Column attributes of a model that can be requested, deferred internals excluded."""
+    return {
+        attr.key: getattr(model, attr.key)
+        for attr in inspect(model).column_attrs
+        if not attr.deferred
+    }
+
+def parse_fields(fields: str, model, relations: Optional[Dict[str, Any]] = None) -> List[Tuple[str, Any]]:
+    """
+    Resolve a comma-separated field list into (key, column) pairs.
+
+    Args:
+        fields: Requested fields, e.g. "id,status,job.title"
+        model: Model the plain field names belong to
+        relations: Related models selectable with a "<prefix>." key, e.g. {"job": Job}
+
+    Returns:
+        List of (key, column) pairs in request order, duplicates removed
+
+    Raises:
+        ValueError: If a field is unknown or no fields were given
+    """
+    relations = relations or {}
+    selected, unknown = [], []
+
+    for key in dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()):
+        prefix, _, name = key.rpartition(".")
+        target = relations.get(prefix) if prefix else model
+        columns = selectable_columns(target) if target is not None else {}
+        if name in columns:
+            selected.append((key, columns[name]))
+        else:
+            unknown.append(key)
+
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    if not selected:
+        raise ValueError("No fields requested")
+    return selected
+
+def rows_to_dicts(rows: Sequence[Sequence[Any]], keys: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Map projected row tuples to dicts, nesting dotted keys ("job.title" -> {"job": {"title": ...}}).
+    Only the first len(keys) values of each row are used.
+    """
+    items = []
+    for row in rows:
+        item: Dict[str, Any] = {}
+        for key, value in zip(keys, row):
+            prefix, _, name = key.rpartition(".")
+            (item.setdefault(prefix, {}) if prefix else item)[name] = value
+        items.append(item)
+    return items
@@ -0,0 +1,170 @@
+"""
+Per-request SQL instrumentation.
+
+Cursor execute events on both engines time every statement and add it to the
+QueryStats of the current unit of work (an HTTP request, see
+app.api.query_timing, or a background job wrapped in track_queries). The stats
+live in a context variable, so they follow the request into threadpool workers
+and SQLAlchemy's async greenlets.
+
+Statements slower than SLOW_QUERY_MS are written, normalized and with their
+EXPLAIN plan, to a rotating log file (SLOW_QUERY_LOG_PATH).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from typing import Iterator, Optional
+import logging
+import os
+import re
+import threading
+import time
+
+from sqlalchemy import event
+
+from app.core.config import query_metrics_config
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.db.slow_queries")
+
+# Only these are explained; EXPLAIN without ANALYZE plans them without running them
+EXPLAINABLE = ("select", "insert", "update", "delete", "with")
+
+class QueryStats:
+    """Query count, total database time and slowest statement for one unit of work."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_sql: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed_ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if elapsed_ms > self.slowest_ms:
+                self.slowest_ms = elapsed_ms
+                self.slowest_sql = statement
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. 'db;desc="3 queries";dur=4.2, db-slowest;dur=2.1'."""
+        return f'db;desc="{self.count} queries";dur={self.total_ms:.1f}, db-slowest;dur={self.slowest_ms:.1f}'
+
+    def log_line(self, **fields) -> str:
+        """key=value summary for the application log."""
+        values = {
+            "unit": self.label, **fields, "queries": self.count,
+            "db_ms": f"{self.total_ms:.1f}", "slowest_ms": f"{self.slowest_ms:.1f}",
+            "slowest_sql": normalize_sql(self.slowest_sql)[:200] if self.slowest_sql else None,
+        }
+        return " ".join(f'{key}="{value}"' if isinstance(value, str) and " " in value else f"{key}={value}"
+                        for key, value in values.items())
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the unit of work the caller runs in, None outside of one."""
+    return _current_stats.get()
+
+@contextmanager
+def track_queries(label: str, log: bool = True) -> Iterator[QueryStats]:
+    """
+    Collect query stats for the statements run inside the block.
+
+    Args:
+        label: Name of the unit of work, used in the log line
+        log: Log the summary when the block exits
+    """
+    stats = QueryStats(label)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if log:
+            logger.info(stats.log_line())
+
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:%\(\w+\)s|\$\d+|\?)\s*,)+\s*(?:%\(\w+\)s|\$\d+|\?)\s*\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|\$\d+")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_sql(statement: str) -> str:
+    """Statement shape without literals or parameter names, so repeats of a query group together."""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(...)", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+_slow_log_lock = threading.Lock()
+
+def _slow_query_handler_ready() -> bool:
+    """Attach the rotating file handler on first use, so nothing is created unless a query is slow."""
+    with _slow_log_lock:
+        if not slow_query_logger.handlers:
+            path = query_metrics_config["slow_query_log_path"]
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            handler = RotatingFileHandler(path, maxBytes=query_metrics_config["slow_query_log_max_bytes"],
+                                          backupCount=query_metrics_config["slow_query_log_backups"])
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            slow_query_logger.addHandler(handler)
+            slow_query_logger.setLevel(logging.INFO)
+            slow_query_logger.propagate = False
+    return True
+
+def _explain(dbapi_connection, statement: str, parameters) -> str:
+    """
+    EXPLAIN the statement on its own connection, inside a savepoint so a failing
+    EXPLAIN can't abort the caller's transaction. Uses a separate cursor, the
+    original one still holds the statement's results.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(f"EXPLAIN {statement}", parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            return f"(EXPLAIN failed: {e})"
+    finally:
+        cursor.close()
+
+def _log_slow_query(conn, statement: str, parameters, elapsed_ms: float, executemany: bool):
+    stats = current_query_stats()
+    plan = None
+    if (query_metrics_config["explain_slow_queries"] and not executemany
+            and statement.lstrip().lower().startswith(EXPLAINABLE) and conn.in_transaction()):
+        try:
+            plan = _explain(conn.connection.dbapi_connection, statement, parameters)
+        except Exception as e:
+            plan = f"(EXPLAIN failed: {e})"
+    if _slow_query_handler_ready():
+        slow_query_logger.info(
+            f"unit={stats.label if stats else None} duration_ms={elapsed_ms:.1f} sql={normalize_sql(statement)}"
+            + (f"\n{plan}" if plan else "")
+        )
+
+def attach(engine):
+    """Time every statement on an engine (pass async_engine.sync_engine for the async one)."""
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        stats = current_query_stats()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+        threshold = query_metrics_config["slow_query_ms"]
+        if threshold and elapsed_ms >= threshold:
+            _log_slow_query(conn, statement, parameters, elapsed_ms, executemany)
@@ -39,6 +39,14 @@ class ExperienceLevel(str, Enum):
     senior = "senior"
     lead = "lead"
 
+class SalaryPeriod(str, Enum):
+    """Enumeration of the periods a salary can be quoted per."""
+    hour = "hour"
+    day = "day"
+    week = "week"
+    month = "month"
+    year = "year"
+
 class ApplicationStatus(str, Enum):
     """Enumeration of possible application statuses."""
     pending = "pending"
@@ -73,6 +81,9 @@ class JobRead(JobBase):
     """Schema for reading a job, including nested applications."""
     id: int
     created_at: datetime
+    salary_period: Optional[SalaryPeriod] = None
+    salary_min_aud: Optional[int] = None
+    salary_max_aud: Optional[int] = None
     applications: Optional[List['ApplicationRead']] = None
 
     class Config:
@@ -94,6 +105,7 @@ class JobUpdate(JobBase):
     salary_min: Optional[int] = None
     salary_max: Optional[int] = None
     currency: Optional[str] = None
+    salary_period: Optional['SalaryPeriod'] = None # None to infer the period from the amounts
     visa_sponsorship: Optional[bool] = None
     url: Optional['HttpUrl'] = None
     source: Optional['Source'] = None
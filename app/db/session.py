@@ -1,13 +1,46 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.core.config import SQLALCHEMY_DATABASE_URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.config import SQLALCHEMY_DATABASE_URL, ASYNC_SQLALCHEMY_DATABASE_URL, pool_config, DB_STATEMENT_TIMEOUT_MS, query_metrics_config
 from app.db.models import Base
+from app.db import query_metrics
+from app.db.pool_metrics import PoolMetrics, instrumented_pool
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+# Sync engine for sync endpoints, scripts and Alembic
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=instrumented_pool(QueuePool, sync_pool_metrics),
+    connect_args={"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"} if DB_STATEMENT_TIMEOUT_MS else {},
+    **pool_config,
+)
+sync_pool_metrics.attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for async endpoints so queries don't block the event loop.
+# Objects stay usable after commit since async sessions can't lazy-refresh them.
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    poolclass=instrumented_pool(AsyncAdaptedQueuePool, async_pool_metrics),
+    connect_args={"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}} if DB_STATEMENT_TIMEOUT_MS else {},
+    **pool_config,
+)
+async_pool_metrics.attach(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Per-request query stats and the slow-query log, see app.db.query_metrics
+if query_metrics_config["enabled"]:
+    query_metrics.attach(engine)
+    query_metrics.attach(async_engine.sync_engine)
+
 # Create all tables in the database
 def init_db():
+    # Trigram indexes on jobs need the pg_trgm extension
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
 
 def get_db():
@@ -15,4 +48,15 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def pool_health():
+    """Live pool state and checkout metrics for both engines."""
+    return {
+        "sync": sync_pool_metrics.snapshot(engine.pool),
+        "async": async_pool_metrics.snapshot(async_engine.sync_engine.pool),
+    }
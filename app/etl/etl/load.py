@@ -1,6 +1,44 @@
-from dotenv.main import logger
+import logging
 
-from src.notion.notion_integration import push_job_to_notion
+from app.db.session import SessionLocal
+from app.services.job_service import bulk_upsert_jobs
+
+logger = logging.getLogger(__name__)
+
+
+def load_jobs_to_db(jobs: list) -> dict:
+    """
+    Load transformed jobs into Postgres with a single bulk upsert
+    Args:
+        jobs: list, list of jobs from transform_jobs
+    Returns:
+        dict, inserted/updated/skipped counts
+    """
+    logger.info(f"Loading {len(jobs)} jobs to the database")
+    rows = [
+        {
+            "title": job.get("title"),
+            "company": job.get("company"),
+            "location": job.get("location"),
+            "description": job.get("description"),
+            "url": job.get("url"),
+            "source": job.get("source"),
+            "category": job.get("category"),
+            "salary": str(job["salary"]) if job.get("salary") else None,
+            "posted_date": job.get("date_posted") or None,
+            "method": "automation",
+        }
+        for job in jobs
+    ]
+
+    db = SessionLocal()
+    try:
+        result = bulk_upsert_jobs(db, rows)
+    finally:
+        db.close()
+
+    logger.info(f"Loaded jobs to the database: {result['inserted']} inserted, {result['updated']} updated, {result['skipped']} skipped")
+    return {key: result[key] for key in ("inserted", "updated", "skipped")}
 
 
 def load_jobs_to_notion(jobs: list) -> int: # return number of jobs loaded
@@ -11,17 +49,20 @@ def load_jobs_to_notion(jobs: list) -> int: # return number of jobs loaded
     Returns:
         int, number of jobs loaded
     """
+    # Imported here so database loads don't require the Notion client
+    from app.etl.notion.notion_integration import push_job_to_notion
+
     logger.info(f"Loading {len(jobs)} jobs to Notion")
     success_count = 0
     error_count = 0
-    
+
     for job in jobs:
         is_success = push_job_to_notion(job)
-        if is_success: 
+        if is_success:
             success_count += 1
         else:
             error_count += 1
 
     logger.info(f"Successfully loaded {success_count} jobs to Notion")
     logger.info(f"Failed to load {error_count} jobs to Notion")
-    return success_count
\ No newline at end of file
+    return success_count
@@ -0,0 +1,140 @@
+"""
+Hot/cold archival of expired jobs.
+
+Scraped listings expire within weeks but would otherwise stay in `jobs`
+forever, growing every scan and index. Jobs past JOB_ARCHIVE_AFTER_DAYS
+(by posted date, else created date) that nobody applied to are moved to
+`jobs_archive` in bounded batches. Reads by id or URL fall through to the
+archive, and re-importing an archived URL moves it back to `jobs`.
+
+Jobs with fit scores are kept hot too, archiving would cascade-delete the scores.
+"""
+
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+import logging
+
+from sqlalchemy import DateTime, delete, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import invalidate_jobs
+from app.core.config import JOB_ARCHIVE_AFTER_DAYS
+from app.db.models import Application, FitScore, Job, JobArchive, utcnow
+
+logger = logging.getLogger(__name__)
+
+# Jobs moved per statement (and transaction)
+JOB_ARCHIVE_BATCH_SIZE = 500
+
+# Columns copied between the tiers, archive-only columns such as archived_at excluded
+ARCHIVED_COLUMNS = [column.name for column in JobArchive.__table__.columns if column.name in Job.__table__.columns]
+
+def _archive_batch_statement(cutoff, batch_size: int, archived_at):
+    """
+    INSERT INTO jobs_archive ... SELECT FROM (DELETE FROM jobs ... RETURNING *) for one batch.
+    Candidate rows are locked with SKIP LOCKED so jobs being written elsewhere wait for a later run.
+    """
+    eligible = (
+        select(Job.id)
+        .where(
+            func.coalesce(Job.posted_date, Job.created_at) < cutoff,
+            ~exists().where(Application.job_id == Job.id),
+            ~exists().where(FitScore.job_id == Job.id),
+        )
+        .order_by(Job.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    moved = (
+        delete(Job).where(Job.id.in_(eligible))
+        .returning(*[Job.__table__.c[name] for name in ARCHIVED_COLUMNS])
+        .cte("moved")
+    )
+    # INSERT ... SELECT doesn't run Python-side column defaults, so archived_at is selected explicitly
+    return (
+        insert(JobArchive)
+        .from_select(
+            [*ARCHIVED_COLUMNS, "archived_at"],
+            select(*[moved.c[name] for name in ARCHIVED_COLUMNS], literal(archived_at, DateTime)),
+        )
+        .returning(JobArchive.id, JobArchive.url_hash)
+    )
+
+def restore_jobs_statement(url_hashes: Iterable[str]):
+    """
+    Statement moving archived jobs with these URL hashes back to `jobs`, keeping their ids.
+    If a live job already has the URL, the live one wins and the archived copy is dropped.
+    Returns (id, url_hash) for each restored job. Works with sync and async sessions.
+    """
+    restored = (
+        delete(JobArchive).where(JobArchive.url_hash.in_(list(url_hashes)))
+        .returning(*[JobArchive.__table__.c[name] for name in ARCHIVED_COLUMNS])
+        .cte("restored")
+    )
+    return (
+        insert(Job)
+        .from_select(ARCHIVED_COLUMNS, select(*[restored.c[name] for name in ARCHIVED_COLUMNS]))
+        .on_conflict_do_nothing()
+        .returning(Job.id, Job.url_hash)
+    )
+
+def restore_jobs(db: Session, url_hashes: Iterable[str]) -> List[int]:
+    """
+    Move archived jobs with these URL hashes back to `jobs` within the caller's transaction.
+
+    Returns:
+        Ids of the restored jobs
+    """
+    url_hashes = list(url_hashes)
+    if not url_hashes:
+        return []
+    rows = db.execute(restore_jobs_statement(url_hashes)).all()
+    if rows:
+        logger.info(f"Restored {len(rows)} archived jobs")
+    return [job_id for job_id, _ in rows]
+
+def archive_jobs(
+    db: Session,
+    older_than_days: Optional[int] = None,
+    batch_size: int = JOB_ARCHIVE_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Move expired jobs with no applications or fit scores to jobs_archive.
+
+    Each batch is one statement in its own short transaction, so the run can be
+    stopped at any point and resumed later.
+
+    Args:
+        db: Database session
+        older_than_days: Age threshold, defaults to JOB_ARCHIVE_AFTER_DAYS
+        batch_size: Jobs moved per batch
+        max_batches: Stop after this many batches, None to run until nothing is left
+
+    Returns:
+        Dictionary with archived and batches counts
+    """
+    days = JOB_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    now = utcnow()
+    stmt = _archive_batch_statement(now - timedelta(days=days), batch_size, archived_at=now)
+
+    totals = {"archived": 0, "batches": 0}
+    while max_batches is None or totals["batches"] < max_batches:
+        try:
+            rows = db.execute(stmt).all()
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        if not rows:
+            break
+
+        # Cached entries describe the hot row, drop them so reads pick up the archived one
+        invalidate_jobs([job_id for job_id, _ in rows], [job_url_hash for _, job_url_hash in rows])
+        totals["archived"] += len(rows)
+        totals["batches"] += 1
+        logger.info(f"Archived batch {totals['batches']}: {len(rows)} jobs")
+
+    logger.info(f"Archived {totals['archived']} jobs older than {days} days in {totals['batches']} batches")
+    return totals
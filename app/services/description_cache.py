@@ -0,0 +1,86 @@
+"""
+Content-addressed cache of job description processing.
+
+Reposts and re-scrapes bring the same description text over and over. Its
+processing output (sections, keywords, tech stack, counts) and AI enrichment
+are stored once in `processed_descriptions` under the SHA-256 of the raw text,
+so imports only run process_job_description on text not yet processed with the
+current PROCESSOR_VERSION, and only call the LLM on text never enriched.
+
+Statements are built here and executed by the caller, so they work with sync
+and async sessions alike.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.text_processor import PROCESSOR_VERSION, clean_job_description
+from app.core.utils import description_hash
+from app.db.models import ProcessedDescription, utcnow
+
+# process_job_description output kept in the cache, description_clean is rebuilt instead
+CACHED_FIELDS = ("description_structured", "keywords", "tech_stack", "word_count", "line_count")
+
+def lookup_statement(description_hashes: Iterable[str]):
+    """Cache rows for these description hashes, stale ones included."""
+    return select(ProcessedDescription).where(ProcessedDescription.description_hash.in_(list(description_hashes)))
+
+def cached_processing(entry: Optional[ProcessedDescription], description: str) -> Optional[Dict[str, Any]]:
+    """
+    process_job_description output rebuilt from a cache row.
+
+    Returns:
+        Processed description data, or None if there is no row or it is from an older PROCESSOR_VERSION
+    """
+    if entry is None or entry.processor_version != PROCESSOR_VERSION:
+        return None
+    # Cleaning is one linear pass, cheaper than storing every description a second time
+    return {
+        "description_clean": clean_job_description(description),
+        **{field: getattr(entry, field) for field in CACHED_FIELDS},
+    }
+
+def store_processing_statement(processed_by_hash: Dict[str, Dict[str, Any]]):
+    """
+    Upsert fresh processing output by description hash.
+    Enrichment already stored for a description is kept when its processing is redone.
+    """
+    stmt = insert(ProcessedDescription).values([
+        {"description_hash": key, "processor_version": PROCESSOR_VERSION, **{field: processed[field] for field in CACHED_FIELDS}}
+        for key, processed in processed_by_hash.items()
+    ])
+    return stmt.on_conflict_do_update(
+        index_elements=[ProcessedDescription.description_hash],
+        set_={
+            **{column: stmt.excluded[column] for column in ("processor_version", *CACHED_FIELDS)},
+            "updated_at": utcnow(),
+        },
+    )
+
+def store_enrichment_statement(key: str, enriched_data: Dict[str, Any]):
+    """Remember the AI enrichment of a description."""
+    return (
+        update(ProcessedDescription)
+        .where(ProcessedDescription.description_hash == key)
+        .values(enriched_data=enriched_data, updated_at=utcnow())
+    )
+
+def load_cached_processing(db: Session, descriptions: Iterable[Optional[str]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Processed description data for the descriptions already in the cache, in one query.
+
+    Returns:
+        Dictionary of description hash -> processed description data, cache misses left out
+    """
+    by_hash = {description_hash(description): description for description in descriptions if description}
+    if not by_hash:
+        return {}
+    cached = {}
+    for entry in db.scalars(lookup_statement(by_hash)):
+        processed = cached_processing(entry, by_hash[entry.description_hash])
+        if processed is not None:
+            cached[entry.description_hash] = processed
+    return cached
@@ -0,0 +1,143 @@
+"""
+Job search query building.
+
+Translates search filters into SQLAlchemy statements so the search endpoint
+and any other caller share one definition of what a filter set matches.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+from sqlalchemy import Select, func, or_, select, tuple_
+from app.db.models import Job
+
+# Text search configuration, must match the one used by Job.search_vector
+SEARCH_CONFIG = "english"
+
+# Columns that get per-value counts next to search results
+FACET_COLUMNS = {
+    "work_mode": Job.work_mode,
+    "work_type": Job.work_type,
+    "experience_level": Job.experience_level,
+    "category": Job.category,
+    "source": Job.source,
+    "visa_sponsorship": Job.visa_sponsorship,
+}
+
+def keyword_tsquery(keywords: str):
+    """
+    Build a tsquery from free text using web search syntax.
+    Supports quoted phrases, 'or' and '-exclusions' as typed by users.
+    """
+    return func.websearch_to_tsquery(SEARCH_CONFIG, keywords)
+
+def fuzzy_match(column, value: str):
+    """
+    Match a text column against a partial or misspelled value.
+    Combines a case-insensitive substring match with pg_trgm word similarity
+    (e.g. "Melb" matches "Melbourne VIC 3000"), both served by the trigram index.
+    """
+    return or_(column.icontains(value, autoescape=True), column.op("%>")(value))
+
+def fuzzy_rank(column, value: str):
+    """Similarity score used to order fuzzy matches, best first."""
+    return func.word_similarity(value, column)
+
+def apply_search_filters(stmt: Select, params) -> Select:
+    """
+    Apply the filters from a JobSearchParams-like object to a statement.
+    
+    Args:
+        stmt: Statement selecting from jobs
+        params: Object exposing the search filter attributes
+        
+    Returns:
+        Statement with WHERE clauses for every filter that is set
+    """
+    if params.keywords:
+        stmt = stmt.where(Job.search_vector.op("@@")(keyword_tsquery(params.keywords)))
+    
+    if params.company:
+        stmt = stmt.where(fuzzy_match(Job.company, params.company))
+    
+    if params.location:
+        stmt = stmt.where(fuzzy_match(Job.location, params.location))
+    
+    if params.visa_sponsorship is not None:
+        stmt = stmt.where(Job.visa_sponsorship == params.visa_sponsorship)
+    
+    if params.work_mode:
+        stmt = stmt.where(Job.work_mode == params.work_mode)
+    
+    if params.work_type:
+        stmt = stmt.where(Job.work_type == params.work_type)
+    
+    if params.experience_level:
+        stmt = stmt.where(Job.experience_level == params.experience_level)
+
+    if params.salary_min_aud is not None or params.salary_max_aud is not None:
+        # Band overlap on the GiST-indexed range, a missing bound is open-ended
+        band = func.int4range(params.salary_min_aud, params.salary_max_aud, "[]")
+        stmt = stmt.where(Job.salary_range_aud.op("&&")(band))
+    
+    return stmt
+
+def build_search_statement(params) -> Select:
+    """
+    Build the full search query: filters, relevance ordering and limit.
+    Keyword searches are ranked by ts_rank_cd, then by company and location
+    similarity when those filters are fuzzy-matched; otherwise newest jobs come first.
+    """
+    stmt = apply_search_filters(select(Job), params)
+    
+    ranking = []
+    if params.keywords:
+        ranking.append(func.ts_rank_cd(Job.search_vector, keyword_tsquery(params.keywords)).desc())
+    if params.company:
+        ranking.append(fuzzy_rank(Job.company, params.company).desc())
+    if params.location:
+        ranking.append(fuzzy_rank(Job.location, params.location).desc())
+    
+    if ranking:
+        stmt = stmt.order_by(*ranking, Job.id.desc())
+    else:
+        stmt = stmt.order_by(Job.created_at.desc(), Job.id.desc())
+    
+    return stmt.limit(params.limit)
+
+def build_facet_statement(params) -> Select:
+    """
+    Count matching jobs per value of every facet column in one query.
+
+    Uses GROUPING SETS with one set per facet plus the empty set for the total.
+    GROUPING() over all facet columns returns a bitmask with a 1 for each column
+    the row is *not* grouped by, which tells the rows of each set apart.
+    """
+    columns = list(FACET_COLUMNS.values())
+    stmt = select(*columns, func.grouping(*columns).label("grouping"), func.count().label("count"))
+    stmt = apply_search_filters(stmt.select_from(Job), params)
+    return stmt.group_by(func.grouping_sets(*[tuple_(column) for column in columns], tuple_()))
+
+def facet_counts(rows: Sequence[Sequence[Any]]) -> Tuple[int, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Turn build_facet_statement rows into (total, facets).
+
+    Returns:
+        Total matching jobs and, per facet, a list of {"value", "count"} sorted by count
+    """
+    names = list(FACET_COLUMNS)
+    all_bits = (1 << len(names)) - 1
+    # The set grouped by column i has every bit set except that column's
+    facet_for_mask = {all_bits ^ (1 << (len(names) - 1 - i)): i for i in range(len(names))}
+
+    total = 0
+    facets: Dict[str, List[Dict[str, Any]]] = {name: [] for name in names}
+    for row in rows:
+        *values, mask, count = row
+        if mask == all_bits:
+            total = count
+        elif mask in facet_for_mask:
+            index = facet_for_mask[mask]
+            facets[names[index]].append({"value": values[index], "count": count})
+
+    for counts in facets.values():
+        counts.sort(key=lambda item: (-item["count"], str(item["value"])))
+    return total, facets
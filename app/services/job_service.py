@@ -1,6 +1,308 @@
-from app.db.models import Job
-from app.db.session import db
+"""
+Job persistence services shared by the API endpoints and the ETL
+"""
 
-# def create_job_with_enrichment(job_data: JobCreate):
-#     job = Job(**job_data.model_dump())
-#     return job
\ No newline at end of file
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from pydantic import ValidationError
+from sqlalchemy import delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.text_processor import process_job_description, parse_salary, parse_posted_date
+from app.core.cache import invalidate_jobs, invalidate_applications
+from app.core.salary import normalize_salary
+from app.core.utils import description_hash, url_hash
+from app.db.models import Application, FitScore, Job, JobArchive, utcnow
+from app.services.archival import restore_jobs
+from app.services.description_cache import load_cached_processing, store_processing_statement
+from app.db.schemas import JobCreate
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT ... ON CONFLICT statement in a bulk import
+BULK_UPSERT_CHUNK_SIZE = 1000
+
+# Columns refreshed from the listing when a bulk import hits an existing job.
+# Classification fields are left alone so AI enrichment isn't overwritten by defaults.
+BULK_UPSERT_UPDATE_COLUMNS = (
+    "title", "description", "company", "location", "salary_min", "salary_max",
+    "salary_period", "salary_min_aud", "salary_max_aud", "posted_date", "description_hash",
+)
+
+# Jobs removed per DELETE statement (and transaction) in a bulk delete
+BULK_DELETE_BATCH_SIZE = 500
+
+def build_job_record(
+    job: Dict[str, Any], processed_description: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Process raw job data into Job column values.
+
+    Args:
+        job: Raw job fields as sent by the extension or produced by the ETL
+             (title/role, company, location, description, salary, posted_date, url, ...)
+        processed_description: Cached processing of the description, see app.services.description_cache;
+                               None runs process_job_description
+
+    Returns:
+        Tuple of (column values for Job, processed description data)
+
+    Raises:
+        ValidationError: If the job is missing required fields
+    """
+    if processed_description is None:
+        processed_description = process_job_description(job.get("description")) if job.get("description") else {}
+
+    # Parse salary and date using text processor
+    salary_data = parse_salary(job.get("salary"))
+    posted_date = parse_posted_date(job.get("posted_date")) if job.get("posted_date") else None
+
+    job_create = JobCreate(
+        title=job.get("title") or job.get("role"),
+        description=processed_description.get("description_clean", job.get("description")),
+        company=job.get("company"),
+        location=job.get("location"),
+        url=job.get("url"),
+        source=job.get("source") or "extension",
+        category=job.get("category") or "other",
+        salary_min=salary_data["salary_min"],
+        salary_max=salary_data["salary_max"],
+        tech_stack=job.get("tech_stack") or processed_description.get("tech_stack") or None,
+    )
+
+    # JSON mode turns HttpUrl and enum values into plain strings for storage
+    record = job_create.model_dump(mode="json")
+    record["url_hash"] = url_hash(job["url"])
+    record["description_hash"] = description_hash(job["description"]) if job.get("description") else None
+    record["salary_period"] = salary_data["salary_period"]
+    # Core inserts skip the ORM events that keep these in sync, so set them here
+    record.update(normalize_salary(record["salary_min"], record["salary_max"], record["currency"], record["salary_period"]))
+    record["method"] = job.get("method") or "manual"
+    record["posted_date"] = datetime.fromisoformat(posted_date) if posted_date else None
+    return record, processed_description
+
+def bulk_upsert_jobs(db: Session, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Insert or refresh many jobs in a single transaction.
+
+    Rows are written with multi-row INSERT ... ON CONFLICT (url_hash) DO UPDATE,
+    so re-importing a listing refreshes it instead of duplicating it. Descriptions
+    already in the processing cache aren't processed again.
+
+    Args:
+        db: Database session, committed on success and rolled back on error
+        jobs: Raw job dicts, same fields as build_job_record
+
+    Returns:
+        Dictionary with inserted/updated/skipped counts and a per-row result list
+    """
+    results: List[Dict[str, Any]] = [None] * len(jobs)
+    rows_by_hash: Dict[str, int] = {}
+    records = []
+    cached = load_cached_processing(db, [job.get("description") for job in jobs])
+    fresh: Dict[str, Dict[str, Any]] = {}
+
+    for index, job in enumerate(jobs):
+        try:
+            key = description_hash(job["description"]) if job.get("description") else None
+            record, processed = build_job_record(job, cached.get(key))
+        except (ValidationError, ValueError, KeyError) as e:
+            results[index] = {"index": index, "status": "skipped", "job_id": None, "error": str(e)}
+            continue
+
+        # ON CONFLICT can't touch the same row twice in one statement
+        if record["url_hash"] in rows_by_hash:
+            results[index] = {
+                "index": index, "status": "skipped", "job_id": None,
+                "error": f"Duplicate of row {rows_by_hash[record['url_hash']]}",
+            }
+            continue
+
+        rows_by_hash[record["url_hash"]] = index
+        records.append(record)
+        if key and key not in cached:
+            fresh[key] = processed
+
+    try:
+        fresh_items = list(fresh.items())
+        for start in range(0, len(fresh_items), BULK_UPSERT_CHUNK_SIZE):
+            db.execute(store_processing_statement(dict(fresh_items[start:start + BULK_UPSERT_CHUNK_SIZE])))
+        for start in range(0, len(records), BULK_UPSERT_CHUNK_SIZE):
+            chunk = records[start:start + BULK_UPSERT_CHUNK_SIZE]
+            # Archived listings come back under their old id and are then refreshed like any existing job
+            restore_jobs(db, [record["url_hash"] for record in chunk])
+
+            stmt = insert(Job).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Job.url_hash],
+                set_={
+                    **{column: stmt.excluded[column] for column in BULK_UPSERT_UPDATE_COLUMNS},
+                    "updated_at": utcnow(),
+                },
+            ).returning(Job.id, Job.url_hash, literal_column("xmax = 0").label("inserted"))
+
+            for job_id, job_url_hash, inserted in db.execute(stmt):
+                index = rows_by_hash[job_url_hash]
+                results[index] = {
+                    "index": index, "status": "inserted" if inserted else "updated",
+                    "job_id": job_id, "error": None,
+                }
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    invalidate_jobs(
+        [result["job_id"] for result in results if result["status"] == "updated"],
+        rows_by_hash.keys(),
+    )
+
+    counts = {"inserted": 0, "updated": 0, "skipped": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    logger.info(f"Bulk job import: {counts['inserted']} inserted, {counts['updated']} updated, {counts['skipped']} skipped")
+
+    return {**counts, "results": results}
+
+def _delete_jobs_returning_counts(db: Session, jobs_to_delete) -> List[Any]:
+    """
+    Delete the jobs selected by a subquery in one DELETE ... RETURNING statement.
+
+    Applications and fit scores go with them through the ON DELETE CASCADE
+    foreign keys. The counts are read in the same statement, which sees the
+    rows as they were before the delete, so they are the cascaded row counts.
+
+    Returns:
+        Rows of (id, url_hash, application_count, fit_score_count)
+    """
+    deleted = (
+        delete(Job).where(Job.id.in_(jobs_to_delete))
+        .returning(Job.id, Job.url_hash)
+        .cte("deleted")
+    )
+    application_count = (
+        select(func.count()).select_from(Application)
+        .where(Application.job_id == deleted.c.id).scalar_subquery()
+    )
+    fit_score_count = (
+        select(func.count()).select_from(FitScore)
+        .where(FitScore.job_id == deleted.c.id).scalar_subquery()
+    )
+    stmt = select(deleted.c.id, deleted.c.url_hash, application_count, fit_score_count)
+    return db.execute(stmt).all()
+
+def _invalidate_deleted_jobs(rows: List[Any]) -> None:
+    job_ids = [row[0] for row in rows]
+    invalidate_jobs(job_ids, [row[1] for row in rows])
+    invalidate_applications(job_ids)
+
+def delete_job_cascade(db: Session, job_id: int) -> Optional[Dict[str, int]]:
+    """
+    Delete a job with its applications and fit scores in a single round trip.
+    Falls through to the archive when the job is no longer hot.
+
+    Returns:
+        Dictionary with application_count and fit_score_count, or None if the job doesn't exist
+    """
+    try:
+        rows = _delete_jobs_returning_counts(db, select(Job.id).where(Job.id == job_id))
+        if not rows:
+            archived = db.execute(
+                delete(JobArchive).where(JobArchive.id == job_id).returning(JobArchive.id, JobArchive.url_hash)
+            ).first()
+            rows = [(*archived, 0, 0)] if archived else []
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    if not rows:
+        return None
+    _invalidate_deleted_jobs(rows)
+    _, _, application_count, fit_score_count = rows[0]
+    return {"application_count": application_count, "fit_score_count": fit_score_count}
+
+def bulk_delete_jobs(
+    db: Session,
+    ids: Optional[List[int]] = None,
+    source: Optional[str] = None,
+    older_than: Optional[datetime] = None,
+    batch_size: int = BULK_DELETE_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Delete jobs matching all given criteria, in batches.
+
+    Each batch picks its rows with FOR UPDATE SKIP LOCKED and commits on its
+    own, so pruning never holds long locks and skips jobs another transaction
+    is working on (they are left for a later run). Like delete_job_cascade,
+    matching archived jobs are deleted too, once the hot ones are done.
+
+    Args:
+        db: Database session
+        ids: Only these job ids
+        source: Only jobs from this source, e.g. 'seek'
+        older_than: Only jobs created before this time
+        batch_size: Jobs deleted per statement
+
+    Returns:
+        Dictionary with deleted (hot and archived), archived_deleted, applications_deleted,
+        fit_scores_deleted and batches counts
+
+    Raises:
+        ValueError: If no criteria are given
+    """
+    if ids is None and source is None and older_than is None:
+        raise ValueError("At least one of ids, source or older_than is required")
+    if older_than is not None and older_than.tzinfo:
+        older_than = older_than.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def batch(model):
+        criteria = []
+        if ids is not None:
+            criteria.append(model.id.in_(ids))
+        if source is not None:
+            criteria.append(model.source == source)
+        if older_than is not None:
+            criteria.append(model.created_at < older_than)
+        return (
+            select(model.id).where(*criteria)
+            .order_by(model.id).limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+    def delete_archived(archived_batch):
+        # Archived jobs have no applications or fit scores left
+        deleted = db.execute(
+            delete(JobArchive).where(JobArchive.id.in_(archived_batch)).returning(JobArchive.id, JobArchive.url_hash)
+        ).all()
+        return [(*row, 0, 0) for row in deleted]
+
+    totals = {"deleted": 0, "archived_deleted": 0, "applications_deleted": 0, "fit_scores_deleted": 0, "batches": 0}
+    for archived in (False, True):
+        while True:
+            try:
+                rows = delete_archived(batch(JobArchive)) if archived else _delete_jobs_returning_counts(db, batch(Job))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            if not rows:
+                break
+
+            _invalidate_deleted_jobs(rows)
+            totals["batches"] += 1
+            totals["deleted"] += len(rows)
+            if archived:
+                totals["archived_deleted"] += len(rows)
+            totals["applications_deleted"] += sum(row[2] for row in rows)
+            totals["fit_scores_deleted"] += sum(row[3] for row in rows)
+
+    logger.info(
+        f"Bulk job delete: {totals['deleted']} jobs ({totals['archived_deleted']} archived), "
+        f"{totals['applications_deleted']} applications, "
+        f"{totals['fit_scores_deleted']} fit scores in {totals['batches']} batches"
+    )
+    return totals
@@ -0,0 +1,143 @@
+"""
+Batch reprocessing of stored job descriptions.
+
+After the keyword taxonomy in app.core.text_processor changes, or skills are
+added to app/core/tech_taxonomy.json, the tech_stack of every stored job has
+to be extracted again. Jobs are read in id order in chunks, their descriptions
+matched against the taxonomy in parallel on a process pool, and the new stack
+is written back with one bulk UPDATE per chunk. The stack is rebuilt from the
+description plus the AI enrichment stored for it in processed_descriptions, so
+renamed or removed skills go away while skills only the AI found are kept.
+The description itself is never rewritten (enrichment may have replaced it
+with formatted text that cleaning would mangle), and only jobs whose stack
+actually changes are updated. A checkpoint file records the last finished id,
+so an interrupted run picks up where it stopped.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional
+import json
+import logging
+import os
+import time
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import invalidate_jobs
+from app.core.tech_taxonomy import extract_tech_stack, normalize_tech_stack
+from app.core.text_processor import BATCH_CHUNK_SIZE
+from app.db.models import Job, ProcessedDescription, utcnow
+
+logger = logging.getLogger(__name__)
+
+# Jobs read, processed and written back per chunk (and transaction)
+REPROCESS_BATCH_SIZE = 500
+
+def load_checkpoint(path: Optional[str]) -> Dict[str, Any]:
+    """Progress saved by an earlier run, empty if there is none."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]):
+    """Write the checkpoint atomically, a crash mid-write leaves the previous one."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+def _reprocessed_values(job, extracted: List[str]) -> Dict[str, Any]:
+    """Derived columns of a job that change with the new extraction."""
+    values = {}
+    # Skills from the description first, then the ones AI enrichment found, as at import
+    enriched = (job.enriched_data or {}).get("tech_stack") or []
+    tech_stack = normalize_tech_stack([*extracted, *enriched])
+    if tech_stack != (job.tech_stack or []):
+        values["tech_stack"] = tech_stack or None
+    return values
+
+def reprocess_jobs(
+    db: Session,
+    batch_size: int = REPROCESS_BATCH_SIZE,
+    workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    max_batches: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Reprocess the descriptions of all hot jobs and store the results.
+
+    Args:
+        db: Database session, committed after every chunk
+        batch_size: Jobs per chunk
+        workers: Worker processes, None for one per CPU, 1 (or less) to process in this process
+        checkpoint_path: File to resume from and save progress to, None to always start over
+        max_batches: Stop after this many chunks, None to run until every job is done
+
+    Returns:
+        Dictionary with processed, updated, batches, last_id, seconds and jobs_per_second
+    """
+    checkpoint = load_checkpoint(checkpoint_path)
+    totals = {"processed": 0, "updated": 0, "batches": 0, "last_id": checkpoint.get("last_id", 0)}
+    if totals["last_id"]:
+        logger.info(f"Resuming reprocessing after job {totals['last_id']}")
+
+    finished = False
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers is None or workers > 1 else nullcontext()
+    with pool as executor:
+        while max_batches is None or totals["batches"] < max_batches:
+            jobs = db.execute(
+                select(Job.id, Job.description, Job.tech_stack, ProcessedDescription.enriched_data)
+                .outerjoin(ProcessedDescription, ProcessedDescription.description_hash == Job.description_hash)
+                .where(Job.id > totals["last_id"], Job.description.isnot(None))
+                .order_by(Job.id)
+                .limit(batch_size)
+            ).all()
+            if not jobs:
+                finished = True
+                break
+
+            descriptions = [job.description for job in jobs]
+            if executor is None:
+                results = [extract_tech_stack(description) for description in descriptions]
+            else:
+                results = list(executor.map(extract_tech_stack, descriptions, chunksize=BATCH_CHUNK_SIZE))
+            updates = []
+            for job, extracted in zip(jobs, results):
+                values = _reprocessed_values(job, extracted)
+                if values:
+                    updates.append({"id": job.id, **values, "updated_at": utcnow()})
+
+            try:
+                if updates:
+                    # ORM bulk UPDATE by primary key: one executemany for the chunk
+                    db.execute(update(Job), updates)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            invalidate_jobs([values["id"] for values in updates])
+
+            totals["processed"] += len(jobs)
+            totals["updated"] += len(updates)
+            totals["batches"] += 1
+            totals["last_id"] = jobs[-1].id
+            if checkpoint_path:
+                save_checkpoint(checkpoint_path, {"last_id": totals["last_id"]})
+
+            elapsed = time.perf_counter() - start
+            logger.info(f"Reprocessed batch {totals['batches']}: {len(jobs)} jobs, {len(updates)} updated, "
+                        f"{totals['processed'] / elapsed:.0f} jobs/s")
+
+    # A complete run clears the checkpoint so the next rules change starts from the first job
+    if finished and checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    totals["seconds"] = round(time.perf_counter() - start, 3)
+    totals["jobs_per_second"] = round(totals["processed"] / totals["seconds"], 1) if totals["seconds"] else 0.0
+    logger.info(f"Reprocessed {totals['processed']} jobs ({totals['updated']} updated) in {totals['seconds']}s, "
+                f"{totals['jobs_per_second']} jobs/s")
+    return totals
@@ -19,6 +19,9 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints import jobs, applications, metadata, mcp_tools, resumes
+from app.api.compression import CompressionMiddleware
+from app.api.query_timing import QueryTimingMiddleware
+from app.core.config import RESPONSE_COMPRESSION, RESPONSE_COMPRESSION_MIN_BYTES, query_metrics_config
 import logging
 
 # FastAPI app setup
@@ -45,6 +48,14 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Compress large JSON/NDJSON responses (brotli when available, else gzip)
+if RESPONSE_COMPRESSION:
+    app.add_middleware(CompressionMiddleware, minimum_size=RESPONSE_COMPRESSION_MIN_BYTES)
+
+# Query count and database time per request as Server-Timing headers and log lines
+if query_metrics_config["enabled"]:
+    app.add_middleware(QueryTimingMiddleware)
+
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
@@ -71,6 +82,12 @@ def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "cors": "enabled"}
 
+@app.get("/health/db")
+def db_health_check():
+    """Connection pool health for the sync and async database engines"""
+    from app.db.session import pool_health
+    return pool_health()
+
 @app.get("/test-db")
 def test_db():
     """Test database connection"""
@@ -0,0 +1,34 @@
+"""
+Move expired jobs with no applications to the jobs_archive table.
+
+Usage:
+    python -m scripts.archive_jobs                      # JOB_ARCHIVE_AFTER_DAYS, until done
+    python -m scripts.archive_jobs --days 30 --max-batches 10
+
+Safe to run from cron: every batch commits on its own, so an interrupted
+run just leaves the remaining jobs for the next one.
+"""
+
+import argparse
+import logging
+
+from app.db.session import SessionLocal
+from app.services.archival import JOB_ARCHIVE_BATCH_SIZE, archive_jobs
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive expired jobs")
+    parser.add_argument("--days", type=int, default=None, help="Age threshold in days (default: JOB_ARCHIVE_AFTER_DAYS)")
+    parser.add_argument("--batch-size", type=int, default=JOB_ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    db = SessionLocal()
+    try:
+        result = archive_jobs(db, args.days, args.batch_size, args.max_batches)
+    finally:
+        db.close()
+    print(f"Archived {result['archived']} jobs in {result['batches']} batches")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark response serialization for the large list endpoints.
+
+Compares, at 1k and 10k rows:
+    default  what FastAPI does with response_model: validate every ORM row
+             against the schema, dump it and encode with the stdlib json module
+    fast     FAST_JSON_RESPONSES path: read fields off the rows (no validation)
+             and encode with orjson when it is installed
+
+and reports p50/p99 latency plus the gzip/brotli compressed sizes.
+Rows are transient ORM objects, so no database is needed.
+
+Usage:
+    python -m scripts.bench_serialization [--rows 1000 10000] [--runs 30]
+"""
+
+from datetime import datetime, timedelta
+from statistics import quantiles
+from typing import List
+import argparse
+import time
+import zlib
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.api.compression import brotli
+from app.api.responses import FastJSONResponse, dump_orm_list, orjson
+from app.db.models import Application, Job, Resume
+from app.db.schemas import ApplicationRead, JobBase
+
+DESCRIPTION = (
+    "We are looking for a Python developer to build data pipelines and APIs. "
+    "You will work with PostgreSQL, FastAPI, AWS and Docker in an agile team. "
+) * 8
+
+def make_jobs(count: int) -> List[Job]:
+    created = datetime(2026, 1, 1)
+    return [
+        Job(
+            id=i, title=f"Senior Python Developer {i}", description=DESCRIPTION, company="Acme",
+            location="Melbourne VIC", work_mode="hybrid", work_type="full-time", experience_level="senior",
+            category="software-engineer", salary_min=120000, salary_max=150000, currency="AUD",
+            visa_sponsorship=False, url=f"https://www.seek.com.au/job/{i}", source="seek",
+            tech_stack=["python", "postgresql", "aws"], created_at=created + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+def make_applications(count: int) -> List[Application]:
+    """Applications with job and resume attached the way the application_read profile loads them."""
+    resume = Resume(id=1, name="Resume", file_url="https://example.com/r.pdf", file_type="pdf",
+                    created_at=datetime(2026, 1, 1))
+    set_committed_value(resume, "applications", [])
+    applications = []
+    for job in make_jobs(count):
+        application = Application(id=job.id, job_id=job.id, resume_id=1, status="applied",
+                                  applied_at=job.created_at, notes="Applied via extension")
+        # Committed values skip the backrefs, like noload(Job.applications) in the profile
+        set_committed_value(job, "applications", [])
+        set_committed_value(application, "job", job)
+        set_committed_value(application, "resume", resume)
+        applications.append(application)
+    return applications
+
+def default_path(rows, adapter: TypeAdapter) -> bytes:
+    validated = adapter.validate_python(rows, from_attributes=True)
+    return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+def fast_path(rows, schema) -> bytes:
+    return FastJSONResponse(dump_orm_list(rows, schema)).body
+
+def measure(func, runs: int) -> tuple:
+    """Return (p50, p99) in milliseconds over the given number of runs."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    cuts = quantiles(timings, n=100)
+    return cuts[49], cuts[98]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list endpoint serialization")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"orjson: {'yes' if orjson else 'no (stdlib json fallback)'}, brotli: {'yes' if brotli else 'no'}\n")
+    print(f"{'payload':<22}{'rows':>7}{'default p50/p99 ms':>22}{'fast p50/p99 ms':>20}{'speedup':>9}"
+          f"{'raw KB':>9}{'gzip KB':>9}{'br KB':>8}")
+
+    for name, factory, schema in (("jobs (JobBase)", make_jobs, JobBase),
+                                  ("applications (nested)", make_applications, ApplicationRead)):
+        adapter = TypeAdapter(List[schema])
+        for count in args.rows:
+            rows = factory(count)
+            default_p50, default_p99 = measure(lambda: default_path(rows, adapter), args.runs)
+            fast_p50, fast_p99 = measure(lambda: fast_path(rows, schema), args.runs)
+
+            body = fast_path(rows, schema)
+            gzip_kb = len(zlib.compress(body, 6)) / 1024
+            br_kb = f"{len(brotli.compress(body, quality=4)) / 1024:8.0f}" if brotli else f"{'-':>8}"
+            print(f"{name:<22}{count:>7}{default_p50:>12.1f} /{default_p99:>7.1f}{fast_p50:>11.1f} /{fast_p99:>6.1f}"
+                  f"{default_p50 / fast_p50:>8.1f}x{len(body) / 1024:>9.0f}{gzip_kb:>9.0f}{br_kb}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark the job description text processing stages.
+
+Runs each stage over the sample Seek descriptions in tests/fixtures, repeated
+to typical scraped sizes, and compares it with the implementation it
+replaced (kept below as legacy_*). Reports p50/p99 latency per call.
+
+The salary and date parsers are timed over an ETL-like batch: 10k rows
+drawing on a few hundred distinct labels, cold (empty memo) and warm.
+
+Usage:
+    python -m scripts.bench_text_processor [--sizes 5 20 50] [--runs 200]
+"""
+
+from datetime import datetime
+from pathlib import Path
+from statistics import quantiles
+from typing import Dict, List, Optional
+import argparse
+import random
+import re
+import time
+
+from app.core.text_processor import (
+    _parse_posted_date, _parse_salary, clean_job_description, extract_job_sections, parse_posted_date, parse_salary,
+)
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "job_descriptions"
+
+def legacy_clean_job_description(description: str) -> str:
+    """clean_job_description before the single-pass rewrite: replace, split, per-line re.sub, join, re.sub."""
+    if not description:
+        return ""
+    text = description.replace('\r\n', '\n').replace('\r', '\n')
+    cleaned_lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if line:
+            cleaned_lines.append(re.sub(r'\s+', ' ', line))
+    cleaned_text = '\n'.join(cleaned_lines)
+    cleaned_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_text)
+    return cleaned_text.strip()
+
+def legacy_extract_job_sections(description: str) -> Dict[str, str]:
+    """extract_job_sections before the compiled segmenter: substring scans and += per line."""
+    sections = {"about": "", "requirements": "", "responsibilities": "", "benefits": "", "other": ""}
+    current_section = "other"
+    for line in description.split('\n'):
+        line_lower = line.lower().strip()
+        if any(keyword in line_lower for keyword in ['about', 'overview', 'company', 'description']):
+            current_section = "about"
+        elif any(keyword in line_lower for keyword in ['requirement', 'qualification', 'experience', 'to be successful', 'about you']):
+            current_section = "requirements"
+        elif any(keyword in line_lower for keyword in ['responsibility', 'duty', 'role', 'purpose', 'working']):
+            current_section = "responsibilities"
+        elif any(keyword in line_lower for keyword in ['benefit', 'perk', 'offer', 'what we offer']):
+            current_section = "benefits"
+        elif any(keyword in line_lower for keyword in ['next step', 'apply', 'contact']):
+            current_section = "other"
+        elif line.strip():
+            sections[current_section] += line + "\n"
+    return {key: value.strip() for key, value in sections.items()}
+
+def legacy_parse_salary(salary_str: str) -> Dict[str, Optional[int]]:
+    """parse_salary before memoization: three regexes per call, k replaced anywhere in the label."""
+    if not salary_str:
+        return {"salary_min": None, "salary_max": None}
+    cleaned = re.sub(r'[$,€£¥]', '', salary_str.lower())
+    cleaned = re.sub(r'\s+', '', cleaned)
+    cleaned = re.sub(r'k', '000', cleaned)
+    numbers = re.findall(r'\d+', cleaned)
+    if len(numbers) >= 2:
+        return {"salary_min": int(numbers[0]), "salary_max": int(numbers[1])}
+    if len(numbers) == 1:
+        return {"salary_min": int(numbers[0]), "salary_max": None}
+    return {"salary_min": None, "salary_max": None}
+
+def legacy_parse_posted_date(date_str: str) -> Optional[str]:
+    """parse_posted_date before memoization: every format in order until strptime stops raising."""
+    if not date_str:
+        return None
+    for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S', '%d-%m-%Y', '%m-%d-%Y', '%B %d, %Y', '%b %d, %Y']:
+        try:
+            return datetime.strptime(date_str.strip(), fmt).isoformat()
+        except ValueError:
+            continue
+    return None
+
+def parser_batch(rows: int = 10000, distinct: int = 300) -> tuple:
+    """(salary labels, date strings) like an ETL batch: rows drawn from a few hundred distinct values."""
+    rng = random.Random(23)
+    salaries = [rng.choice([f"${low}k - ${low + 20}k + super", f"${low},000 - ${low + 20},000 p.a.",
+                            f"${low // 2} - ${low // 2 + 10} per hour"]) for low in range(60, 60 + distinct)]
+    dates = [rng.choice([f"Jan {day % 28 + 1}, 2026", f"{day % 28 + 1:02d}-03-2026", f"2026-04-{day % 28 + 1:02d} 09:30:00"])
+             for day in range(distinct)]
+    return [rng.choice(salaries) for _ in range(rows)], [rng.choice(dates) for _ in range(rows)]
+
+def measure_batch(func, values: List[str], runs: int, clear=None) -> float:
+    """Median milliseconds to run func over the whole batch, clearing the memo first if given."""
+    timings = []
+    for _ in range(runs):
+        if clear:
+            clear()
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+def sample_descriptions(size_kb: int) -> List[str]:
+    """The fixture descriptions as scraped (CRLF, indented), each repeated up to roughly size_kb kilobytes."""
+    samples = []
+    for path in sorted(FIXTURES.glob("*.txt")):
+        text = "\r\n".join(f"  {line}  " for line in path.read_text().split("\n"))
+        samples.append("\n\n".join([text] * max(1, size_kb * 1024 // len(text))))
+    return samples
+
+def measure(func, inputs: List[str], runs: int) -> tuple:
+    """Return (p50, p99) in milliseconds per call over the given number of runs."""
+    timings = []
+    for i in range(runs):
+        text = inputs[i % len(inputs)]
+        start = time.perf_counter()
+        func(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    cuts = quantiles(timings, n=100)
+    return cuts[49], cuts[98]
+
+# (stage, legacy implementation, current implementation, prepare input)
+STAGES = [
+    ("clean_job_description", legacy_clean_job_description, clean_job_description, str),
+    ("extract_job_sections", legacy_extract_job_sections, extract_job_sections, clean_job_description),
+]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job description text processing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 20, 50], help="Description sizes in KB")
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'stage':<24}{'KB':>5}{'legacy p50/p99 ms':>22}{'current p50/p99 ms':>22}{'speedup':>9}")
+    for name, legacy, current, prepare in STAGES:
+        for size in args.sizes:
+            inputs = [prepare(text) for text in sample_descriptions(size)]
+            legacy_p50, legacy_p99 = measure(legacy, inputs, args.runs)
+            current_p50, current_p99 = measure(current, inputs, args.runs)
+            print(f"{name:<24}{size:>5}{legacy_p50:>13.3f} /{legacy_p99:>7.3f}{current_p50:>13.3f} /{current_p99:>7.3f}"
+                  f"{legacy_p50 / current_p50:>8.1f}x")
+
+    salaries, dates = parser_batch()
+    print(f"\n{'parser (10k rows)':<24}{'legacy ms':>12}{'cold ms':>12}{'warm ms':>12}{'speedup':>9}")
+    for name, legacy, current, memo, values in (
+        ("parse_salary", legacy_parse_salary, parse_salary, _parse_salary, salaries),
+        ("parse_posted_date", legacy_parse_posted_date, parse_posted_date, _parse_posted_date, dates),
+    ):
+        runs = max(3, args.runs // 20)
+        legacy_ms = measure_batch(legacy, values, runs)
+        cold_ms = measure_batch(current, values, runs, clear=memo.cache_clear)
+        warm_ms = measure_batch(current, values, runs)
+        print(f"{name:<24}{legacy_ms:>12.2f}{cold_ms:>12.2f}{warm_ms:>12.2f}{legacy_ms / cold_ms:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
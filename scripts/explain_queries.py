@@ -0,0 +1,104 @@
+"""
+Run EXPLAIN (ANALYZE, BUFFERS) on the queries behind the hot API endpoints
+and report any sequential scans.
+
+Usage:
+    python -m scripts.explain_queries              # plans as the planner picks them
+    python -m scripts.explain_queries --no-seqscan # disable seq scans to check an index exists
+
+On a small database Postgres will often prefer a seq scan even when a
+suitable index exists, so --no-seqscan is the useful check on dev data:
+a query that still seq scans with it has no index for its access path.
+Exits with status 1 if an unexpected sequential scan is found.
+"""
+
+from datetime import datetime
+import argparse
+import sys
+
+from sqlalchemy import func, select, tuple_
+
+from app.api.endpoints.jobs import JobSearchParams
+from app.db.models import Application, FitScore, Job
+from app.db.session import engine
+from app.services.job_search import build_search_statement
+
+def endpoint_queries(conn):
+    """
+    Statements mirroring what each endpoint sends, parameterised with real ids where possible.
+
+    Returns:
+        List of (name, statement, full_scan_expected)
+    """
+    job_id, job_url_hash = conn.execute(select(Job.id, Job.url_hash).order_by(Job.id).limit(1)).first() or (0, "")
+    resume_id = conn.execute(select(func.min(FitScore.resume_id))).scalar() or 0
+    newest_first = (Job.created_at.desc(), Job.id.desc())
+
+    return [
+        ("GET /jobs/ (first page)", select(Job).order_by(*newest_first).limit(51), False),
+        ("GET /jobs/ (next page)", select(Job).where(tuple_(Job.created_at, Job.id) < (datetime.now(), job_id))
+            .order_by(*newest_first).limit(51), False),
+        ("GET /jobs/{id}", select(Job).where(Job.id == job_id), False),
+        ("GET /jobs/check-url (job)", select(Job).where(Job.url_hash == job_url_hash), False),
+        ("GET /jobs/check-url (latest application)", select(Application).where(Application.job_id == job_id)
+            .order_by(Application.applied_at.desc()).limit(1), False),
+        ("POST /jobs/search (keywords)", build_search_statement(JobSearchParams(keywords="python developer")), False),
+        ("POST /jobs/search (company)", build_search_statement(JobSearchParams(company="atlassian")), False),
+        ("POST /jobs/search (salary band)",
+         build_search_statement(JobSearchParams(salary_min_aud=120000, salary_max_aud=150000)), False),
+        ("DELETE /jobs/{id} (application count)", select(func.count()).select_from(Application)
+            .where(Application.job_id == job_id), False),
+        ("DELETE /jobs/{id} (fit score count)", select(func.count()).select_from(FitScore)
+            .where(FitScore.job_id == job_id), False),
+        ("DELETE /applications/{id} (fit score count)", select(func.count()).select_from(FitScore)
+            .where(FitScore.job_id == job_id, FitScore.resume_id == resume_id), False),
+        ("Applications by status", select(Application).where(Application.status == "applied"), False),
+        ("GET /applications/", select(Application), True),
+    ]
+
+def seq_scans(plan: dict) -> list:
+    """Walk a JSON plan tree and collect every Seq Scan node."""
+    found = [plan] if plan.get("Node Type") == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+def explain(conn, stmt) -> dict:
+    """Run EXPLAIN (ANALYZE, BUFFERS) for a statement and return the top plan node."""
+    compiled = stmt.compile(dialect=conn.dialect)
+    sql = f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}"
+    return conn.exec_driver_sql(sql, compiled.params).scalar()[0]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--no-seqscan", action="store_true", help="SET enable_seqscan = off before explaining")
+    args = parser.parse_args()
+
+    problems = 0
+    with engine.connect() as conn:
+        if args.no_seqscan:
+            conn.exec_driver_sql("SET enable_seqscan = off")
+
+        for name, stmt, full_scan_expected in endpoint_queries(conn):
+            result = explain(conn, stmt)
+            scans = seq_scans(result["Plan"])
+            timing = f"{result['Execution Time']:.2f} ms"
+
+            if not scans:
+                print(f"OK        {name} ({timing})")
+            elif full_scan_expected:
+                print(f"EXPECTED  {name} ({timing}): full listing, seq scan on {', '.join(s['Relation Name'] for s in scans)}")
+            else:
+                problems += 1
+                for scan in scans:
+                    print(f"SEQ SCAN  {name} ({timing}): {scan['Relation Name']}, "
+                          f"{scan.get('Actual Rows', 0)} rows, filter: {scan.get('Filter', '-')}")
+
+        # EXPLAIN ANALYZE executes the statements, never keep anything they did
+        conn.rollback()
+
+    print(f"\n{problems} unexpected sequential scan(s)")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Re-extract the tech_stack of every stored job from its description, e.g. after
+the keyword taxonomy or app/core/tech_taxonomy.json change.
+Descriptions are left as stored.
+
+Usage:
+    python -m scripts.reprocess_jobs                          # all jobs, one worker per CPU
+    python -m scripts.reprocess_jobs --workers 4 --batch-size 1000
+    python -m scripts.reprocess_jobs --restart                # ignore a saved checkpoint
+
+Progress is checkpointed after every batch (--checkpoint), so an interrupted
+run resumes after the last finished job. A completed run removes the checkpoint.
+"""
+
+import argparse
+import logging
+import os
+
+from app.db.session import SessionLocal
+from app.services.reprocessing import REPROCESS_BATCH_SIZE, reprocess_jobs
+
+def main():
+    parser = argparse.ArgumentParser(description="Reprocess stored job descriptions")
+    parser.add_argument("--batch-size", type=int, default=REPROCESS_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU, 1 for none)")
+    parser.add_argument("--checkpoint", default=".reprocess_jobs.checkpoint.json", help="Progress file")
+    parser.add_argument("--restart", action="store_true", help="Start from the first job even if a checkpoint exists")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    if args.restart and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    db = SessionLocal()
+    try:
+        result = reprocess_jobs(db, args.batch_size, args.workers, args.checkpoint, args.max_batches)
+    finally:
+        db.close()
+    print(f"Reprocessed {result['processed']} jobs ({result['updated']} updated) in {result['batches']} batches, "
+          f"{result['jobs_per_second']} jobs/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import os
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.db.models import Base
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+@pytest.fixture
+def db():
+    """Session on a freshly created schema in TEST_DATABASE_URL (needs PostgreSQL)."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set (needs PostgreSQL)")
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+@pytest_asyncio.fixture
+async def async_db(db):
+    """AsyncSession (asyncpg) on the same fresh schema as the db fixture."""
+    engine = create_async_engine(make_url(TEST_DATABASE_URL).set(drivername="postgresql+asyncpg"))
+    session = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
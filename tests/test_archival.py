@@ -0,0 +1,42 @@
+from datetime import datetime
+from sqlalchemy import update
+from app.db.models import Application, FitScore, Job, JobArchive, Resume
+from app.services.archival import archive_jobs
+from app.services.job_service import bulk_upsert_jobs, delete_job_cascade
+
+def add_jobs(db, count):
+    result = bulk_upsert_jobs(db, [
+        {"title": f"Job {i}", "description": "Desc", "company": "Acme", "location": "Melbourne",
+         "url": f"https://example.com/jobs/{i}"}
+        for i in range(count)
+    ])
+    return [row["job_id"] for row in result["results"]]
+
+def test_archives_only_old_jobs_nobody_applied_to(db):
+    ids = add_jobs(db, 6)
+    resume = Resume(name="Resume", file_url="https://example.com/r.pdf", file_type="pdf")
+    db.add(resume)
+    db.commit()
+    db.add_all([Application(job_id=ids[0]), FitScore(job_id=ids[1], resume_id=resume.id, score=1, explanation="ok")])
+    db.execute(update(Job).where(Job.id.in_(ids[:5])).values(created_at=datetime(2020, 1, 1)))
+    db.commit()
+
+    assert archive_jobs(db, older_than_days=30, batch_size=2) == {"archived": 3, "batches": 2}
+    assert sorted(job_id for (job_id,) in db.query(Job.id)) == [ids[0], ids[1], ids[5]]
+    archived = db.get(JobArchive, ids[2])
+    assert archived.title == "Job 2" and archived.archived_at is not None
+
+def test_reimport_restores_and_delete_falls_through(db):
+    ids = add_jobs(db, 3)
+    db.execute(update(Job).values(created_at=datetime(2020, 1, 1)))
+    db.commit()
+    archive_jobs(db, older_than_days=30)
+
+    result = bulk_upsert_jobs(db, [{"title": "Job 0 reposted", "description": "Desc", "company": "Acme",
+                                    "location": "Melbourne", "url": "https://example.com/jobs/0"}])
+    assert result["results"][0] == {"index": 0, "status": "updated", "job_id": ids[0], "error": None}
+    assert db.get(Job, ids[0]).title == "Job 0 reposted"
+    assert db.get(JobArchive, ids[0]) is None
+
+    assert delete_job_cascade(db, ids[1]) == {"application_count": 0, "fit_score_count": 0}
+    assert db.get(JobArchive, ids[1]) is None
@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import select
+from app.api.endpoints import jobs
+from app.core.cache import cache
+from app.db.models import Application, Job
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+@pytest.mark.asyncio
+async def test_async_insert_with_default_timestamps(async_db):
+    # asyncpg rejects timezone-aware values for TIMESTAMP WITHOUT TIME ZONE columns
+    job = Job(title="Data Engineer", url="https://www.seek.com.au/job/42")
+    async_db.add(job)
+    await async_db.commit()
+    async_db.add(Application(job_id=job.id, status="applied"))
+    await async_db.commit()
+
+    stored = await async_db.scalar(select(Job).where(Job.url_hash == job.url_hash))
+    assert stored.created_at.tzinfo is None and stored.updated_at is not None
+
+@pytest.mark.asyncio
+async def test_check_url_on_async_session(async_db):
+    async_db.add(Job(title="Data Engineer", company="Acme", location="Perth WA", category="other",
+                     url="https://www.seek.com.au/job/42"))
+    await async_db.commit()
+
+    found = await jobs.check_job_url("https://www.seek.com.au/job/42?ref=search", db=async_db)
+    assert found["exists"] and found["job"]["title"] == "Data Engineer"
+    assert found["application"] is None
+    assert (await jobs.check_job_url("https://www.seek.com.au:99999/job/42", db=async_db))["exists"]
+    assert not (await jobs.check_job_url("https://www.seek.com.au/job/43", db=async_db))["exists"]
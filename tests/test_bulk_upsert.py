@@ -0,0 +1,71 @@
+import pytest
+from app.db.models import Job, JobArchive
+from app.services import job_service
+from app.services.job_service import bulk_upsert_jobs
+
+def make_job(i, **fields):
+    return {"title": f"Engineer {i}", "company": "Acme", "location": "Sydney NSW",
+            "url": f"https://www.seek.com.au/job/{i}", "description": f"Build service {i}", **fields}
+
+def test_inserts_then_updates_existing_jobs(db):
+    first = bulk_upsert_jobs(db, [make_job(1), make_job(2)])
+    assert (first["inserted"], first["updated"], first["skipped"]) == (2, 0, 0)
+    ids = {result["index"]: result["job_id"] for result in first["results"]}
+
+    # Same listings under tracking parameters are updates of the same rows (xmax <> 0)
+    second = bulk_upsert_jobs(db, [make_job(3), make_job(1, title="Senior Engineer 1", url="https://www.seek.com.au/job/1?ref=feed")])
+    assert (second["inserted"], second["updated"], second["skipped"]) == (1, 1, 0)
+    assert [result["status"] for result in second["results"]] == ["inserted", "updated"]
+    assert second["results"][1]["job_id"] == ids[0]
+    db.expire_all()
+    assert db.get(Job, ids[0]).title == "Senior Engineer 1"
+    assert db.query(Job).count() == 3
+
+def test_duplicate_url_in_one_batch_is_skipped(db):
+    result = bulk_upsert_jobs(db, [make_job(1), make_job(2), make_job(1, url="https://seek.com.au/job/1/")])
+    assert (result["inserted"], result["updated"], result["skipped"]) == (2, 0, 1)
+    skipped = result["results"][2]
+    assert skipped == {"index": 2, "status": "skipped", "job_id": None, "error": "Duplicate of row 0"}
+    assert db.query(Job).count() == 2
+
+def test_invalid_rows_are_skipped_with_a_reason(db):
+    result = bulk_upsert_jobs(db, [
+        make_job(1),
+        make_job(2, company=None),           # fails JobCreate validation
+        {key: value for key, value in make_job(3).items() if key != "url"},  # no url to dedupe on
+        make_job(4),
+    ])
+    assert (result["inserted"], result["updated"], result["skipped"]) == (2, 0, 2)
+    assert [result["status"] for result in result["results"]] == ["inserted", "skipped", "skipped", "inserted"]
+    assert "company" in result["results"][1]["error"]
+    assert all(row["job_id"] is None for row in result["results"][1:3])
+    assert db.query(Job).count() == 2
+
+def test_archived_listing_is_restored_and_counted_as_update(db):
+    inserted = bulk_upsert_jobs(db, [make_job(1)])["results"][0]["job_id"]
+    job = db.get(Job, inserted)
+    db.add(JobArchive(id=job.id, title=job.title, url=job.url, url_hash=job.url_hash, created_at=job.created_at))
+    db.delete(job)
+    db.commit()
+
+    result = bulk_upsert_jobs(db, [make_job(1, title="Reposted")])
+    assert (result["inserted"], result["updated"]) == (0, 1)
+    assert result["results"][0]["job_id"] == inserted
+    assert db.query(JobArchive).count() == 0
+
+def test_failed_statement_rolls_back_the_batch(db, monkeypatch):
+    bulk_upsert_jobs(db, [make_job(1)])
+    monkeypatch.setattr(job_service, "BULK_UPSERT_CHUNK_SIZE", 1)
+    original = job_service.restore_jobs
+    calls = []
+
+    def failing_restore(session, url_hashes):
+        calls.append(url_hashes)
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return original(session, url_hashes)
+
+    monkeypatch.setattr(job_service, "restore_jobs", failing_restore)
+    with pytest.raises(RuntimeError):
+        bulk_upsert_jobs(db, [make_job(2), make_job(3)])
+    assert db.query(Job).count() == 1
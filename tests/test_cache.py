@@ -0,0 +1,73 @@
+import pytest
+from app.api.endpoints import jobs
+from app.core import cache as cache_module
+from app.core.cache import MISSING, MemoryCache, job_url_key
+from app.core.utils import url_hash
+from app.db.models import Job
+
+def test_memory_cache_distinguishes_cached_none_from_miss():
+    cache = MemoryCache()
+    assert cache.get("job:url:abc") is MISSING
+    cache.set("job:url:abc", None)
+    assert cache.get("job:url:abc") is None
+    cache.delete("job:url:abc", "job:1")
+    assert cache.get("job:url:abc") is MISSING
+
+def test_memory_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache(ttl=60)
+    cache.set("job:1", {"id": 1})
+    cache.set("job:url:abc", None, ttl=5)
+    now[0] += 10
+    assert cache.get("job:url:abc") is MISSING
+    assert cache.get("job:1") == {"id": 1}
+    now[0] += 60
+    assert cache.get("job:1") is MISSING
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+class AsyncOnlyCache(MemoryCache):
+    """Fails on the blocking methods, so async callers must use aget/aset/adelete."""
+
+    def get(self, key):
+        raise AssertionError("blocking cache.get() called from async code")
+
+    def set(self, key, value, ttl=None):
+        raise AssertionError("blocking cache.set() called from async code")
+
+    def delete(self, *keys):
+        raise AssertionError("blocking cache.delete() called from async code")
+
+    async def aget(self, key):
+        return MemoryCache.get(self, key)
+
+    async def aset(self, key, value, ttl=None):
+        MemoryCache.set(self, key, value, ttl)
+
+    async def adelete(self, *keys):
+        MemoryCache.delete(self, *keys)
+
+@pytest.mark.asyncio
+async def test_async_endpoints_use_the_async_cache_api(async_db, monkeypatch):
+    fake = AsyncOnlyCache()
+    monkeypatch.setattr(cache_module, "cache", fake)
+    monkeypatch.setattr(jobs, "cache", fake)
+    async_db.add(Job(title="Data Engineer", company="Acme", location="Perth WA", category="other",
+                     url="https://www.seek.com.au/job/7"))
+    await async_db.commit()
+
+    for _ in range(2):  # miss, then hit
+        found = await jobs.check_job_url("https://www.seek.com.au/job/7", db=async_db)
+        assert found["exists"]
+    assert MemoryCache.get(fake, job_url_key(url_hash("https://www.seek.com.au/job/7"))) is not MISSING
+
+    await cache_module.ainvalidate_jobs(url_hashes=[url_hash("https://www.seek.com.au/job/7")])
+    assert MemoryCache.get(fake, job_url_key(url_hash("https://www.seek.com.au/job/7"))) is MISSING
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from fastapi import Request, Response
+from sqlalchemy import delete
+from app.api.conditional import make_etag, not_modified, with_validators
+from app.api.endpoints.applications import list_applications
+from app.db.models import Application, Job, Resume
+
+UPDATED_AT = datetime(2026, 10, 16, 9, 30, 15, 123456)
+
+def make_request(**headers):
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "query_string": b"", "headers": raw})
+
+def test_etag_changes_with_version():
+    assert make_etag("job", 1, UPDATED_AT) == make_etag("job", 1, UPDATED_AT)
+    assert make_etag("job", 1, UPDATED_AT) != make_etag("job", 1, datetime(2026, 10, 17))
+
+def test_if_none_match():
+    etag = make_etag("job", 1, UPDATED_AT)
+    response = not_modified(make_request(if_none_match=f'"other", {etag}'), etag, UPDATED_AT)
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.headers["last-modified"] == "Fri, 16 Oct 2026 09:30:15 GMT"
+    assert not_modified(make_request(if_none_match='"other"'), etag, UPDATED_AT) is None
+    assert not_modified(make_request(), etag, UPDATED_AT) is None
+
+def test_etags_are_weak_and_compared_weakly():
+    etag = make_etag("job", 1, UPDATED_AT)
+    assert etag.startswith('W/"')
+    # Compressed and identity bodies share the tag, clients may echo it without the W/ prefix
+    assert not_modified(make_request(if_none_match=etag.removeprefix("W/")), etag, UPDATED_AT).status_code == 304
+
+def test_if_modified_since():
+    etag = make_etag("job", 1, UPDATED_AT)
+    assert not_modified(make_request(if_modified_since="Fri, 16 Oct 2026 09:30:15 GMT"), etag, UPDATED_AT).status_code == 304
+    assert not_modified(make_request(if_modified_since="Fri, 16 Oct 2026 09:30:14 GMT"), etag, UPDATED_AT) is None
+    assert not_modified(make_request(if_modified_since="garbage"), etag, UPDATED_AT) is None
+    # If-None-Match wins when both are sent
+    both = make_request(if_none_match='"other"', if_modified_since="Fri, 16 Oct 2026 09:30:15 GMT")
+    assert not_modified(both, etag, UPDATED_AT) is None
+
+def test_with_validators_sets_headers_on_returned_response():
+    injected, returned = Response(), Response()
+    assert with_validators({"id": 1}, injected, '"a"') == {"id": 1}
+    assert injected.headers["etag"] == '"a"'
+    with_validators(returned, injected, '"b"', UPDATED_AT)
+    assert returned.headers["etag"] == '"b"' and "last-modified" in returned.headers
+
+def list_etag(db):
+    response = Response()
+    result = list_applications(request=make_request(), response=response, db=db)
+    return (result if isinstance(result, Response) else response).headers["etag"]
+
+def test_application_list_etag_changes_when_a_resume_is_deleted(db):
+    resumes = [Resume(name=f"Resume {i}", file_url=f"https://example.com/{i}.pdf", file_type="pdf") for i in range(2)]
+    for i, resume in enumerate(resumes):
+        db.add(Application(resume=resume, job=Job(title=f"Job {i}", description="Desc", company="Acme",
+                                                   location="Perth", category="other", url=f"https://example.com/jobs/{i}")))
+    db.commit()
+    before = list_etag(db)
+
+    # ON DELETE SET NULL clears the link without bumping any updated_at, and this isn't the newest resume
+    db.execute(delete(Resume).where(Resume.id == resumes[0].id))
+    db.commit()
+    db.expire_all()
+    assert list_etag(db) != before
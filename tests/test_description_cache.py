@@ -0,0 +1,44 @@
+from app.core.utils import description_hash
+from app.db.models import Job, ProcessedDescription
+from app.services import description_cache, job_service
+from app.services.job_service import bulk_upsert_jobs
+
+DESCRIPTION = "About us\n\nRequirements\n- Python and Postgres\n- k8s"
+
+def make_job(i, description=DESCRIPTION):
+    return {"title": f"Engineer {i}", "company": "Acme", "location": "Sydney NSW",
+            "url": f"https://example.com/jobs/{i}", "description": description}
+
+def count_processing(monkeypatch):
+    calls = []
+    process = job_service.process_job_description
+    monkeypatch.setattr(job_service, "process_job_description", lambda text: calls.append(text) or process(text))
+    return calls
+
+def test_repeated_description_is_processed_once(db, monkeypatch):
+    calls = count_processing(monkeypatch)
+    bulk_upsert_jobs(db, [make_job(1)])
+    # A repost under another URL and a re-import of the first listing
+    bulk_upsert_jobs(db, [make_job(2), make_job(1)])
+
+    assert calls == [DESCRIPTION]
+    entry = db.get(ProcessedDescription, description_hash(DESCRIPTION))
+    assert entry.tech_stack == ["python", "postgresql", "kubernetes"]
+    jobs = db.query(Job).order_by(Job.id).all()
+    assert [job.description_hash for job in jobs] == [entry.description_hash] * 2
+    assert jobs[0].tech_stack == jobs[1].tech_stack == entry.tech_stack
+    assert jobs[1].description == jobs[0].description == "About us\nRequirements\n- Python and Postgres\n- k8s"
+
+def test_stale_processor_version_is_processed_again(db, monkeypatch):
+    bulk_upsert_jobs(db, [make_job(1)])
+    db.get(ProcessedDescription, description_hash(DESCRIPTION)).enriched_data = {"category": "devops"}
+    db.commit()
+    calls = count_processing(monkeypatch)
+    monkeypatch.setattr(description_cache, "PROCESSOR_VERSION", description_cache.PROCESSOR_VERSION + 1)
+
+    bulk_upsert_jobs(db, [make_job(2)])
+    db.expire_all()
+    entry = db.get(ProcessedDescription, description_hash(DESCRIPTION))
+    assert calls == [DESCRIPTION]
+    assert entry.processor_version == description_cache.PROCESSOR_VERSION
+    assert entry.enriched_data == {"category": "devops"}
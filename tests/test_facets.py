@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+from app.services.job_search import build_facet_statement, facet_counts
+from app.db.models import Job
+
+def search_params(**filters):
+    fields = dict(keywords=None, company=None, location=None, visa_sponsorship=None,
+                  work_mode=None, work_type=None, experience_level=None,
+                  salary_min_aud=None, salary_max_aud=None, limit=50)
+    return SimpleNamespace(**{**fields, **filters})
+
+def test_facet_counts_match_filtered_jobs(db):
+    db.add_all([
+        Job(title=f"Job {i}", description="Desc", company="Acme", location="Melbourne",
+            url=f"https://example.com/jobs/{i}", work_mode=work_mode, source=source)
+        for i, (work_mode, source) in enumerate([("remote", "seek"), ("remote", "linkedin"), ("hybrid", "seek")])
+    ])
+    db.commit()
+
+    total, facets = facet_counts(db.execute(build_facet_statement(search_params())).all())
+    assert total == 3
+    assert facets["work_mode"] == [{"value": "remote", "count": 2}, {"value": "hybrid", "count": 1}]
+    assert facets["source"] == [{"value": "seek", "count": 2}, {"value": "linkedin", "count": 1}]
+
+    total, facets = facet_counts(db.execute(build_facet_statement(search_params(work_mode="remote"))).all())
+    assert total == 2
+    assert facets["source"] == [{"value": "linkedin", "count": 1}, {"value": "seek", "count": 1}]
+
+def test_facet_counts_without_matches():
+    total, facets = facet_counts([])
+    assert total == 0
+    assert all(counts == [] for counts in facets.values())
@@ -0,0 +1,50 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import update
+from app.db.models import Application, FitScore, Job, JobArchive, Resume
+from app.services.job_service import bulk_delete_jobs, delete_job_cascade
+
+def add_jobs(db, count):
+    resume = Resume(name="Resume", file_url="https://example.com/r.pdf", file_type="pdf")
+    db.add(resume)
+    db.flush()
+    for i in range(count):
+        job = Job(title=f"Job {i}", description="Desc", company="Acme", location="Melbourne", category="other",
+                  url=f"https://example.com/jobs/{i}", source="seek" if i % 2 else "jora")
+        db.add_all([job, Application(job=job, resume=resume)])
+        db.flush()
+        db.add(FitScore(job_id=job.id, resume_id=resume.id, score=50, explanation="ok"))
+    db.commit()
+
+def test_delete_job_cascades_and_counts(db):
+    add_jobs(db, 2)
+    job_id = db.query(Job.id).order_by(Job.id).first()[0]
+    assert delete_job_cascade(db, job_id) == {"application_count": 1, "fit_score_count": 1}
+    assert delete_job_cascade(db, job_id) is None
+    assert db.query(Application).count() == 1 and db.query(FitScore).count() == 1
+
+def test_bulk_delete_matches_all_criteria_in_batches(db):
+    add_jobs(db, 10)
+    db.execute(update(Job).where(Job.title.in_(["Job 1", "Job 2", "Job 3"])).values(created_at=datetime(2020, 1, 1)))
+    db.commit()
+
+    result = bulk_delete_jobs(db, source="seek", older_than=datetime(2021, 1, 1), batch_size=1)
+    assert result == {"deleted": 2, "archived_deleted": 0, "applications_deleted": 2, "fit_scores_deleted": 2, "batches": 2}
+    assert sorted(title for (title,) in db.query(Job.title)) == [f"Job {i}" for i in (0, 2, 4, 5, 6, 7, 8, 9)]
+
+    with pytest.raises(ValueError):
+        bulk_delete_jobs(db)
+
+def test_bulk_delete_by_id_falls_through_to_the_archive(db):
+    add_jobs(db, 3)
+    hot_id, archived_id, kept_id = [job_id for (job_id,) in db.query(Job.id).order_by(Job.id)]
+    job = db.get(Job, archived_id)
+    db.add(JobArchive(id=job.id, title=job.title, url=job.url, url_hash=job.url_hash, source=job.source,
+                      created_at=job.created_at))
+    db.delete(job)
+    db.commit()
+
+    result = bulk_delete_jobs(db, ids=[hot_id, archived_id, 12345])
+    assert result == {"deleted": 2, "archived_deleted": 1, "applications_deleted": 1, "fit_scores_deleted": 1, "batches": 2}
+    assert db.query(JobArchive).count() == 0
+    assert [job_id for (job_id,) in db.query(Job.id)] == [kept_id]
@@ -0,0 +1,66 @@
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.endpoints import jobs
+from app.db.models import Job
+from app.db.session import get_db
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/jobs")
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+def add_jobs(db, created_at):
+    db.add_all([Job(title=f"Job {i}", description="Build APIs", company="Acme", location="Sydney NSW",
+                    category="other", url=f"https://example.com/jobs/{i}", created_at=created)
+                for i, created in enumerate(created_at)])
+    db.commit()
+
+def fetch_all(client, limit, **params):
+    """Follow next_cursor through every page, returning the items of each page."""
+    pages, cursor = [], None
+    while True:
+        body = client.get("/jobs/", params={"limit": limit, **({"cursor": cursor} if cursor else {}), **params}).json()
+        pages.append(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+def test_cursor_walks_every_job_once_in_order(client, db):
+    start = datetime(2026, 1, 1)
+    # Ties on created_at are broken by id, so pages never skip or repeat a job
+    add_jobs(db, [start, start, start, start + timedelta(hours=1), start + timedelta(hours=1), start - timedelta(days=1)])
+    expected = [job.url for job in db.query(Job).order_by(Job.created_at.desc(), Job.id.desc())]
+
+    pages = fetch_all(client, limit=2)
+    assert [len(page) for page in pages] == [2, 2, 2]
+    assert [job["url"] for page in pages for job in page] == expected
+
+def test_last_page_has_no_cursor(client, db):
+    add_jobs(db, [datetime(2026, 1, 1) + timedelta(minutes=i) for i in range(3)])
+    assert client.get("/jobs/", params={"limit": 3}).json()["next_cursor"] is None
+    first = client.get("/jobs/", params={"limit": 2}).json()
+    last = client.get("/jobs/", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    assert len(last["items"]) == 1 and last["next_cursor"] is None
+
+def test_cursor_works_with_projection(client, db):
+    add_jobs(db, [datetime(2026, 1, 1)] * 5)
+    pages = fetch_all(client, limit=2, fields="title")
+    assert [job["title"] for page in pages for job in page] == [f"Job {i}" for i in reversed(range(5))]
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    base64.urlsafe_b64encode(b"2026-01-01T00:00:00").decode(),
+    base64.urlsafe_b64encode(b"yesterday|1").decode(),
+    base64.urlsafe_b64encode(b"2026-01-01T00:00:00|one").decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe|1").decode(),
+])
+def test_bad_cursor_is_rejected(client, cursor):
+    response = client.get("/jobs/", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
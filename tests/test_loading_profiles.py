@@ -0,0 +1,46 @@
+import pytest
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from app.api.endpoints.applications import list_applications
+from app.api.endpoints.resumes import list_resumes
+from app.db.models import Job, Resume, Application
+from app.db.schemas import ApplicationRead, ResumeRead
+
+def add_rows(db, start, count):
+    for i in range(start, start + count):
+        resume = Resume(name=f"Resume {i}", file_url=f"https://example.com/{i}.pdf", file_type="pdf")
+        job = Job(title=f"Job {i}", description="Desc", company="Acme", location="Melbourne",
+                  category="other", url=f"https://example.com/jobs/{i}")
+        db.add(Application(job=job, resume=resume))
+    db.commit()
+    db.expunge_all()
+
+def count_queries(db, func):
+    """Run func and return how many statements it sent to the database."""
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.bind, "before_cursor_execute", listener)
+    try:
+        func()
+    finally:
+        event.remove(db.bind, "before_cursor_execute", listener)
+    db.expunge_all()
+    return len(statements)
+
+def list_and_serialize_applications(db):
+    request = Request({"type": "http", "query_string": b"", "headers": []})
+    applications = list_applications(request=request, response=Response(), db=db)
+    TypeAdapter(list[ApplicationRead]).validate_python(applications)
+
+def list_and_serialize_resumes(db):
+    TypeAdapter(list[ResumeRead]).validate_python(list_resumes(db=db))
+
+# Applications run one extra ETag probe before loading the rows
+@pytest.mark.parametrize("endpoint, expected", [(list_and_serialize_applications, 4), (list_and_serialize_resumes, 3)])
+def test_list_query_count_is_independent_of_row_count(db, endpoint, expected):
+    add_rows(db, 0, 2)
+    few = count_queries(db, lambda: endpoint(db))
+    add_rows(db, 2, 20)
+    many = count_queries(db, lambda: endpoint(db))
+    assert few == many == expected
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+from app.db.pool_metrics import CHECKOUT_LATENCY_BUCKETS_MS, PoolMetrics, instrumented_pool
+
+class StubConnection:
+    """DBAPI connection stand-in, the pool only rolls back and closes it."""
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+def make_pool(metrics, connect_delay=0.0, **kwargs):
+    def creator():
+        time.sleep(connect_delay)
+        return StubConnection()
+    pool = instrumented_pool(QueuePool, metrics)(creator, **kwargs)
+    metrics.attach(pool)
+    return pool
+
+def test_counts_checkouts_and_checkins():
+    metrics = PoolMetrics("test")
+    pool = make_pool(metrics, pool_size=2, max_overflow=0)
+    first, second = pool.connect(), pool.connect()
+    first.close()
+    second.close()
+    pool.connect().close()
+
+    snapshot = metrics.snapshot(pool)
+    assert (snapshot["checkouts"], snapshot["checkins"], snapshot["connects"]) == (3, 3, 2)
+    assert (snapshot["checked_out"], snapshot["checked_in"], snapshot["timeouts"]) == (0, 2, 0)
+    assert sum(bucket["count"] for bucket in snapshot["checkout_latency_histogram"]) == 3
+
+def test_counts_timeouts_of_an_exhausted_pool():
+    metrics = PoolMetrics("test")
+    pool = make_pool(metrics, pool_size=1, max_overflow=0, timeout=0.05)
+    held = pool.connect()
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+    held.close()
+
+    snapshot = metrics.snapshot(pool)
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_max_ms"] >= 50
+    # The failed acquisition waited out the timeout, the first one didn't wait
+    counts = [bucket["count"] for bucket in snapshot["checkout_latency_histogram"]]
+    assert counts[0] == 1 and sum(counts[CHECKOUT_LATENCY_BUCKETS_MS.index(50):]) == 1
+
+def test_wait_excludes_opening_new_connections():
+    metrics = PoolMetrics("test")
+    pool = make_pool(metrics, connect_delay=0.1, pool_size=1, max_overflow=1)
+    first, overflow = pool.connect(), pool.connect()
+
+    snapshot = metrics.snapshot(pool)
+    assert snapshot["connects"] == 2
+    assert snapshot["wait_max_ms"] < 50
+    first.close()
+    overflow.close()
+
+def test_health_endpoint_reports_both_engines():
+    import main
+    body = TestClient(main.app).get("/health/db").json()
+    assert set(body) == {"sync", "async"}
+    for snapshot in body.values():
+        assert {"pool_size", "checked_out", "timeouts", "wait_avg_ms", "checkout_latency_histogram"} <= set(snapshot)
+        assert snapshot["checkout_latency_histogram"][-1]["le_ms"] == "+Inf"
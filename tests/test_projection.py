@@ -0,0 +1,22 @@
+import pytest
+from app.db.models import Application, Job
+from app.db.projection import parse_fields, rows_to_dicts
+
+def test_parse_fields_resolves_columns_in_order():
+    projection = parse_fields("title, id,title", Job)
+    assert [key for key, _ in projection] == ["title", "id"]
+    assert projection[0][1] is Job.title
+
+def test_parse_fields_rejects_unknown_and_deferred_columns():
+    with pytest.raises(ValueError, match="nope, search_vector"):
+        parse_fields("id,nope,search_vector", Job)
+    with pytest.raises(ValueError):
+        parse_fields(" , ", Job)
+
+def test_related_fields_are_nested():
+    projection = parse_fields("id,job.title", Application, relations={"job": Job})
+    assert projection[1][1] is Job.title
+    rows = rows_to_dicts([(1, "Engineer")], [key for key, _ in projection])
+    assert rows == [{"id": 1, "job": {"title": "Engineer"}}]
+    with pytest.raises(ValueError):
+        parse_fields("resume.name", Application, relations={"job": Job})
@@ -0,0 +1,36 @@
+from sqlalchemy import create_engine, text
+from app.db import query_metrics
+from app.db.query_metrics import normalize_sql, track_queries
+from tests.conftest import TEST_DATABASE_URL
+import pytest
+
+def test_normalize_sql_strips_literals_and_parameter_lists():
+    statement = "SELECT * FROM jobs\n  WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s) AND title = 'x' LIMIT 50"
+    assert normalize_sql(statement) == "SELECT * FROM jobs WHERE id IN (...) AND title = ? LIMIT ?"
+    assert normalize_sql("SELECT * FROM jobs WHERE id = $1") == "SELECT * FROM jobs WHERE id = ?"
+
+def test_track_queries_counts_and_logs_slow_queries(tmp_path, monkeypatch):
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set (needs PostgreSQL)")
+    log_path = tmp_path / "slow.log"
+    monkeypatch.setitem(query_metrics.query_metrics_config, "slow_query_ms", 50)
+    monkeypatch.setitem(query_metrics.query_metrics_config, "slow_query_log_path", str(log_path))
+    monkeypatch.setattr(query_metrics.slow_query_logger, "handlers", [])
+    engine = create_engine(TEST_DATABASE_URL)
+    query_metrics.attach(engine)
+    try:
+        with track_queries("test") as stats, engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT pg_sleep(0.06), 'secret'"))
+            assert conn.execute(text("SELECT 2")).scalar() == 2
+    finally:
+        for handler in query_metrics.slow_query_logger.handlers:
+            handler.close()
+        engine.dispose()
+
+    assert stats.count == 3
+    assert stats.slowest_ms >= 50 and "pg_sleep" in stats.slowest_sql
+    assert 'db;desc="3 queries"' in stats.server_timing()
+    logged = log_path.read_text()
+    assert "unit=test" in logged and "SELECT pg_sleep(?), ?" in logged and "Result" in logged
+    assert "secret" not in logged
@@ -0,0 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor
+from app.core.text_processor import process_job_description, process_job_descriptions_batch
+from app.db.models import Job, ProcessedDescription
+from app.services.reprocessing import load_checkpoint, reprocess_jobs
+
+DESCRIPTIONS = [f"About us\n\n\n  Team   {i}  \r\nRequirements\n- Python and SQL" for i in range(20)]
+
+def test_batch_in_processes_matches_serial():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = process_job_descriptions_batch(DESCRIPTIONS, executor, chunksize=4)
+    assert parallel == [process_job_description(description) for description in DESCRIPTIONS]
+
+def test_reprocess_updates_changed_jobs_and_resumes_from_checkpoint(db, tmp_path):
+    db.add_all([Job(title=f"Job {i}", description=description, url=f"https://example.com/jobs/{i}")
+                for i, description in enumerate(DESCRIPTIONS[:5])])
+    db.add(Job(title="Clean", description="Already clean", url="https://example.com/jobs/clean"))
+    db.commit()
+    checkpoint = str(tmp_path / "checkpoint.json")
+
+    first = reprocess_jobs(db, batch_size=2, workers=1, checkpoint_path=checkpoint, max_batches=1)
+    assert (first["processed"], first["updated"]) == (2, 2)
+    assert load_checkpoint(checkpoint) == {"last_id": first["last_id"]}
+
+    rest = reprocess_jobs(db, batch_size=2, workers=1, checkpoint_path=checkpoint)
+    assert (rest["processed"], rest["updated"]) == (4, 3)
+    assert load_checkpoint(checkpoint) == {}
+    db.expire_all()
+    assert db.query(Job).filter_by(title="Job 4").one().tech_stack == ["python", "sql"]
+
+def test_reprocess_keeps_descriptions_and_skips_unchanged_jobs(db):
+    # Enriched descriptions keep their formatting, blank lines included
+    enriched = "Summary\n\nBuild Python services.\n\nKey skills\n- Python\n- Kubernetes"
+    db.add(Job(title="Enriched", description=enriched, tech_stack=["python", "kubernetes"],
+               url="https://example.com/jobs/enriched"))
+    db.add(Job(title="Raw", description=DESCRIPTIONS[0], url="https://example.com/jobs/raw"))
+    db.commit()
+
+    assert reprocess_jobs(db, workers=1)["updated"] == 1
+    db.expire_all()
+    updated_at = {job.title: job.updated_at for job in db.query(Job)}
+    assert reprocess_jobs(db, workers=1)["updated"] == 0
+    db.expire_all()
+    jobs = {job.title: job for job in db.query(Job)}
+    assert jobs["Enriched"].description == enriched
+    assert jobs["Raw"].description == DESCRIPTIONS[0]
+    assert {title: job.updated_at for title, job in jobs.items()} == updated_at
+
+def test_reprocess_replaces_stale_skills_and_keeps_enriched_ones(db):
+    # "golang" was matched by an older taxonomy, Docker only came from AI enrichment
+    db.add(ProcessedDescription(description_hash="a" * 64, processor_version=1, enriched_data={"tech_stack": ["Docker"]}))
+    db.add(Job(title="Stale", description="Python and Postgres services", tech_stack=["python", "golang", "docker"],
+               description_hash="a" * 64, url="https://example.com/jobs/stale"))
+    db.commit()
+
+    assert reprocess_jobs(db, workers=0)["updated"] == 1
+    db.expire_all()
+    assert db.query(Job).one().tech_stack == ["python", "postgresql", "docker"]
@@ -0,0 +1,59 @@
+import json
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.api.compression import CompressionMiddleware
+from app.api.responses import FastJSONResponse, dump_orm
+from app.db.models import Application, Job
+from app.db.schemas import JobBase, JobRead
+
+def make_job():
+    return Job(id=1, title="Python Developer", description="Build APIs", company="Acme", location="Melbourne",
+               work_mode="hybrid", work_type="full-time", experience_level="mid", category="software-engineer",
+               url="https://www.seek.com.au/job/1", source="seek", tech_stack=["python"],
+               created_at=datetime(2026, 1, 1, 9, 30))
+
+def test_fast_path_matches_validated_output():
+    job = make_job()
+    expected = json.loads(JobBase.model_validate(job, from_attributes=True).model_dump_json())
+    assert json.loads(FastJSONResponse(dump_orm(job, JobBase)).body) == expected
+
+def test_dump_orm_rejects_cycles():
+    job = make_job()
+    Application(id=1, job_id=1, status="applied", job=job)  # backref adds it to job.applications
+    with pytest.raises(ValueError, match="Cyclic"):
+        dump_orm(job, JobRead)
+
+def make_client(minimum_size=100):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/large")
+    def large():
+        return FastJSONResponse([{"title": "Python Developer"}] * 100)
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((b'{"n": %d}\n' % i for i in range(50)), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+def test_compresses_only_large_responses():
+    client = make_client()
+    large = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.json() == [{"title": "Python Developer"}] * 100
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
+
+def test_compresses_streams_incrementally():
+    response = make_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.splitlines()[-1] == '{"n": 49}'
@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from app.api.endpoints import jobs
+from app.core.salary import HOURS_PER_YEAR, normalize_salary
+from app.db.models import Job
+from app.db.session import get_db
+from app.services.job_search import apply_search_filters
+from app.services.job_service import bulk_upsert_jobs
+
+def test_normalize_salary_annualizes_and_converts():
+    assert normalize_salary(90000, 120000, "AUD") == {"salary_min_aud": 90000, "salary_max_aud": 120000}
+    assert normalize_salary(45, 60, None) == {"salary_min_aud": 45 * HOURS_PER_YEAR, "salary_max_aud": 60 * HOURS_PER_YEAR}
+    assert normalize_salary(100000, None, "usd")["salary_min_aud"] > 100000
+    assert normalize_salary(120000, 90000) == {"salary_min_aud": 90000, "salary_max_aud": 120000}
+    assert normalize_salary(100000, None, "XYZ") == {"salary_min_aud": None, "salary_max_aud": None}
+
+def search_params(salary_min_aud=None, salary_max_aud=None):
+    return SimpleNamespace(keywords=None, company=None, location=None, visa_sponsorship=None, work_mode=None,
+                           work_type=None, experience_level=None,
+                           salary_min_aud=salary_min_aud, salary_max_aud=salary_max_aud)
+
+def test_salary_band_filter_matches_overlapping_jobs(db):
+    bulk_upsert_jobs(db, [
+        {"title": f"Job {i}", "description": "Desc", "company": "Acme", "location": "Melbourne",
+         "url": f"https://example.com/jobs/{i}", "salary": salary}
+        for i, salary in enumerate(["$80,000 - $100,000", "$130k - $150k", "$50 - $60 per hour", None])
+    ])
+    db.add(Job(title="Manual", description="Desc", company="Acme", location="Sydney",
+               url="https://example.com/jobs/manual", salary_min=200000))
+    db.commit()
+
+    def titles(**band):
+        stmt = apply_search_filters(select(Job.title), search_params(**band))
+        return sorted(db.scalars(stmt))
+
+    assert titles(salary_min_aud=95000, salary_max_aud=110000) == ["Job 0", "Job 2"]
+    assert titles(salary_min_aud=140000) == ["Job 1", "Manual"]
+    assert titles(salary_max_aud=90000) == ["Job 0"]
+
+@pytest.mark.parametrize("band", [
+    {"salary_min_aud": 150000, "salary_max_aud": 100000},
+    {"salary_min_aud": -1},
+    {"salary_max_aud": 2 ** 31},
+])
+def test_invalid_salary_band_is_rejected_before_querying(band):
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/jobs")
+    response = TestClient(app).post("/jobs/search", json=band)
+    assert response.status_code == 422
+
+def test_orm_updates_keep_the_band_unless_the_salary_changes(db):
+    # Weekly pay: the import annualizes it with the parsed period
+    bulk_upsert_jobs(db, [{"title": "Contract", "description": "Desc", "company": "Acme", "location": "Perth",
+                           "url": "https://example.com/jobs/weekly", "salary": "$1,500 - $1,800 per week"}])
+    job = db.query(Job).one()
+    assert (job.salary_min_aud, job.salary_max_aud) == (1500 * 52, 1800 * 52)
+
+    job.title = "Contract (enriched)"
+    job.work_mode = "remote"
+    db.commit()
+    db.expire_all()
+    assert (job.salary_min_aud, job.salary_max_aud) == (1500 * 52, 1800 * 52)
+
+    job.salary_min, job.salary_max, job.salary_period = 120000, 140000, "year"
+    db.commit()
+    db.expire_all()
+    assert (job.salary_min_aud, job.salary_max_aud) == (120000, 140000)
+
+def test_job_update_only_accepts_known_salary_periods(db):
+    db.add(Job(title="Contract", description="Desc", company="Acme", location="Perth", category="other",
+               url="https://example.com/jobs/contract", salary_min=1500))
+    db.commit()
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/jobs")
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+    job_id = db.query(Job.id).scalar()
+
+    assert client.put(f"/jobs/{job_id}", json={"salary_period": "fortnight"}).status_code == 422
+    assert client.put(f"/jobs/{job_id}", json={"salary_period": "week"}).status_code == 200
+    db.expire_all()
+    job = db.get(Job, job_id)
+    assert (job.salary_period, job.salary_min_aud) == ("week", 1500 * 52)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("salary, band", [
+    ("$1,500 per week", (1500 * 52, None)),
+    ("$8,000 per month", (8000 * 12, None)),
+    ("$45 - $55 per hour", (45 * HOURS_PER_YEAR, 55 * HOURS_PER_YEAR)),
+])
+async def test_extension_import_keeps_the_listed_salary_period(async_db, monkeypatch, salary, band):
+    async def no_enrichment(job_id, processed_description):
+        pass
+    monkeypatch.setattr(jobs, "ai_enrich_job_background", no_enrichment)
+    data = jobs.JobApplicationImport(
+        job={"title": "Contract", "company": "Acme", "location": "Perth WA", "description": "Build APIs",
+             "url": "https://example.com/jobs/contract", "salary": salary},
+        application={"status": "applied"},
+    )
+
+    job_id = (await jobs.import_job_from_extension(data, db=async_db)).job_id
+    job = await async_db.get(Job, job_id)
+    assert (job.salary_min_aud, job.salary_max_aud) == band
@@ -0,0 +1,37 @@
+import json
+import pytest
+from app.core.tech_taxonomy import canonical_tech, extract_tech_stack, load_taxonomy, normalize_tech_stack
+from app.db.models import Job
+from app.services.job_service import bulk_upsert_jobs
+
+def test_aliases_map_to_canonical_names():
+    text = "Deploying to K8s on GCP. Postgres, Node.js and ReactJS; Golang a plus. CI/CD with GitHub Actions."
+    assert set(extract_tech_stack(text)) == {
+        "kubernetes", "gcp", "postgresql", "node.js", "react", "golang", "ci/cd", "github actions", "git",
+    }
+
+def test_most_mentioned_first():
+    assert extract_tech_stack("AWS and Python. Python, python scripts and more AWS. Docker.") == ["python", "aws", "docker"]
+
+def test_no_matches_inside_unrelated_words():
+    text = "Our R&D team will help you grow a strong net promoter score. We go the extra mile for customers."
+    assert extract_tech_stack(text) == []
+    assert extract_tech_stack("Experience with .NET Core and C#") == [".net", "c#"]
+
+def test_normalize_merges_spellings():
+    assert canonical_tech("Postgres") == "postgresql"
+    assert canonical_tech("Cobol") is None
+    assert normalize_tech_stack(["K8s", "kubernetes", "Postgres", "Cobol", " ", "cobol"]) == ["kubernetes", "postgresql", "cobol"]
+
+def test_alias_listed_for_two_skills_is_rejected(tmp_path):
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps({"skills": [{"name": "go", "aliases": ["golang"]}, {"name": "golang"}]}))
+    with pytest.raises(ValueError, match="golang"):
+        load_taxonomy(path)
+
+def test_import_fills_tech_stack(db):
+    bulk_upsert_jobs(db, [{
+        "title": "Platform Engineer", "company": "Acme", "location": "Sydney NSW", "url": "https://example.com/jobs/platform",
+        "description": "Requirements\n- Terraform and k8s\n- Postgres\n- Terraform modules",
+    }])
+    assert db.query(Job).one().tech_stack == ["terraform", "kubernetes", "postgresql"]
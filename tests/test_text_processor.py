@@ -0,0 +1,96 @@
+from pathlib import Path
+import json
+import random
+import re
+import sys
+import pytest
+from app.core.keyword_matcher import KeywordMatch, KeywordMatcher
+from app.core.text_processor import clean_job_description, extract_job_sections, extract_keywords, parse_posted_date, parse_salary
+
+def test_keywords_match_whole_words_only():
+    keywords = extract_keywords("Maintain our JavaScript apps. Interest in leadership a plus.")
+    assert "javascript" in keywords
+    assert not {"ai", "java", "rest", "lead"} & set(keywords)
+
+def test_multi_word_and_overlapping_keywords():
+    keywords = extract_keywords("Power BI dashboards and machine-learning models, full time role")
+    assert {"power bi", "bi", "machine learning", "full-time"} <= set(keywords)
+    assert "machine learning" not in extract_keywords("Machine, learning")
+
+def test_matcher_reports_positions_and_counts():
+    matcher = KeywordMatcher({"k8s": "kubernetes", "kubernetes": "kubernetes", "c++": "c++", "go": "go"})
+    text = "K8s and Kubernetes, C++ or Go (go!)"
+    assert list(matcher.finditer("Use K8s")) == [KeywordMatch("kubernetes", 4, 7)]
+    assert matcher.counts(text) == {"kubernetes": 2, "c++": 1, "go": 2}
+
+def test_matcher_failure_links_find_suffix_keywords():
+    matcher = KeywordMatcher(["data warehouse engineer", "warehouse", "engineer"])
+    assert [match.keyword for match in matcher.finditer("data warehouse lead engineer")] == ["warehouse", "engineer"]
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_descriptions"
+
+@pytest.mark.parametrize("path", sorted(FIXTURES.glob("*.txt")), ids=lambda path: path.stem)
+def test_sections_match_golden_output(path):
+    expected = json.loads(path.with_suffix(".sections.json").read_text())
+    assert extract_job_sections(clean_job_description(path.read_text())) == expected
+
+def test_sections_keep_content_lines_that_mention_header_words():
+    sections = extract_job_sections("About the role\nThe role suits someone from a product company.\nBenefits\nFree lunch")
+    assert sections["responsibilities"] == "The role suits someone from a product company."
+    assert sections["benefits"] == "Free lunch"
+
+def test_inline_header_must_be_only_a_header_phrase():
+    sections = extract_job_sections("Key skills: Python\nExperience with AWS: 3 years")
+    assert sections["requirements"] == "Python\nExperience with AWS: 3 years"
+
+def legacy_clean_job_description(description):
+    """clean_job_description before the single-pass rewrite, kept as the reference output."""
+    if not description:
+        return ""
+    text = description.replace('\r\n', '\n').replace('\r', '\n')
+    cleaned_lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if line:
+            cleaned_lines.append(re.sub(r'\s+', ' ', line))
+    cleaned_text = '\n'.join(cleaned_lines)
+    cleaned_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_text)
+    return cleaned_text.strip()
+
+def test_cleaner_matches_legacy_output_on_fixtures():
+    for path in FIXTURES.glob("*.txt"):
+        text = path.read_text()
+        for variant in (text, text.replace("\n", "\r\n"), text.replace("\n", "\r"), f"  \n\n{text}\n\t \n"):
+            assert clean_job_description(variant) == legacy_clean_job_description(variant)
+
+def test_cleaner_matches_legacy_output_on_random_whitespace():
+    whitespace = [chr(code) for code in range(sys.maxunicode + 1) if chr(code).isspace()]
+    alphabet = whitespace + list("ab.-•é\u200b\ufeff") + ["\r\n"] * 3
+    rng = random.Random(22)
+    for _ in range(20000):
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 40)))
+        assert clean_job_description(text) == legacy_clean_job_description(text), repr(text)
+
+@pytest.mark.parametrize("label, expected", [
+    ("$80,000 - $120,000", (80000, 120000, None)),
+    ("$120k–$140k + super", (120000, 140000, None)),
+    ("120-140k", (120000, 140000, None)),
+    ("$100k + 11.5% super", (100000, None, None)),
+    ("$45 - $55 per hour", (45, 55, "hour")),
+    ("$900 - $1,100 p.d.", (900, 1100, "day")),
+    ("$1,500 per week", (1500, None, "week")),
+    ("$95,000 p.a. + super", (95000, None, "year")),
+    ("Competitive package", (None, None, None)),
+])
+def test_parse_salary(label, expected):
+    parsed = parse_salary(label)
+    assert (parsed["salary_min"], parsed["salary_max"], parsed["salary_period"]) == expected
+
+def test_parse_posted_date_reads_ambiguous_dates_day_first():
+    assert parse_posted_date("03/04/2024") == "2024-04-03T00:00:00"
+    # An unambiguous month-first date doesn't change how later ones are read
+    assert parse_posted_date("01/15/2024") == "2024-01-15T00:00:00"
+    assert parse_posted_date("03/04/2024") == "2024-04-03T00:00:00"
+    assert parse_posted_date("05/06/2024") == "2024-06-05T00:00:00"
+    assert parse_posted_date("Jan 15, 2024") == "2024-01-15T00:00:00"
+    assert parse_posted_date("last week") is None
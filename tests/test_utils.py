@@ -0,0 +1,26 @@
+from app.core.utils import canonicalize_url, url_hash
+
+def test_canonicalize_seek_strips_tracking():
+    assert canonicalize_url("https://www.seek.com.au/job/81234567?type=standout&ref=search#sol=abc") == "https://seek.com.au/job/81234567"
+    assert canonicalize_url("https://www.seek.com.au/data-engineer-jobs?jobId=81234567&type=standard") == "https://seek.com.au/job/81234567"
+
+def test_canonicalize_linkedin_job_id():
+    expected = "https://linkedin.com/jobs/view/3912345678"
+    assert canonicalize_url("https://www.linkedin.com/jobs/view/senior-data-engineer-at-acme-3912345678/?trk=public") == expected
+    assert canonicalize_url("https://au.linkedin.com/jobs/search/?currentJobId=3912345678&keywords=data") == expected
+
+def test_canonicalize_jora_drops_query():
+    assert canonicalize_url("https://au.jora.com/job/Data-Engineer-3f2a9c?sp=serp&tk=xyz") == "https://au.jora.com/job/Data-Engineer-3f2a9c"
+
+def test_canonicalize_generic_url():
+    assert canonicalize_url("Careers.Example.com/jobs/123/?utm_source=x&b=2&a=1") == "https://careers.example.com/jobs/123?a=1&b=2"
+
+def test_canonicalize_drops_invalid_ports():
+    assert canonicalize_url("https://seek.com.au:99999/job/1") == "https://seek.com.au/job/1"
+    assert canonicalize_url("https://careers.example.com:abc/jobs/1") == "https://careers.example.com/jobs/1"
+    assert canonicalize_url("https://careers.example.com:8080/jobs/1") == "https://careers.example.com:8080/jobs/1"
+
+def test_url_hash_is_fixed_width_and_stable():
+    digest = url_hash("https://www.seek.com.au/job/81234567?type=standout")
+    assert len(digest) == 64
+    assert digest == url_hash("http://seek.com.au/job/81234567/")